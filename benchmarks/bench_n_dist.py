@@ -0,0 +1,46 @@
+"""
+Benchmark of the `n_dist` grouping method:
+the previous list-based version vs. the vectorized version.
+
+Run with:
+    python benchmarks/bench_n_dist.py
+"""
+
+import timeit
+from random import shuffle
+
+import numpy as np
+
+from utipy.groups.methods.n_dist import _n_dist
+
+
+def _n_dist_lists(v, n, randomize=False):
+    """The previous list-based implementation."""
+    len_v = float(len(v))
+    divisor = len_v / n
+    v_divided = [vi / divisor for vi in range(int(len_v) + 1)][1:]
+    v_ceiled = np.ceil(np.around(v_divided, 5)).astype(int)
+    if randomize:
+        shuffle(v_ceiled)
+    return v_ceiled
+
+
+def main(n_rows: int = 1_000_000, n: int = 5, number: int = 3):
+    v = range(n_rows)
+
+    # Same group sizes
+    assert np.array_equal(
+        np.bincount(_n_dist_lists(v, n)), np.bincount(_n_dist(v, n))
+    )
+
+    print(f"v: {n_rows} rows, n={n}")
+    for name, fn in [
+        ("lists + random.shuffle", lambda: _n_dist_lists(v, n, randomize=True)),
+        ("vectorized + permutation", lambda: _n_dist(v, n, randomize=True, rng=1)),
+    ]:
+        seconds = min(timeit.repeat(fn, number=1, repeat=number))
+        print(f"  {name:<26} {seconds:9.4f} s")
+
+
+if __name__ == "__main__":
+    main()
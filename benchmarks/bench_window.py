@@ -0,0 +1,47 @@
+"""
+Benchmark of `utipy.window()`: list of windows vs. strided view.
+
+Run with:
+    python benchmarks/bench_window.py [n_samples]
+
+The number of samples defaults to 10M. Note that stacking the
+list of windows needs `n_samples * 100 * 8` bytes (8 GB for 10M).
+"""
+
+import sys
+import timeit
+import tracemalloc
+
+import numpy as np
+
+from utipy.array.window import window
+
+
+def _peak_memory_mb(fn):
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / 1024**2
+
+
+def main(n: int = 10_000_000, size: int = 100, number: int = 3):
+    x = np.random.default_rng(1).standard_normal(n)
+
+    def list_path():
+        windows, _ = window(x, size=size, gap=1)
+        # What downstream code does to get a 2D array
+        return np.stack(windows)
+
+    def view_path():
+        windows, _ = window(x, size=size, gap=1, as_view=True)
+        return windows
+
+    print(f"x: {n} samples, size={size}, gap=1")
+    for name, fn in [("list + np.stack", list_path), ("as_view=True", view_path)]:
+        seconds = min(timeit.repeat(fn, number=1, repeat=number))
+        print(f"  {name:<16} {seconds:9.4f} s  peak {_peak_memory_mb(fn):10.1f} MB")
+
+
+if __name__ == "__main__":
+    main(n=int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000)
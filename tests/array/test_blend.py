@@ -3,6 +3,7 @@
 import utipy as ut
 import numpy as np
 import pandas as pd
+import pytest
 
 
 def test_blend_list():
@@ -45,3 +46,86 @@ def test_blend_Series():
     assert (blended0 == x1).all()
     assert (blended1 == x2).all()
     assert (blended05 == pd.Series([1.5, 2.5, 3.5, 4.5, 5.5, 6.5])).all()
+
+
+def test_blend_out_and_dtype():
+
+    x1 = np.asarray([1., 2., 3., 4., 5., 6.])
+    x2 = np.asarray([2., 3., 4., 5., 6., 7.])
+    expected = np.asarray([1.25, 2.25, 3.25, 4.25, 5.25, 6.25])
+
+    blended = ut.blend(x1, x2, amount=.25, dtype=np.float32)
+    assert blended.dtype == np.float32
+    assert (blended == expected).all()
+
+    out = np.empty(6)
+    blended = ut.blend(x1, x2, amount=.25, out=out)
+    assert blended is out
+    assert (out == expected).all()
+
+    # In-place in either input
+    y1 = x1.copy()
+    ut.blend(y1, x2, amount=.25, out=y1)
+    assert (y1 == expected).all()
+
+    y2 = x2.copy()
+    ut.blend(x1, y2, amount=.25, out=y2)
+    assert (y2 == expected).all()
+
+    # Keeps Series index
+    s1 = pd.Series(x1, index=list("abcdef"), name="s")
+    blended = ut.blend(s1, x2, amount=.25)
+    assert blended.index.tolist() == list("abcdef")
+    assert blended.name == "s"
+
+
+def test_blend_many():
+
+    x1 = [1, 2, 3]
+    x2 = [4, 5, 6]
+    x3 = [7, 8, 9]
+
+    assert ut.blend_many([x1, x2, x3], weights=[.5, .25, .25]) == [3.25, 4.25, 5.25]
+    assert ut.blend_many([x1, x2], weights=[.5, .5]) == ut.blend(x1, x2, amount=.5)
+
+    arrays = [np.random.default_rng(i).standard_normal((300, 500))
+              for i in range(4)]
+    weights = [.1, .2, .3, .4]
+    blended = ut.blend_many(arrays, weights=weights, dtype=np.float32)
+    assert blended.dtype == np.float32
+    assert np.allclose(blended, sum(a * w for a, w in zip(arrays, weights)),
+                       atol=1e-5)
+
+    with pytest.raises(ValueError):
+        ut.blend_many([x1, x2], weights=[1.])
+    with pytest.raises(ValueError):
+        ut.blend_many(arrays, weights=weights, out=arrays[0])
+
+
+def test_blend_exact_ends_and_infinite_values():
+
+    rng = np.random.default_rng(1)
+    x1 = rng.standard_normal(1000)
+    x2 = rng.standard_normal(1000)
+
+    # The ends are exact
+    assert (ut.blend(x1, x2, amount=1.0) == x2).all()
+    assert (ut.blend(x1, x2, amount=0.0) == x1).all()
+
+    # Infinite values are kept
+    assert ut.blend([np.inf], [1.], amount=0.0) == [np.inf]
+    assert ut.blend([np.inf], [1.], amount=0.3) == [np.inf]
+    assert ut.blend([1.], [-np.inf], amount=0.7) == [-np.inf]
+    assert ut.blend([1.], [np.inf], amount=0.0) == [1.]
+    with np.errstate(invalid="ignore"):
+        assert np.isnan(ut.blend([np.inf], [-np.inf], amount=0.5)[0])
+
+    # Same result with `out` as either input
+    for amount in [0.0, 0.3, 0.5, 0.8, 1.0]:
+        expected = ut.blend(x1, x2, amount=amount)
+        y1 = x1.copy()
+        ut.blend(y1, x2, amount=amount, out=y1)
+        y2 = x2.copy()
+        ut.blend(x1, y2, amount=amount, out=y2)
+        assert np.array_equal(y1, expected)
+        assert np.array_equal(y2, expected)
@@ -0,0 +1,50 @@
+# Testing array.iter_windows
+
+import utipy as ut
+import numpy as np
+import pandas as pd
+import pytest
+
+
+def test_iter_windows_matches_window():
+
+    x1 = np.arange(1, 14)
+    chunkings = [
+        [x1],
+        [x1[:1], x1[1:5], x1[5:6], x1[6:]],
+        [x1[:0], x1[:7], x1[7:7], x1[7:]],
+        [[v] for v in x1],
+    ]
+
+    settings = [
+        dict(size=2, gap=1, sample_rate=1, rolling=True),
+        dict(size=4, gap=3, sample_rate=1, rolling=True),
+        dict(size=2, gap=1, sample_rate=2, rolling=True),
+        dict(size=3, gap=0, sample_rate=1, rolling=False),
+        dict(size=2, gap=5, sample_rate=1, rolling=False),
+    ]
+
+    for setting in settings:
+        w, nw = ut.window(x1, **setting)
+        for chunks in chunkings:
+            iw = list(ut.iter_windows(chunks, **setting))
+            assert len(iw) == nw
+            assert np.array_equal(iw, w)
+
+
+def test_iter_windows_types_and_shorts():
+
+    chunks = [[1, 2], pd.Series([3, 4]), np.array([5])]
+
+    iw = list(ut.iter_windows(chunks, size=2, gap=2, rolling=True))
+    assert np.array_equal(iw, [[1, 2], [3, 4]])
+
+    assert list(ut.iter_windows(chunks, size=6)) == []
+
+    iw = list(ut.iter_windows(chunks, size=6, discard_shorts=False))
+    assert len(iw) == 1
+    assert np.array_equal(iw[0], [1, 2, 3, 4, 5])
+
+    # Arguments are checked on call
+    with pytest.raises(ValueError):
+        ut.iter_windows(chunks, size=0)
@@ -1,5 +1,6 @@
 
 import numpy as np
+import pandas as pd
 
 from utipy.array.nan_stats import nan_stats, print_nan_stats
 
@@ -16,3 +17,47 @@ def test_nan_stats(capfd):
     print_nan_stats(x=arr, message="NaN statistics for 'arr'", indent=6)
     out, err = capfd.readouterr()
     assert out == "      NaN statistics for 'arr': 3 (50.0%)\n"
+
+
+def test_nan_stats_axis_and_chunks(capfd):
+
+    arr = np.array([
+        [1, 2, np.nan],
+        [1, np.nan, np.nan],
+    ])
+
+    num_nans, perc = nan_stats(x=arr, axis=0)
+    assert num_nans.tolist() == [0, 1, 2]
+    assert perc.tolist() == [0.0, 50.0, 100.0]
+
+    num_nans, perc = nan_stats(x=arr, axis=1, chunk_size=1)
+    assert num_nans.tolist() == [1, 2]
+    assert perc.tolist() == [33.33, 66.67]
+
+    assert nan_stats(x=arr, chunk_size=1) == (3, 50.0)
+    assert nan_stats(x=np.arange(4)) == (0, 0.0)
+
+
+def test_nan_stats_data_frame(capfd):
+
+    df = pd.DataFrame({
+        "f": [1., np.nan, 3., 4.],
+        "i": [1, 2, 3, 4],
+        "b": [True, False, True, True],
+        "o": ["a", None, np.nan, "d"],
+        "n": pd.array([1, None, 3, 4], dtype="Int64"),
+    })
+
+    assert nan_stats(x=df) == (4, 20.0)
+
+    num_nans, perc = nan_stats(x=df, axis=0)
+    assert num_nans.to_dict() == {"f": 1, "i": 0, "b": 0, "o": 2, "n": 1}
+    assert perc.to_dict() == {"f": 25.0, "i": 0.0, "b": 0.0, "o": 50.0, "n": 25.0}
+
+    num_nans, perc = nan_stats(x=df, axis=1)
+    assert num_nans.tolist() == [0, 3, 1, 0]
+    assert perc.tolist() == [0.0, 60.0, 20.0, 0.0]
+
+    print_nan_stats(x=df[["f", "o"]], message="NaNs per column", indent=2, axis=0)
+    out, err = capfd.readouterr()
+    assert out == "  NaNs per column:\n    f: 1 (25.0%)\n    o: 2 (50.0%)\n"
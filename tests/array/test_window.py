@@ -2,6 +2,7 @@
 
 import utipy as ut
 import numpy as np
+import pytest
 
 
 def test_window_list_not_rolling():
@@ -267,3 +268,93 @@ def test_window_sample_rate():
     assert np.array_equal(w2, w2_)
     assert nw1 == 5
     assert nw2 == 2
+
+
+def test_window_as_view():
+
+    x1 = np.arange(1, 13)
+
+    settings = [
+        dict(size=2, gap=1, sample_rate=1, rolling=True),
+        dict(size=4, gap=3, sample_rate=1, rolling=True),
+        dict(size=2, gap=1, sample_rate=2, rolling=True),
+        dict(size=3, gap=0, sample_rate=1, rolling=False),
+        dict(size=2, gap=1, sample_rate=2, rolling=False),
+        dict(size=4, gap=3, sample_rate=1, rolling=False),
+    ]
+
+    for setting in settings:
+        for reverse_direction in [False, True]:
+            w, nw = ut.window(x1, reverse_direction=reverse_direction, **setting)
+            v, nv = ut.window(x1, reverse_direction=reverse_direction,
+                              as_view=True, **setting)
+
+            assert nv == nw
+            assert v.shape == (nw, setting["size"] * setting["sample_rate"])
+            assert np.array_equal(v, np.stack(w))
+
+            # Shares memory with x1 and cannot be modified
+            assert np.shares_memory(v, x1)
+            assert not v.flags.writeable
+
+    v, nv = ut.window(x1, size=2, gap=1, sample_rate=1,
+                      rolling=False, reverse_direction=True, as_view=True)
+    assert np.array_equal(v, [[11, 12], [8, 9], [5, 6], [2, 3]])
+    assert nv == 4
+
+    # Too short
+    v, nv = ut.window(x1, size=13, as_view=True, discard_shorts=True)
+    assert v.shape == (0, 13)
+    assert nv == 0
+
+    v, nv = ut.window(x1, size=13, as_view=True, discard_shorts=False)
+    assert np.array_equal(v, [x1])
+    assert nv == 0
+
+
+def test_window_axis():
+
+    # 12 samples, 3 channels
+    x1 = np.arange(36).reshape(12, 3)
+
+    for rolling, gap in [(True, 2), (False, 1)]:
+        for reverse_direction in [False, True]:
+            w, nw = ut.window(x1, size=4, gap=gap, rolling=rolling,
+                              reverse_direction=reverse_direction)
+            v, nv = ut.window(x1, size=4, gap=gap, rolling=rolling,
+                              reverse_direction=reverse_direction,
+                              as_view=True)
+
+            # Channel-wise windows
+            channel_windows = [
+                ut.window(x1[:, c], size=4, gap=gap, rolling=rolling,
+                          reverse_direction=reverse_direction)[0]
+                for c in range(3)
+            ]
+            expected = np.stack([np.stack(cw) for cw in channel_windows], axis=-1)
+
+            assert nw == nv == len(expected)
+            assert v.shape == (nw, 4, 3)
+            assert np.array_equal(np.stack(w), expected)
+            assert np.array_equal(v, expected)
+            assert np.shares_memory(v, x1)
+
+            # Windowing along the last axis of the transposed array
+            wt, nwt = ut.window(x1.T, size=4, gap=gap, rolling=rolling,
+                                reverse_direction=reverse_direction, axis=-1)
+            vt, nvt = ut.window(x1.T, size=4, gap=gap, rolling=rolling,
+                                reverse_direction=reverse_direction,
+                                as_view=True, axis=1)
+
+            assert nwt == nvt == nw
+            assert vt.shape == (nw, 3, 4)
+            assert np.array_equal(np.stack(wt), expected.transpose(0, 2, 1))
+            assert np.array_equal(vt, expected.transpose(0, 2, 1))
+
+    # Too short
+    v, nv = ut.window(x1.T, size=13, axis=1, as_view=True)
+    assert v.shape == (0, 3, 13)
+    assert nv == 0
+
+    with pytest.raises(ValueError):
+        ut.window(x1, axis=2)
@@ -0,0 +1,49 @@
+# Testing array.window_batches
+
+import utipy as ut
+import numpy as np
+import pytest
+
+
+def test_window_batches_npy(tmp_path):
+
+    x1 = np.arange(1, 14, dtype=np.float32)
+    path = tmp_path / "x.npy"
+    np.save(path, x1)
+
+    settings = [
+        dict(size=2, gap=1, sample_rate=1, rolling=True),
+        dict(size=2, gap=1, sample_rate=2, rolling=True),
+        dict(size=3, gap=0, sample_rate=1, rolling=False),
+        dict(size=2, gap=1, sample_rate=1, rolling=False),
+    ]
+
+    for setting in settings:
+        for reverse_direction in [False, True]:
+            w, nw = ut.window(x1, reverse_direction=reverse_direction, **setting)
+            for source in [path, str(path), np.load(path, mmap_mode="r")]:
+                batches = list(ut.window_batches(
+                    source, reverse_direction=reverse_direction,
+                    batch_size=3, **setting))
+
+                assert all(len(batch) <= 3 for batch in batches)
+                assert len(batches) == -(-nw // 3)
+                assert np.array_equal(np.concatenate(batches), w)
+                assert all(not isinstance(batch, np.memmap) for batch in batches)
+                assert all(batch.flags.writeable for batch in batches)
+
+
+def test_window_batches_shorts_and_args():
+
+    x1 = np.arange(5)
+
+    assert list(ut.window_batches(x1, size=6)) == []
+
+    batches = list(ut.window_batches(x1, size=6, discard_shorts=False))
+    assert len(batches) == 1
+    assert np.array_equal(batches[0], [x1])
+
+    with pytest.raises(ValueError):
+        ut.window_batches(x1, batch_size=0)
+    with pytest.raises(TypeError):
+        ut.window_batches([1, 2, 3])
@@ -0,0 +1,53 @@
+# Testing array.window_indices
+
+import utipy as ut
+import numpy as np
+import pandas as pd
+import pytest
+
+
+def test_window_indices_matches_window():
+
+    x1 = np.arange(1, 14)
+    df = pd.DataFrame({"a": x1, "b": x1 * 2})
+
+    settings = [
+        dict(size=2, gap=1, sample_rate=1, rolling=True),
+        dict(size=4, gap=3, sample_rate=1, rolling=True),
+        dict(size=2, gap=1, sample_rate=2, rolling=True),
+        dict(size=3, gap=0, sample_rate=1, rolling=False),
+        dict(size=2, gap=1, sample_rate=2, rolling=False),
+    ]
+
+    for setting in settings:
+        for reverse_direction in [False, True]:
+            w, nw = ut.window(x1, reverse_direction=reverse_direction, **setting)
+            for x in [x1, list(x1), df, len(x1)]:
+                starts, stops = ut.window_indices(
+                    x, reverse_direction=reverse_direction, **setting)
+
+                assert starts.dtype == stops.dtype == np.int64
+                assert len(starts) == len(stops) == nw
+                assert all(
+                    np.array_equal(x1[start:stop], window)
+                    for start, stop, window in zip(starts, stops, w)
+                )
+                assert all(
+                    np.array_equal(df.iloc[start:stop]["a"], window)
+                    for start, stop, window in zip(starts, stops, w)
+                )
+
+
+def test_window_indices_shorts_and_args():
+
+    starts, stops = ut.window_indices(5, size=6)
+    assert len(starts) == len(stops) == 0
+
+    starts, stops = ut.window_indices(5, size=6, discard_shorts=False)
+    assert starts.tolist() == [0]
+    assert stops.tolist() == [5]
+
+    with pytest.raises(TypeError):
+        ut.window_indices("abc")
+    with pytest.raises(ValueError):
+        ut.window_indices(-1)
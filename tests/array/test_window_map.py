@@ -0,0 +1,39 @@
+# Testing array.window_map
+
+import utipy as ut
+import numpy as np
+import pytest
+
+
+def test_window_map():
+
+    x1 = np.random.default_rng(1).standard_normal(101)
+
+    for reverse_direction in [False, True]:
+        w, _ = ut.window(x1, size=7, gap=3, reverse_direction=reverse_direction)
+        expected = [np.std(window) for window in w]
+
+        serial = ut.window_map(x1, np.std, size=7, gap=3,
+                               reverse_direction=reverse_direction)
+        assert serial == expected
+
+        for backend in ["thread", "process"]:
+            parallel = ut.window_map(x1, np.std, size=7, gap=3,
+                                     reverse_direction=reverse_direction,
+                                     workers=2, backend=backend, batch_size=4)
+            assert parallel == expected
+
+
+def test_window_map_shorts_and_args():
+
+    x1 = [1, 2, 3]
+
+    assert ut.window_map(x1, np.sum, size=4) == []
+    assert ut.window_map(x1, np.sum, size=4, discard_shorts=False) == [6]
+
+    with pytest.raises(ValueError):
+        ut.window_map(x1, np.sum, workers=0)
+    with pytest.raises(ValueError):
+        ut.window_map(x1, np.sum, backend="gpu")
+    with pytest.raises(TypeError):
+        ut.window_map(x1, "sum")
@@ -0,0 +1,110 @@
+# Testing array.window_reduce
+
+import utipy as ut
+import numpy as np
+import pytest
+
+
+STAT_FNS = {
+    "sum": np.sum,
+    "mean": np.mean,
+    "var": np.var,
+    "std": np.std,
+    "min": np.min,
+    "max": np.max,
+}
+
+
+def _expected(x, stat, **kwargs):
+    windows, _ = ut.window(x, **kwargs)
+    return np.asarray([STAT_FNS[stat](w, axis=0) for w in windows])
+
+
+def test_window_reduce_matches_window():
+
+    x1 = np.random.default_rng(1).standard_normal(23)
+    x1[[5, 15]] = [np.nan, np.inf]
+
+    settings = [
+        dict(size=2, gap=1, sample_rate=1, rolling=True),
+        dict(size=4, gap=3, sample_rate=1, rolling=True),
+        dict(size=2, gap=1, sample_rate=2, rolling=True),
+        dict(size=3, gap=0, sample_rate=1, rolling=False),
+        dict(size=2, gap=1, sample_rate=2, rolling=False),
+    ]
+
+    for x in [x1, np.arange(23), x1.reshape(-1, 1).repeat(2, axis=1)]:
+        for setting in settings:
+            for reverse_direction in [False, True]:
+                for stat in STAT_FNS.keys():
+                    with np.errstate(invalid="ignore"):
+                        expected = _expected(
+                            x, stat, reverse_direction=reverse_direction, **setting)
+                    reduced = ut.window_reduce(
+                        x, stat=stat, reverse_direction=reverse_direction, **setting)
+
+                    assert reduced.shape == expected.shape
+                    assert np.allclose(reduced, expected, equal_nan=True)
+
+
+def test_window_reduce_simple():
+
+    x1 = [1, 2, 3, 4, 5, 6]
+
+    assert np.array_equal(ut.window_reduce(x1, size=2, gap=2), [1.5, 3.5, 5.5])
+    assert np.array_equal(ut.window_reduce(x1, size=3, stat="sum"), [6, 9, 12, 15])
+    assert np.array_equal(
+        ut.window_reduce(x1, size=2, gap=1, stat="max", rolling=False,
+                         reverse_direction=True),
+        [6, 3]
+    )
+    assert np.allclose(ut.window_reduce([2, 2, 2, 4], size=3, stat="std"),
+                       [0, np.std([2, 2, 4])])
+
+    # Windowing along the second axis
+    x2 = np.asarray([x1, x1[::-1]])
+    assert np.array_equal(
+        ut.window_reduce(x2, size=3, gap=3, stat="min", axis=1),
+        [[1, 4], [4, 1]]
+    )
+
+    # Too short
+    assert ut.window_reduce(x1, size=7).shape == (0,)
+    assert np.array_equal(
+        ut.window_reduce(x1, size=7, stat="sum", discard_shorts=False), [21])
+
+    with pytest.raises(ValueError):
+        ut.window_reduce(x1, stat="median")
+
+
+def test_window_reduce_precision():
+
+    # A large-amplitude segment followed by a low-variance segment
+    rng = np.random.default_rng(3)
+    x = np.concatenate([
+        rng.normal(0, 1000, 100000),
+        5 + 1e-3 * rng.standard_normal(1000)
+    ])
+    tail_windows, _ = ut.window(x[-1000:], size=100, gap=1)
+    expected = np.var(tail_windows, axis=1)
+    reduced = ut.window_reduce(x, size=100, gap=1, stat="var")[-len(expected):]
+    assert np.all(reduced > 0)
+    assert np.allclose(reduced, expected, rtol=1e-6, atol=0)
+
+    # Errors do not grow with the position in a large offset series
+    y = 1e8 + rng.standard_normal(200000)
+    windows, _ = ut.window(y[-1000:], size=50, gap=10)
+    assert np.allclose(
+        ut.window_reduce(y, size=50, gap=10, stat="mean")[-len(windows):],
+        np.mean(windows, axis=1), rtol=0, atol=1e-6
+    )
+
+    # Constant windows have a variance of exactly 0
+    x2 = np.asarray([
+        [2, 0], [-5, -4], [-9, -8], [-9, -6], [5, 2], [7, -4], [1, -4], [4, -4],
+        [0, -4], [7, -5], [5, 3], [-9, -2], [6, 0], [-9, 4], [4, 6], [-6, -8],
+        [6, -9], [0, -8], [-4, -1], [-2, -2], [-9, -9], [-7, -9], [3, 0]
+    ])
+    stds = ut.window_reduce(x2, size=3, gap=1, stat="std")
+    assert np.array_equal(stds == 0, _expected(x2, "std", size=3, gap=1) == 0)
+    assert np.array_equal(stds[5:7, 1], [0.0, 0.0])
@@ -3,6 +3,7 @@
 import utipy as ut
 import numpy as np
 import pandas as pd
+import pytest
 
 
 def test_windowed_reverse_list():
@@ -42,3 +43,37 @@ def test_windowed_reverse_Series():
     assert (rev1 == x).all()
     assert (rev2 == pd.Series([20, 1, 44, 23, 62, 5, 3])).all()
     assert (rev3 == pd.Series([23, 20, 1, 62, 5, 44, 3])).all()
+
+
+def test_windowed_reverse_out_and_axis():
+
+    x = np.asarray([1, 20, 23, 44, 5, 62, 3])
+
+    # In-place
+    y = x.copy()
+    rev = ut.windowed_reverse(y, wsize=3, out=y)
+    assert rev is y
+    assert (y == np.asarray([23, 20, 1, 62, 5, 44, 3])).all()
+
+    # Separate output array
+    out = np.zeros_like(x)
+    rev = ut.windowed_reverse(x, wsize=2, out=out)
+    assert rev is out
+    assert (out == np.asarray([20, 1, 44, 23, 62, 5, 3])).all()
+    assert (x == np.asarray([1, 20, 23, 44, 5, 62, 3])).all()
+
+    # Along an axis
+    x2 = np.stack([x, x * 10])
+    rev = ut.windowed_reverse(x2, wsize=3, axis=1)
+    assert (rev == np.stack([[23, 20, 1, 62, 5, 44, 3],
+                             [230, 200, 10, 620, 50, 440, 30]])).all()
+    assert (ut.windowed_reverse(x2.T, wsize=3) == rev.T).all()
+
+    y2 = x2.copy()
+    ut.windowed_reverse(y2, wsize=3, axis=-1, out=y2)
+    assert (y2 == rev).all()
+
+    with pytest.raises(ValueError):
+        ut.windowed_reverse(x, wsize=2, out=np.zeros(3))
+    with pytest.raises(ValueError):
+        ut.windowed_reverse(x, wsize=2, out=x[::-1])
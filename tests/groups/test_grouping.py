@@ -1,4 +1,10 @@
+import subprocess
+import sys
+import textwrap
+
+import numpy as np
 import pandas as pd
+import pytest
 
 import utipy as ut
 
@@ -40,3 +46,382 @@ def test_partition_default_first_column_runs_and_returns_expected_sizes():
         partition_values.extend(partition["x"].tolist())
 
     assert sorted(partition_values) == [10, 20, 30, 40]
+
+
+def test_n_dist_sizes_and_seed():
+
+    from utipy.groups.methods.n_dist import _n_dist
+
+    assert _n_dist(range(10), 3).tolist() == [1, 1, 1, 2, 2, 2, 3, 3, 3, 3]
+    assert _n_dist(range(7), 7).tolist() == [1, 2, 3, 4, 5, 6, 7]
+
+    shuffled = _n_dist(range(10), 3, randomize=True, rng=1)
+    assert sorted(shuffled.tolist()) == [1, 1, 1, 2, 2, 2, 3, 3, 3, 3]
+    assert (shuffled == _n_dist(range(10), 3, randomize=True, rng=1)).all()
+    assert (shuffled == _n_dist(range(10), 3, randomize=True,
+                                rng=np.random.default_rng(1))).all()
+
+
+def test_group_seed():
+
+    df = pd.DataFrame({"x": range(20)})
+
+    grouped_1 = ut.group(df, n=4, seed=3)
+    grouped_2 = ut.group(df, n=4, seed=3)
+    assert grouped_1["group"].tolist() == grouped_2["group"].tolist()
+    assert grouped_1["group"].value_counts().sort_index().to_dict() == {
+        1: 5, 2: 5, 3: 5, 4: 5}
+
+
+def test_l_sizes_sizes_dtype_and_seed():
+
+    from utipy.groups.methods.l_sizes import _l_sizes
+
+    assert _l_sizes(range(9), [0.5, 0.5]).tolist() == [0, 0, 0, 0, 1, 1, 1, 1, 1]
+    assert _l_sizes(range(10), 0.25).tolist() == [0, 0] + [1] * 8
+    assert _l_sizes(range(10), 0.25).dtype == np.int8
+    assert _l_sizes(range(300), [1 / 300] * 300).dtype == np.int16
+
+    shuffled = _l_sizes(range(10), 0.25, randomize=True, rng=1)
+    assert sorted(shuffled.tolist()) == [0, 0] + [1] * 8
+    assert (shuffled == _l_sizes(range(10), 0.25, randomize=True, rng=1)).all()
+
+    with pytest.raises(ValueError):
+        _l_sizes(range(10), [0.6, 0.6])
+    with pytest.raises(ValueError):
+        _l_sizes(range(10), 1.5)
+
+
+def test_partition_lazy_takes_rows_on_demand():
+
+    df = pd.DataFrame({
+        "id": np.repeat(np.arange(10), 2),
+        "c": np.repeat(["a", "b"], 10),
+        "x": range(20),
+    }, index=range(100, 120))
+
+    parts = ut.partition(df, p=0.4, id_col="id", cat_col="c", lazy=True, seed=3)
+
+    assert isinstance(parts, ut.LazyPartitions)
+    assert parts.data is df
+    assert len(parts) == 2
+    assert parts.sizes.tolist() == [8, 12]
+
+    # Indices are in row order and cover all rows once
+    indices = [parts.indices(i) for i in range(len(parts))]
+    assert all((np.diff(idx) > 0).all() for idx in indices)
+    assert sorted(np.concatenate(indices).tolist()) == list(range(20))
+
+    # IDs are kept together and the levels are balanced
+    first = parts[0]
+    assert first.index.tolist() == df.index[indices[0]].tolist()
+    assert first["c"].value_counts().tolist() == [4, 4]
+    assert not set(first["id"]) & set(parts[-1]["id"])
+
+    # Same partitions as the eager version
+    eager = ut.partition(df, p=0.4, id_col="id", cat_col="c", seed=3)
+    assert [part["x"].tolist() for part in eager] == \
+        [part["x"].tolist() for part in parts]
+
+    with pytest.raises(IndexError):
+        parts[2]
+
+
+def test_array_versions_match_data_frame_versions():
+
+    rng = np.random.default_rng(1)
+    ids = rng.integers(0, 30, size=200)
+    cats = rng.choice(np.array(["a", "b", None], dtype=object), size=200)
+    nums = rng.normal(size=200)
+    df = pd.DataFrame({"id": ids, "c": cats, "v": nums})
+    arrays = {"id": ids, "c": cats, "v": nums}
+
+    for kwargs in [{}, {"id_col": "id"}, {"cat_col": "c"}, {"id_col": "id", "cat_col": "c"}]:
+        np.testing.assert_array_equal(
+            ut.fold_array(arrays, n=4, seed=2, **kwargs),
+            ut.fold(df, n=4, seed=2, return_factor=True, **kwargs).to_numpy(),
+        )
+        np.testing.assert_array_equal(
+            ut.partition_array(arrays, p=[0.2, 0.3], seed=2, **kwargs),
+            ut.partition(df, p=[0.2, 0.3], seed=2, lazy=True, **kwargs).codes,
+        )
+    np.testing.assert_array_equal(
+        ut.fold_array(arrays, n=4, id_col="id", num_col="v", seed=2),
+        ut.fold(df, n=4, id_col="id", num_col="v", seed=2, return_factor=True).to_numpy(),
+    )
+    for method, n in [("n_dist", 3), ("l_sizes", 0.3)]:
+        np.testing.assert_array_equal(
+            ut.group_uniques_array(arrays, n, col="id", method=method, seed=5),
+            ut.group_uniques(df, n, col="id", method=method, seed=5)["group"].to_numpy(),
+        )
+        np.testing.assert_array_equal(
+            ut.group_array(ids, n, method=method, seed=5),
+            ut.group(df, n, method=method, seed=5)["group"].to_numpy(),
+        )
+
+    # 2D arrays are indexed by column
+    matrix = np.column_stack([ids, rng.integers(0, 2, size=200)])
+    np.testing.assert_array_equal(
+        ut.fold_array(matrix, n=4, id_col=0, cat_col=1, seed=3),
+        ut.fold_array({"i": ids, "c": matrix[:, 1]}, n=4, id_col="i", cat_col="c", seed=3),
+    )
+
+    with pytest.raises(KeyError):
+        ut.fold_array(arrays, n=4, id_col="missing")
+    with pytest.raises(ValueError):
+        ut.fold_array({"id": ids, "c": cats[:10]}, n=4, id_col="id")
+
+
+
+def test_array_versions_do_not_import_pandas():
+
+    # Run in a new process, so pandas is not already imported
+    script = textwrap.dedent("""
+        import sys
+        import numpy as np
+        import utipy as ut
+        from utipy.groups.fold_array import fold_array
+
+        ids = np.repeat(np.arange(10), 3)
+        cats = np.tile(np.array(["a", "b", None], dtype=object), 10)
+        data = {"id": ids, "c": cats, "v": np.arange(30.0)}
+        fold_array(data, n=3, id_col="id", cat_col="c", num_col="v", seed=1)
+        ut.partition_array(data, p=0.2, id_col="id", cat_col="c", seed=1)
+        ut.group_uniques_array(data, 3, col="c", seed=1)
+        ut.group_array(ids, 3, seed=1)
+        assert "pandas" not in sys.modules
+
+        # The other functions are still available
+        # and keep their names in the subpackage
+        import utipy.groups.fold_repeated
+        assert ut.groups.fold is ut.fold
+        assert callable(ut.drop)
+    """)
+    subprocess.run([sys.executable, "-c", script], check=True)
+
+
+def test_partition_seed():
+
+    df = pd.DataFrame({"x": range(20), "c": ["a", "b"] * 10})
+
+    partitions_1 = ut.partition(df, p=0.3, cat_col="c", seed=2)
+    partitions_2 = ut.partition(df, p=0.3, cat_col="c", seed=2)
+
+    assert [p["x"].tolist() for p in partitions_1] == \
+        [p["x"].tolist() for p in partitions_2]
+
+
+def test_fold_id_and_cat_col_keeps_order_ids_and_balance():
+
+    df = pd.DataFrame({
+        "id": [1, 1, 2, 2, 3, 3, 4, 4, 5, 6, 7, 8],
+        "c": ["a"] * 8 + ["b"] * 4,
+        "x": range(12),
+    }, index=range(100, 112))
+
+    folded = ut.fold(df, n=2, id_col="id", cat_col="c", seed=1)
+
+    assert folded.columns.tolist() == ["id", "c", "x", "group"]
+    assert folded.index.tolist() == df.index.tolist()
+    assert folded["x"].tolist() == list(range(12))
+
+    # IDs are kept in the same fold
+    assert (folded.groupby("id")["group"].nunique() == 1).all()
+
+    # Each level has 2 IDs per fold
+    ids_per_fold = folded.drop_duplicates("id").groupby(["c", "group"]).size()
+    assert ids_per_fold.tolist() == [2, 2, 2, 2]
+
+    # Reproducible
+    factor = ut.fold(df, n=2, id_col="id", cat_col="c", seed=1, return_factor=True)
+    assert factor.name == "group"
+    assert factor.tolist() == folded["group"].tolist()
+    assert factor.index.tolist() == df.index.tolist()
+
+
+def test_fold_cat_col_balances_rows():
+
+    df = pd.DataFrame({"c": ["a"] * 6 + ["b"] * 9})
+
+    folded = ut.fold(df, n=3, cat_col="c")
+
+    assert folded.groupby(["c", "group"]).size().tolist() == [2, 2, 2, 3, 3, 3]
+
+
+def test_fold_num_col_balances_values():
+
+    rng = np.random.default_rng(2)
+    df = pd.DataFrame({
+        "id": np.repeat(np.arange(40), 3),
+        "c": np.repeat(["a", "b"], 60),
+        "v": rng.normal(size=120) + np.repeat(np.arange(40), 3),
+    })
+
+    folded = ut.fold(df, n=4, id_col="id", cat_col="c", num_col="v", seed=3)
+
+    # IDs are kept in the same fold
+    assert (folded.groupby("id")["group"].nunique() == 1).all()
+
+    # Each level has 5 IDs per fold
+    ids_per_fold = folded.drop_duplicates("id").groupby(["c", "group"]).size()
+    assert ids_per_fold.tolist() == [5] * 8
+
+    # Serpentine order gives similar means within each level
+    fold_means = folded.groupby(["c", "group"])["v"].mean()
+    assert (fold_means.groupby(level="c").agg(np.ptp) < 2).all()
+
+    # Without IDs, each block of 4 sorted rows is spread over the folds
+    rows = pd.DataFrame({"v": np.arange(16.0)[::-1]})
+    factor = ut.fold(rows, n=4, num_col="v", seed=1, return_factor=True)
+    assert all(
+        sorted(factor[rows["v"].between(start, start + 3)]) == [1, 2, 3, 4]
+        for start in range(0, 16, 4)
+    )
+
+    # Same folds from the splitter and the repeated folds
+    factor = ut.fold(df, n=4, id_col="id", num_col="v", seed=5, return_factor=True)
+    splitter = ut.FoldSplitter(n=4, id_col="id", num_col="v", seed=5)
+    np.testing.assert_array_equal(splitter.get_folds(df), factor.to_numpy())
+    repeated = ut.fold_repeated(df, n=4, repeats=2, id_col="id", num_col="v", seed=5)
+    assert (pd.DataFrame(repeated).groupby(df["id"]).nunique() == 1).all().all()
+
+    with pytest.raises(TypeError):
+        ut.fold(df, n=4, num_col="c")
+
+
+def test_fold_hash_is_deterministic_per_id():
+
+    ids = np.arange(20000)
+    folds = ut.fold_hash(ids, n=5)
+
+    assert folds.dtype == np.int8
+    assert folds.min() == 1 and folds.max() == 5
+    assert (np.abs(np.bincount(folds)[1:] - 4000) < 300).all()
+
+    # Independent of the chunking
+    chunked = np.concatenate([ut.fold_hash(chunk, n=5) for chunk in np.array_split(ids, 7)])
+    np.testing.assert_array_equal(folds, chunked)
+
+    # Same fold for the same value in different dtypes
+    np.testing.assert_array_equal(
+        ut.fold_hash(pd.Series([3.0, np.nan, 7.0]), n=5)[[0, 2]], folds[[3, 7]]
+    )
+    np.testing.assert_array_equal(
+        ut.fold_hash(pd.Series([3, None, 7], dtype="Int64"), n=5)[[0, 2]], folds[[3, 7]]
+    )
+    strings = ["a", "b", "a", "c"]
+    np.testing.assert_array_equal(
+        ut.fold_hash(pd.Series(strings, dtype="category"), n=3),
+        ut.fold_hash(strings, n=3),
+    )
+    assert ut.fold_hash(strings, n=3)[0] == ut.fold_hash(strings, n=3)[2]
+
+    # Same folds for all integer dtypes
+    negatives = [-1, -7, 3, 5, 2**14]
+    for dtype in [np.int16, np.int32, np.uint64, np.float32]:
+        values = np.abs(negatives) if dtype == np.uint64 else negatives
+        np.testing.assert_array_equal(
+            ut.fold_hash(np.asarray(values, dtype=dtype), n=5),
+            ut.fold_hash(np.asarray(values, dtype=np.int64), n=5),
+        )
+
+    # Numbers in chunks with and without strings agree
+    mixed = ut.fold_hash(np.array([3, "a", None, 2.0, np.nan], dtype=object), n=5)
+    np.testing.assert_array_equal(
+        mixed[[0, 2, 3, 4]],
+        ut.fold_hash(np.array([3, None, 2.0, np.nan], dtype=object), n=5),
+    )
+    np.testing.assert_array_equal(
+        mixed[[0, 2, 3, 4]], ut.fold_hash([3.0, np.nan, 2.0, np.nan], n=5)
+    )
+    assert mixed[1] == ut.fold_hash(["a"], n=5)[0]
+
+    # The salt changes the folds
+    salted = ut.fold_hash(ids, n=5, salt="a")
+    assert 0.15 < np.mean(salted == folds) < 0.25
+    np.testing.assert_array_equal(salted, ut.fold_hash(ids, n=5, salt="a"))
+
+    with pytest.raises(ValueError):
+        ut.fold_hash(ids, n=0)
+
+
+def test_group_uniques_keeps_rows_and_is_reproducible():
+
+    df = pd.DataFrame({
+        "id": ["b", "a", "b", "c", "d", "a", "e", "f"],
+        "x": range(8),
+    }, index=list("stuvwxyz"))
+
+    grouped = ut.group_uniques(df, n=2, col="id", seed=4)
+
+    assert grouped.columns.tolist() == ["id", "x", "group"]
+    assert grouped.index.tolist() == list("stuvwxyz")
+    assert grouped["x"].tolist() == list(range(8))
+    assert (grouped.groupby("id")["group"].nunique() == 1).all()
+    assert grouped.drop_duplicates("id")["group"].value_counts().tolist() == [3, 3]
+
+    grouped_again = ut.group_uniques(df, n=2, col="id", seed=4)
+    assert grouped_again["group"].tolist() == grouped["group"].tolist()
+
+    partitioned = ut.group_uniques(df, n=0.5, col="id", method="l_sizes", seed=4)
+    assert sorted(partitioned.drop_duplicates("id")["group"].tolist()) == [0, 0, 0, 1, 1, 1]
+
+
+def test_fold_repeated():
+
+    df = pd.DataFrame({
+        "id": [1, 1, 2, 2, 3, 3, 4, 4, 5, 6, 7, 8],
+        "c": ["a"] * 8 + ["b"] * 4,
+    })
+
+    folds = ut.fold_repeated(df, n=2, repeats=5, id_col="id", cat_col="c", seed=1)
+
+    assert folds.shape == (12, 5)
+    assert folds.dtype == np.int8
+
+    for r in range(5):
+        folded = df.assign(group=folds[:, r])
+        assert (folded.groupby("id")["group"].nunique() == 1).all()
+        ids_per_fold = folded.drop_duplicates("id").groupby(["c", "group"]).size()
+        assert ids_per_fold.tolist() == [2, 2, 2, 2]
+
+    # Repetitions differ
+    assert len({tuple(folds[:, r]) for r in range(5)}) > 1
+
+    # Same result with a process pool
+    parallel = ut.fold_repeated(df, n=2, repeats=5, id_col="id", cat_col="c",
+                                seed=1, workers=2)
+    assert (parallel == folds).all()
+
+    # Seeding with a generator
+    # Same generator state gives the same folds
+    from_rng = ut.fold_repeated(df, n=2, repeats=5, id_col="id", cat_col="c",
+                                seed=np.random.default_rng(2))
+    assert from_rng.shape == (12, 5)
+    assert (from_rng == ut.fold_repeated(df, n=2, repeats=5, id_col="id", cat_col="c",
+                                         seed=np.random.default_rng(2))).all()
+
+
+def test_fold_splitter():
+
+    df = pd.DataFrame({
+        "id": [1, 1, 2, 2, 3, 3, 4, 4, 5, 6, 7, 8],
+        "c": ["a"] * 8 + ["b"] * 4,
+    })
+
+    splitter = ut.FoldSplitter(n=2, id_col="id", cat_col="c", seed=1)
+    assert splitter.get_n_splits() == 2
+
+    splits = list(splitter.split(df))
+    assert len(splits) == 2
+
+    folds = ut.fold(df, n=2, id_col="id", cat_col="c", seed=1, return_factor=True)
+    for fold, (train_idx, test_idx) in zip([1, 2], splits):
+        assert train_idx.dtype == test_idx.dtype == np.int64
+        assert test_idx.tolist() == np.flatnonzero(folds == fold).tolist()
+        assert sorted(train_idx.tolist() + test_idx.tolist()) == list(range(12))
+        assert not set(df["id"].iloc[train_idx]) & set(df["id"].iloc[test_idx])
+
+    # Same folds on every call with an integer seed
+    assert [s[1].tolist() for s in splitter.split(df)] == \
+        [s[1].tolist() for s in splits]
@@ -0,0 +1,87 @@
+# Testing pandas.ChunkedDropper
+
+import copy
+
+import utipy as ut
+import numpy as np
+import pandas as pd
+import pytest
+
+
+def test_chunked_dropper_matches_drop():
+
+    rng = np.random.default_rng(0)
+    n = 500
+    df = pd.DataFrame({
+        'i': rng.integers(0, 3, n),
+        'f': rng.choice([0., 1., np.nan, np.inf], n, p=[.6, .1, .2, .1]),
+        's': rng.choice(np.array(['a', 'b', None, np.nan], dtype=object), n),
+        'const': ['k'] * n,
+        'zeros': np.zeros(n),
+    })
+    rules = [('NaN', 0.1, '>'), ('inf', 0, '>'), ('any', 0.5, '>='), (0, 0.5, '>')]
+    chunks = [df.iloc[start:start + 64] for start in range(0, n, 64)]
+
+    dropper = ut.ChunkedDropper(rules=rules).fit(chunks)
+
+    _, expected = ut.drop(df, rules=[rule + (0,) for rule in rules], messenger=None)
+    pd.testing.assert_frame_equal(dropper.report(), expected)
+    assert dropper.columns_to_drop == ['f', 's', 'const', 'zeros']
+    assert dropper.n_rows == n
+
+    props = dropper.proportions()
+    assert props.columns.tolist() == ['NaN', 'inf', 0, 'any']
+    assert props.loc['zeros', 0] == 1.0
+    assert props.loc['const', 'any'] == 1.0
+
+    # Second pass
+    dropped = pd.concat(dropper.transform(chunks))
+    assert dropped.columns.tolist() == ['i']
+    assert len(dropped) == n
+
+    # Counters of parts can be merged
+    first = ut.ChunkedDropper(rules=rules).fit(chunks[:3])
+    second = ut.ChunkedDropper(rules=rules).fit(chunks[3:])
+    pd.testing.assert_frame_equal(first.merge(second).proportions(), props)
+
+
+def test_chunked_dropper_many_chunks_high_cardinality():
+
+    # Mostly distinct values in many small chunks
+    rng = np.random.default_rng(1)
+    n = 20000
+    df = pd.DataFrame({
+        'f': np.where(rng.random(n) < 0.01, np.nan, rng.standard_normal(n)),
+        'i': rng.integers(0, n // 2, n),
+        's': rng.integers(0, 50, n).astype(str).astype(object),
+    })
+    chunks = [df.iloc[start:start + 97] for start in range(0, n, 97)]
+
+    dropper = ut.ChunkedDropper(value='any', thresh=0.015, direction='>').fit(chunks)
+
+    # Same counts as the full data
+    expected_props = [df[name].value_counts(dropna=False).max() / n for name in df.columns]
+    assert dropper.proportions()['any'].tolist() == expected_props
+    _, expected = ut.drop(df, rules=[('any', 0.015, '>', 0)], messenger=None)
+    assert dropper.columns_to_drop == expected['dropped'][0] == ['s']
+
+    # Counts beyond 32 bits are kept exactly
+    for _ in range(33):
+        dropper.merge(copy.deepcopy(dropper))
+    assert dropper.n_rows == n * 2**33
+    assert dropper.proportions()['any'].tolist() == expected_props
+
+
+def test_chunked_dropper_single_rule_and_errors():
+
+    df = pd.DataFrame({'a': [np.nan, 1, 2, 3], 'b': [1, 2, 3, 4], 'c': [np.nan] * 4})
+    dropper = ut.ChunkedDropper(value='NaN', thresh=0, direction='>', exclude=['c'])
+    dropper.fit([df.iloc[:2], df.iloc[2:]])
+    assert dropper.columns_to_drop == ['a']
+
+    with pytest.raises(RuntimeError):
+        ut.ChunkedDropper().report()
+    with pytest.raises(ValueError):
+        dropper.update(df[['a', 'b']])
+    with pytest.raises(ValueError):
+        ut.ChunkedDropper(rules=[('NaN', 0, '>', 1)])
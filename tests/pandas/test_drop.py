@@ -3,6 +3,7 @@
 import utipy as ut
 import numpy as np
 import pandas as pd
+import pytest
 
 
 def test_drop_DF_columns():
@@ -171,3 +172,83 @@ def test_drop_DF_rows():
     #                      include = ['infs'])
 
     # assert (droppedinc.columns == ['a', 'b','c', 's','na','zero','zeros']).all()
+
+
+def test_drop_matches_makes_up_per_column_and_row():
+
+    rng = np.random.default_rng(1)
+    n = 40
+    df = pd.DataFrame({
+        'i': rng.integers(0, 3, n),
+        'f': rng.choice([0., 1., np.nan, np.inf, -np.inf, -0.0], n),
+        'b': rng.integers(0, 2, n).astype(bool),
+        's': rng.choice(np.array(['a', 'nan', 'inf', None, np.nan, 0, 1.5],
+                                 dtype=object), n),
+        'I': pd.array(rng.choice([0, 1, None], n), dtype='Int64'),
+        'c': pd.Categorical(rng.choice(['a', 'b'], n)),
+    })
+
+    for data in [df, df[['i', 'f']], df[['i', 'f', 'b', 's']]]:
+        for value in ['NaN', 'inf', 'any', 0, 1, 'a']:
+            for axis in [0, 1]:
+                if value == 'inf' and 'c' in data.columns:
+                    continue
+                for thresh, direction in [(0, '>'), (0.3, '>='), (0.5, '<')]:
+                    exceeders = data.apply(ut.makes_up, axis=axis, value=value,
+                                           thresh=thresh, direction=direction)
+                    expected = data.drop(
+                        data.columns[exceeders.to_numpy(dtype=bool)] if axis == 0
+                        else data.index[exceeders.to_numpy(dtype=bool)],
+                        axis=1 - axis)
+                    dropped = ut.drop(data, value=value, thresh=thresh,
+                                      direction=direction, axis=axis,
+                                      messenger=None)
+                    pd.testing.assert_frame_equal(dropped, expected)
+
+
+def test_drop_rules():
+
+    df = pd.DataFrame({'na': [np.nan, np.nan, np.nan, 1, 2],
+                       'inf': [np.inf, 1, 2, 3, 4],
+                       'const': [7, 7, 7, 7, 7],
+                       'zeros': [0, 0, 0, 0, 1],
+                       'ok': [1, 2, 3, 4, 5],
+                       's': ['a', 'b', 'a', 'b', 'a']},
+                      index=list('vwxyz'))
+
+    dropped, report = ut.drop(df, rules=[
+        ('NaN', 0.5, '>', 0),
+        ('inf', 0, '>', 0),
+        {'value': 'any', 'thresh': 1, 'direction': '==', 'axis': 0},
+        (0, 0.5, '>', 0),
+        ('NaN', 0, '>', 1),
+    ], messenger=None)
+
+    assert dropped.columns.tolist() == ['ok', 's']
+    assert dropped.index.tolist() == ['y', 'z']
+
+    assert report.columns.tolist() == [
+        'value', 'thresh', 'direction', 'axis', 'n_dropped', 'dropped']
+    assert report['dropped'].tolist() == [
+        ['na'], ['inf'], ['const'], ['zeros'], ['v', 'w', 'x']]
+    assert report['n_dropped'].tolist() == [1, 1, 1, 1, 3]
+
+    # Same columns as separate calls on the full data
+    for value, thresh, direction in [('NaN', 0.5, '>'), ('any', 1, '==')]:
+        single = ut.drop(df, value=value, thresh=thresh,
+                         direction=direction, messenger=None)
+        _, single_report = ut.drop(df, rules=[(value, thresh, direction, 0)],
+                                   messenger=None)
+        assert single_report['dropped'][0] == \
+            [col for col in df.columns if col not in single.columns]
+
+    # Exclude applies to all rules
+    dropped, report = ut.drop(df, rules=[('NaN', 0, '>', 0), ('NaN', 0, '>', 1)],
+                              exclude=['na', 'v'], messenger=None)
+    assert dropped.columns.tolist() == df.columns.tolist()
+    assert dropped.index.tolist() == ['v', 'y', 'z']
+
+    with pytest.raises(ValueError):
+        ut.drop(df, rules=[('NaN', 0, '>')])
+    with pytest.raises(ValueError):
+        ut.drop(df, rules=[('NaN', 2, '>', 0)])
@@ -3,6 +3,7 @@
 import utipy as ut
 import numpy as np
 import pandas as pd
+import pytest
 
 
 def test_makes_up_Series():
@@ -91,3 +92,62 @@ def test_makes_up_list():
     assert not ut.makes_up(x6, 6, thresh=0.5, direction='<')
     assert ut.makes_up(x6, 6, thresh=0.5, direction='==')
     assert ut.makes_up(x6, 6, thresh=0.3, direction='>')
+
+
+def test_makes_up_frame():
+
+    df = pd.DataFrame({'a': [1, 0, 0, np.nan],
+                       'b': [np.inf, 0, 2, 2],
+                       's': ['x', None, np.nan, 'x'],
+                       'I': pd.array([0, 0, None, 1], dtype='Int64')},
+                      index=list('wxyz'))
+
+    nans = ut.makes_up_frame(df, value='NaN')
+    assert nans.index.tolist() == ['a', 'b', 's', 'I']
+    assert nans.name == 'NaN'
+    # Object columns are checked as strings, so None is not 'nan'
+    assert nans.tolist() == [0.25, 0., 0.25, 0.25]
+
+    props = ut.makes_up_frame(df, value=['NaN', 'inf', 'any', 0], axis=0)
+    assert props.columns.tolist() == ['NaN', 'inf', 'any', 0]
+    assert props.loc['b'].tolist() == [0., 0.25, 0.5, 0.25]
+    assert props.loc['a', 0] == 0.5
+    assert props.loc['I', 'any'] == 0.5
+
+    # Same proportions as makes_up() compares to the threshold
+    for value in ['NaN', 'any', 0, 'x']:
+        for axis in [0, 1]:
+            single = ut.makes_up_frame(df, value=value, axis=axis)
+            expected = df.apply(ut.makes_up, axis=axis, value=value,
+                                thresh=0.25, direction='>')
+            assert (single > 0.25).tolist() == expected.tolist()
+            np.testing.assert_array_equal(
+                ut.makes_up_frame(df, value=[value], axis=axis)[value], single)
+
+    rows = ut.makes_up_frame(df, value='any', axis=1)
+    assert rows.index.tolist() == list('wxyz')
+
+
+def test_makes_up_object_and_categorical():
+
+    # Object elements are checked as strings
+    x = pd.Series([np.nan, np.float32('nan'), None, pd.NA, pd.NaT, 'nan', 'NaN',
+                   np.inf, -np.inf, 'inf', 1, 'a'], dtype=object)
+    assert ut.makes_up(x, 'NaN', thresh=3 / 12, direction='==')
+    assert ut.makes_up(x, 'inf', thresh=2 / 12, direction='==')
+    assert ut.makes_up(x, 'any', thresh=3 / 12, direction='==')
+    assert ut.makes_up(x, 'a', thresh=1 / 12, direction='==')
+    assert ut.makes_up(x, 7, thresh=0, direction='==')
+
+    # Categoricals are counted from their codes
+    c = pd.Series(pd.Categorical(['a', 'b', 'a', None, 'a'], categories=['a', 'b', 'z']))
+    assert ut.makes_up(c, 'NaN', thresh=0.2, direction='==')
+    assert ut.makes_up(c, 'any', thresh=0.6, direction='==')
+    assert ut.makes_up(c, 'a', thresh=0.6, direction='==')
+    assert ut.makes_up(c, 'z', thresh=0, direction='==')
+    assert ut.makes_up(c, 'q', thresh=0, direction='==')
+
+    with pytest.raises(ValueError):
+        ut.makes_up(c, 'z', thresh=0, direction='==', missing_error=True)
+    with pytest.raises(ValueError):
+        ut.makes_up(x, 7, thresh=0, direction='==', missing_error=True)
@@ -1,33 +1,126 @@
 # outer __init__.py
 
-from .pandas.drop import drop
-from .pandas.makes_up import makes_up
-from .pandas.resemble import resemble
-from .pandas.distort import distort
-from .pandas.subset_by_levels import subset_by_levels
-from .pandas.polynomializer import polynomializer
-from .pandas.move_column_inplace import move_column_inplace
-
-from .groups.fold import fold
-from .groups.group_uniques import group_uniques
-from .groups.group import group
-from .groups.partition import partition
-
-from .array.blend import blend
-from .array.windowed_reverse import windowed_reverse
-from .array.window import window
-from .array.nan_stats import nan_stats, print_nan_stats
-
-from .time.timestamps import Timestamps
-from .time.timer import StepTimer
-
-from .path.iopaths import IOPaths
-from .path.mk_rm_dir import mk_dir, rm_dir
-
-from .string.letter_strings import letter_strings
-from .string.random_strings import random_alphanumeric
-
-from .utils.messenger import Messenger, check_messenger, msg_if
+import importlib
+from typing import TYPE_CHECKING
+
+# The functions and classes are imported when they are first used.
+# Importing a submodule then only imports its own dependencies,
+# e.g., the array versions of the grouping functions do not import pandas.
+_LAZY_IMPORTS = {
+    "drop": ".pandas.drop",
+    "ChunkedDropper": ".pandas.chunked_dropper",
+    "makes_up": ".pandas.makes_up",
+    "makes_up_frame": ".pandas.makes_up_frame",
+    "resemble": ".pandas.resemble",
+    "distort": ".pandas.distort",
+    "subset_by_levels": ".pandas.subset_by_levels",
+    "polynomializer": ".pandas.polynomializer",
+    "move_column_inplace": ".pandas.move_column_inplace",
+
+    "fold": ".groups.fold",
+    "fold_array": ".groups.fold_array",
+    "fold_hash": ".groups.fold_hash",
+    "fold_repeated": ".groups.fold_repeated",
+    "FoldSplitter": ".groups.fold_splitter",
+    "group_uniques": ".groups.group_uniques",
+    "group_uniques_array": ".groups.group_uniques_array",
+    "group": ".groups.group",
+    "group_array": ".groups.group_array",
+    "LazyPartitions": ".groups.lazy_partitions",
+    "partition": ".groups.partition",
+    "partition_array": ".groups.partition_array",
+
+    "blend": ".array.blend",
+    "blend_many": ".array.blend",
+    "windowed_reverse": ".array.windowed_reverse",
+    "window": ".array.window",
+    "iter_windows": ".array.iter_windows",
+    "window_batches": ".array.window_batches",
+    "window_reduce": ".array.window_reduce",
+    "window_indices": ".array.window_indices",
+    "window_map": ".array.window_map",
+    "nan_stats": ".array.nan_stats",
+    "print_nan_stats": ".array.nan_stats",
+
+    "Timestamps": ".time.timestamps",
+    "StepTimer": ".time.timer",
+
+    "IOPaths": ".path.iopaths",
+    "mk_dir": ".path.mk_rm_dir",
+    "rm_dir": ".path.mk_rm_dir",
+
+    "letter_strings": ".string.letter_strings",
+    "random_alphanumeric": ".string.random_strings",
+
+    "Messenger": ".utils.messenger",
+    "check_messenger": ".utils.messenger",
+    "msg_if": ".utils.messenger",
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+# Subpackages are imported when they are first used as well
+_SUBPACKAGES = ["array", "groups", "measures", "pandas", "path", "string", "time", "utils"]
+
+
+def __getattr__(name: str):
+    if name in _SUBPACKAGES:
+        return importlib.import_module("." + name, __name__)
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
+
+
+if TYPE_CHECKING:
+    from .pandas.drop import drop
+    from .pandas.chunked_dropper import ChunkedDropper
+    from .pandas.makes_up import makes_up
+    from .pandas.makes_up_frame import makes_up_frame
+    from .pandas.resemble import resemble
+    from .pandas.distort import distort
+    from .pandas.subset_by_levels import subset_by_levels
+    from .pandas.polynomializer import polynomializer
+    from .pandas.move_column_inplace import move_column_inplace
+
+    from .groups.fold import fold
+    from .groups.fold_array import fold_array
+    from .groups.fold_hash import fold_hash
+    from .groups.fold_repeated import fold_repeated
+    from .groups.fold_splitter import FoldSplitter
+    from .groups.group_uniques import group_uniques
+    from .groups.group_uniques_array import group_uniques_array
+    from .groups.group import group
+    from .groups.group_array import group_array
+    from .groups.lazy_partitions import LazyPartitions
+    from .groups.partition import partition
+    from .groups.partition_array import partition_array
+
+    from .array.blend import blend, blend_many
+    from .array.windowed_reverse import windowed_reverse
+    from .array.window import window
+    from .array.iter_windows import iter_windows
+    from .array.window_batches import window_batches
+    from .array.window_reduce import window_reduce
+    from .array.window_indices import window_indices
+    from .array.window_map import window_map
+    from .array.nan_stats import nan_stats, print_nan_stats
+
+    from .time.timestamps import Timestamps
+    from .time.timer import StepTimer
+
+    from .path.iopaths import IOPaths
+    from .path.mk_rm_dir import mk_dir, rm_dir
+
+    from .string.letter_strings import letter_strings
+    from .string.random_strings import random_alphanumeric
+
+    from .utils.messenger import Messenger, check_messenger, msg_if
 
 
 def get_version():
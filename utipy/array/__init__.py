@@ -1,5 +1,10 @@
 # array __init__.py
 
-from .blend import blend
+from .blend import blend, blend_many
 from .windowed_reverse import windowed_reverse
 from .window import window
+from .iter_windows import iter_windows
+from .window_batches import window_batches
+from .window_reduce import window_reduce
+from .window_indices import window_indices
+from .window_map import window_map
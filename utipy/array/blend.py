@@ -2,8 +2,9 @@
 @author: ludvigolsen
 """
 
-from typing import Union, cast
+from typing import Iterator, Optional, Sequence, Union, cast
 import numpy as np
+from numpy.typing import DTypeLike
 import pandas as pd
 from utipy.utils.check_instance import check_instance
 from utipy.utils.convert_to_type import convert_to_type
@@ -12,11 +13,21 @@ from utipy.utils.convert_to_type import convert_to_type
 def blend(
         x1: Union[list, np.ndarray, pd.Series], 
         x2: Union[list, np.ndarray, pd.Series], 
-        amount: float = 0.5
+        amount: float = 0.5,
+        out: Optional[np.ndarray] = None,
+        dtype: Optional[DTypeLike] = None,
     ) -> Union[list, np.ndarray, pd.Series]:
     """
     Blend two arrays
 
+    Calculated as `x1 + amount * (x2 - x1)` (or as
+    `x2 - (1 - amount) * (x2 - x1)` when `amount > 0.5`),
+    so the results are exactly `x1` and `x2` at `amount` 0 and 1.
+    Infinite values are blended as `(1 - amount) * x1 + amount * x2`.
+    The arrays are blended block-wise into a single output array,
+    so temporary memory stays small and the result
+    is the same with and without `out`.
+
     Parameters
     ----------
     x1 : list, np.ndarray, pd.Series
@@ -30,11 +41,19 @@ def blend(
             1: Keep only x2.  
             0.1: 10% x2 / 90% x1.  
         A value in-between 0-1 will result in integers becoming floats.
+    out : np.ndarray or None
+        Array to write the blended array to.
+        Can be `x1` or `x2` to blend in-place.
+    dtype : data-type or None
+        The dtype to calculate and return the blended array in, e.g., `np.float32`.
+        When `None`, the dtype is found from `x1`, `x2` and `amount`.
+        Ignored when `out` is specified.
 
     Returns
     -------
     list, np.ndarray, pd.Series
-        Blended array with type of the original (x1)
+        Blended array with type of the original (x1).
+        When `out` is specified, `out` is returned.
 
     Examples
     --------
@@ -49,12 +68,180 @@ def blend(
     # Get instance types (np.ndarray, list, pd.Series)
     instance_type = check_instance(x1)
 
-    x1_weighted = np.multiply(x1, (1 - amount))
-    x2_weighted = np.multiply(x2, amount)
+    x1_arr = np.asarray(x1)
+    x2_arr = np.asarray(x2)
+
+    if out is None:
+        if dtype is None:
+            dtype = np.result_type(x1_arr, x2_arr, amount)
+        out = np.empty(np.broadcast_shapes(x1_arr.shape, x2_arr.shape), dtype=dtype)
+        return_out = False
+    else:
+        if not isinstance(out, np.ndarray):
+            raise TypeError(f"`out` must be a numpy array but had type: {type(out)}")
+        return_out = True
+
+    # Blend block-wise along the first axis
+    # Each block of the inputs is read before it is written,
+    # so `out` can be `x1` or `x2`
+    out_rows = _as_rows(out)
+    x1_rows = _as_rows(np.broadcast_to(x1_arr, out.shape))
+    x2_rows = _as_rows(np.broadcast_to(x2_arr, out.shape))
+    for rows in _row_blocks(out):
+        out_rows[rows] = _blend_block(x1_rows[rows], x2_rows[rows], amount, out.dtype)
+
+    if return_out:
+        return out
+
+    return _to_original_type(out, x1, instance_type)
+
+
+def _blend_block(
+        x1: np.ndarray,
+        x2: np.ndarray,
+        amount: float,
+        dtype: DTypeLike
+    ) -> np.ndarray:
+    """Blend a block of the arrays into a new array."""
+    if amount == 0:
+        return x1
+    if amount == 1:
+        return x2
+
+    # Interpolate from the closest end, so both ends are exact
+    # NaNs from infinite values are handled below
+    with np.errstate(invalid="ignore"):
+        blended = np.subtract(x2, x1, dtype=dtype)
+        if amount <= 0.5:
+            blended *= amount
+            blended += x1
+        else:
+            blended *= amount - 1
+            blended += x2
+
+    # Infinite values give NaN differences
+    if blended.dtype.kind in "fc":
+        is_nan = np.isnan(blended)
+        if is_nan.any():
+            is_nan &= ~(np.isnan(x1) | np.isnan(x2))
+            blended[is_nan] = x1[is_nan] * (1 - amount) + x2[is_nan] * amount
+    return blended
+
+
+def blend_many(
+        arrays: Sequence[Union[list, np.ndarray, pd.Series]],
+        weights: Sequence[float],
+        out: Optional[np.ndarray] = None,
+        dtype: Optional[DTypeLike] = None,
+    ) -> Union[list, np.ndarray, pd.Series]:
+    """
+    Blend multiple arrays
+
+    Calculates the weighted sum of the arrays in a single output array.
+    Arrays are added block-wise, so temporary memory stays small
+    regardless of the number of arrays.
+
+    Parameters
+    ----------
+    arrays : sequence of list, np.ndarray, pd.Series
+        The arrays to blend. Must have the same length.
+    weights : sequence of float
+        The weight of each array.
+        Weights are not normalized, so they should sum to 1 for a blend.
+    out : np.ndarray or None
+        Array to write the blended array to.
+        Must not share memory with the arrays.
+    dtype : data-type or None
+        The dtype to calculate and return the blended array in, e.g., `np.float32`.
+        When `None`, the dtype is found from the arrays and weights.
+        Ignored when `out` is specified.
+
+    Returns
+    -------
+    list, np.ndarray, pd.Series
+        Blended array with type of the first array.
+        When `out` is specified, `out` is returned.
+
+    Examples
+    --------
+
+    >>> x1 = [1,2,3]  
+    >>> x2 = [4,5,6]  
+    >>> x3 = [7,8,9]  
+    >>> blend_many([x1, x2, x3], weights = [0.5, 0.25, 0.25])  
+    [3.25,4.25,5.25]
+
+    """
+    if len(arrays) == 0:
+        raise ValueError("`arrays` must contain at least one array.")
+    if len(arrays) != len(weights):
+        raise ValueError(
+            f"`arrays` ({len(arrays)}) and `weights` ({len(weights)}) must have the same length."
+        )
+
+    # Get instance types (np.ndarray, list, pd.Series)
+    instance_type = check_instance(arrays[0])
+
+    arrs = [np.asarray(arr) for arr in arrays]
+
+    if out is None:
+        if dtype is None:
+            dtype = np.result_type(*arrs, *weights)
+        out = np.empty(np.broadcast_shapes(*[arr.shape for arr in arrs]), dtype=dtype)
+        return_out = False
+    else:
+        if not isinstance(out, np.ndarray):
+            raise TypeError(f"`out` must be a numpy array but had type: {type(out)}")
+        if any(np.may_share_memory(out, arr) for arr in arrs):
+            raise ValueError("`out` cannot share memory with the arrays.")
+        return_out = True
+
+    arrs = [np.broadcast_to(arr, out.shape) for arr in arrs]
 
-    blended = x1_weighted + x2_weighted
+    # Blend block-wise along the first axis
+    # Each product then only needs a block-sized temporary array
+    out_rows = _as_rows(out)
+    arr_rows = [_as_rows(arr) for arr in arrs]
+    for rows in _row_blocks(out):
+        block = out_rows[rows]
+        np.multiply(arr_rows[0][rows], weights[0], out=block)
+        for arr, weight in zip(arr_rows[1:], weights[1:]):
+            block += arr[rows] * weight
 
-    # Convert to original type (np.ndarray, list, pd.Series)
+    if return_out:
+        return out
+
+    return _to_original_type(out, arrays[0], instance_type)
+
+
+# Number of elements to blend at a time
+_BLEND_BLOCK_SIZE = 2**16
+
+
+def _row_blocks(out: np.ndarray) -> Iterator[slice]:
+    """Get slices of blocks of rows with about `_BLEND_BLOCK_SIZE` elements."""
+    n_rows = out.shape[0] if out.ndim else 1
+    row_size = max(out.size // max(n_rows, 1), 1)
+    block_rows = max(_BLEND_BLOCK_SIZE // row_size, 1)
+    for start in range(0, n_rows, block_rows):
+        yield slice(start, start + block_rows)
+
+
+def _as_rows(x: np.ndarray) -> np.ndarray:
+    """Get 0-D arrays as 1-D arrays, so they can be sliced by row."""
+    return x if x.ndim else x.reshape(1)
+
+
+def _to_original_type(
+        blended: np.ndarray,
+        original: Union[list, np.ndarray, pd.Series],
+        instance_type: str
+    ) -> Union[list, np.ndarray, pd.Series]:
+    """Convert to original type (np.ndarray, list, pd.Series)"""
+    if instance_type == "pd.Series":
+        # Keep index and name of the original Series
+        original = cast(pd.Series, original)
+        return pd.Series(blended, index=original.index, name=original.name)
     return cast(
         Union[list, np.ndarray, pd.Series],
         convert_to_type(blended, instance_type),
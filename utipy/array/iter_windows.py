@@ -0,0 +1,133 @@
+"""
+@author: ludvigolsen
+"""
+
+from typing import Iterable, Iterator, Optional, Union, cast
+import numpy as np
+import pandas as pd
+from utipy.utils.check_instance import check_instance
+from utipy.utils.convert_to_type import convert_to_type
+from .window import _check_window_args
+
+
+def iter_windows(
+    chunks: Iterable[Union[list, np.ndarray, pd.Series]],
+    size: int = 2,
+    gap: int = 1,
+    sample_rate: int = 1,
+    rolling: bool = True,
+    discard_shorts: bool = True,
+) -> Iterator[np.ndarray]:
+    """
+
+    Splits a stream of arrays, e.g., chunks of a time series, into rolling (optional) windows.
+
+    Yields the same windows as `window()` would return for the
+    concatenated chunks, without holding the whole series in memory.
+    Samples are carried over between chunks, so memory is bounded by
+    one window plus one chunk.
+
+    Parameters
+    ----------
+    chunks : iterable of list, np.ndarray, pd.Series
+        The consecutive parts of the time series to window.
+        E.g., a generator reading from a sensor or file.
+    size : int
+        Window size
+    gap : int
+        Gap size.
+    sample_rate : int
+        Size and gap will be multiplied by the given sample rate
+        allowing you to specify those in seconds instead of samples.
+    rolling : bool
+        Use rolling windows.
+        If False:
+            Will grab "size * sample_rate" elements greedily.
+            Be aware of the gap setting that defaults to 1.
+    discard_shorts: bool
+        If the concatenated series is shorter than size*sample_rate,
+        yield nothing (True) or yield the series (False).
+
+    Yields
+    ------
+    np.ndarray
+        One window at a time.
+
+    Notes
+    -----
+    Reversed windowing (`reverse_direction` in `window()`) is not supported,
+    as it requires knowing where the series ends.
+
+    Examples
+    --------
+
+    >>> chunks = [np.array([1, 2, 3]), np.array([4, 5]), np.array([6])]
+    >>> list(iter_windows(chunks, size=4, gap=1))
+    [array([1, 2, 3, 4]), array([2, 3, 4, 5]), array([3, 4, 5, 6])]
+
+    """
+
+    _check_window_args(
+        size=size,
+        gap=gap,
+        sample_rate=sample_rate,
+        rolling=rolling,
+        reverse_direction=False,
+        discard_shorts=discard_shorts,
+    )
+
+    # Validation happens on call, windowing on iteration
+    return _iter_windows(
+        chunks=chunks,
+        n_samples=size * sample_rate,
+        gap_samples=gap * sample_rate,
+        rolling=rolling,
+        discard_shorts=discard_shorts,
+    )
+
+
+def _iter_windows(
+    chunks: Iterable[Union[list, np.ndarray, pd.Series]],
+    n_samples: int,
+    gap_samples: int,
+    rolling: bool,
+    discard_shorts: bool,
+) -> Iterator[np.ndarray]:
+
+    # Distance between window starts
+    step = gap_samples if rolling else n_samples + gap_samples
+
+    # Carried-over samples and the position
+    # of its first element in the full series
+    buffer: Optional[np.ndarray] = None
+    buffer_start = 0
+
+    # Position of the next window in the full series
+    next_start = 0
+
+    for chunk in chunks:
+        _ = check_instance(chunk)
+        chunk = cast(np.ndarray, convert_to_type(chunk, "np.ndarray"))
+
+        if buffer is None or len(buffer) == 0:
+            buffer = chunk
+        else:
+            buffer = np.concatenate([buffer, chunk])
+        buffer_end = buffer_start + len(buffer)
+
+        # Yield all windows that end within the buffer
+        while next_start + n_samples <= buffer_end:
+            window_start = next_start - buffer_start
+            yield buffer[window_start : window_start + n_samples]
+            next_start += step
+
+        # Drop the samples that no later window will use
+        # The rest is shorter than a window, so we copy it
+        # to avoid keeping the full buffer alive
+        n_used = min(next_start - buffer_start, len(buffer))
+        buffer = buffer[n_used:].copy()
+        buffer_start += n_used
+
+    # If the series was too short for a single window
+    if next_start == 0 and not discard_shorts:
+        yield buffer if buffer is not None else np.asarray([])
@@ -12,7 +12,8 @@ def print_nan_stats(
         message: str,
         messenger: Optional[Callable] = Messenger(
             verbose=True, indent=0, msg_fn=print),
-        indent: Optional[int] = None) -> None:
+        indent: Optional[int] = None,
+        axis: Optional[int] = None) -> None:
     """
     Print statistics about NaNs in an array.
 
@@ -22,7 +23,10 @@ def print_nan_stats(
         The array / data frame to count NaNs in.
     message : str
         The message prior to the stats. Full message becomes:
-            `indentation + message + ": " + num NaNs (percentage)` 
+            `indentation + message + ": " + num NaNs (percentage)`
+        When `axis` is specified, the message is followed by
+        one indented line per column / row:
+            `indentation + "  " + name + ": " + num NaNs (percentage)`
     messenger : `utipy.Messenger` or None
         A `utipy.Messenger` instance used to print/log/... information.
         When `None`, no printing/logging is performed.
@@ -30,29 +34,167 @@ def print_nan_stats(
         and indentation when `indent` is `None`.
     indent : int
         Indentation of message. When `None`, indentation is determined by `messenger`.
+    axis : int or None
+        Print the stats per column (`0`) or per row (`1`) instead of in total.
+        See `nan_stats()`.
     """
     messenger = check_messenger(messenger)
-    num_nans, perc = nan_stats(x)
-    messenger(f"{message}: {num_nans} ({perc}%)", indent=indent)
+    num_nans, perc = nan_stats(x, axis=axis)
+    if axis is None:
+        messenger(f"{message}: {num_nans} ({perc}%)", indent=indent)
+        return
 
+    messenger(f"{message}:", indent=indent)
+    indent = (indent if indent is not None else messenger.indent) + 2
+    if isinstance(num_nans, pd.Series):
+        names = num_nans.index
+    else:
+        names = range(len(num_nans))
+    for name, n, p in zip(names, np.asarray(num_nans), np.asarray(perc)):
+        messenger(f"{name}: {n} ({p}%)", indent=indent)
 
-def nan_stats(x: Union[np.ndarray, pd.DataFrame]) -> Tuple[int, float]:
+
+def nan_stats(
+        x: Union[np.ndarray, pd.DataFrame],
+        axis: Optional[int] = None,
+        chunk_size: Optional[int] = None
+) -> Tuple[Union[int, np.ndarray, pd.Series], Union[float, np.ndarray, pd.Series]]:
     """
     Get statistics about NaNs in an array.
 
+    NaNs are counted in chunks of rows, so memory-mapped arrays
+    never need a boolean mask the size of the data.
+    Integer and boolean data cannot contain NaNs and are not scanned.
+
     Parameters
     ----------
-    x : `numpy.ndarray`
-        A numpy array.
+    x : `numpy.ndarray` or `pandas.DataFrame`
+        A numpy array (e.g., a `np.memmap`) or data frame.
+        Missing values in object columns (e.g., `None`) are counted as NaNs.
+    axis : int or None
+        The axis to count NaNs along.
+            None: Count in all of `x`.
+            0: Count per column (along the rows).
+            1: Count per row (along the columns).
+        Other axes are allowed for N-D arrays.
+    chunk_size : int or None
+        Number of rows (elements of the first axis) to check at a time.
+        When `None`, chunks of about a million elements are used.
 
     Returns
     -------
-    int
+    int or np.ndarray or pd.Series
         Number of NaNs in `x`.
-    float
-        Percentage of `x` that was NaN. 
+        When `axis` is specified, the number per column / row.
+        This is a `pd.Series` (with the column names / index)
+        for data frames.
+    float or np.ndarray or pd.Series
+        Percentage of `x` that was NaN.
         Between 0 and 100.
+        When `axis` is specified, the percentage per column / row.
     """
-    num_nans = np.count_nonzero(np.isnan(x))
-    perc = np.round((num_nans / float(x.size)) * 100, decimals=2)
+    if chunk_size is not None and (not isinstance(chunk_size, int) or chunk_size < 1):
+        raise ValueError("`chunk_size` must be a positive integer or None.")
+
+    if isinstance(x, pd.DataFrame):
+        return _nan_stats_df(x, axis=axis, chunk_size=chunk_size)
+
+    x = np.asarray(x)
+    if axis is not None:
+        if not isinstance(axis, int):
+            raise TypeError(f"`axis` must be an int or None but had type: {type(axis)}")
+        if not -x.ndim <= axis < x.ndim:
+            raise ValueError(f"axis {axis} is out of bounds for array of dimension {x.ndim}")
+        axis = axis % x.ndim
+
+    num_nans = _count_nans(x, axis=axis, chunk_size=chunk_size)
+    size = x.size if axis is None else x.shape[axis]
+    perc = np.round((num_nans / float(size)) * 100, decimals=2)
     return num_nans, perc
+
+
+def _nan_stats_df(
+        x: pd.DataFrame,
+        axis: Optional[int],
+        chunk_size: Optional[int]
+) -> Tuple[Union[int, pd.Series], Union[float, pd.Series]]:
+    if axis not in [None, 0, 1]:
+        raise ValueError("`axis` must be None, 0 or 1 for data frames.")
+
+    # Count per column, so only one column
+    # is checked at a time
+    col_nans = []
+    row_nans = np.zeros(len(x), dtype=np.int64)
+    for _, col in x.items():
+        if _cannot_be_nan(col.dtype):
+            col_nans.append(0)
+            continue
+
+        if axis == 1:
+            row_nans += col.isna().to_numpy()
+        elif isinstance(col.dtype, np.dtype):
+            col_nans.append(_count_nans(col.to_numpy(), axis=None, chunk_size=chunk_size))
+        else:
+            # Extension dtypes (e.g., nullable integers and categoricals)
+            col_nans.append(int(col.isna().sum()))
+
+    if axis == 1:
+        num_nans = pd.Series(row_nans, index=x.index)
+        size = x.shape[1]
+    elif axis == 0:
+        num_nans = pd.Series(col_nans, index=x.columns, dtype=np.int64)
+        size = len(x)
+    else:
+        num_nans = int(np.sum(col_nans, dtype=np.int64))
+        size = x.size
+
+    perc = np.round((num_nans / float(size)) * 100, decimals=2)
+    return num_nans, perc
+
+
+def _cannot_be_nan(dtype) -> bool:
+    """Check whether a dtype cannot hold NaNs (e.g., integers and bools)."""
+    return isinstance(dtype, np.dtype) and dtype.kind in "biuSUV"
+
+
+def _count_nans(
+        x: np.ndarray,
+        axis: Optional[int],
+        chunk_size: Optional[int]
+) -> Union[int, np.ndarray]:
+    """Count NaNs in chunks along the first axis."""
+    if _cannot_be_nan(x.dtype):
+        if axis is None:
+            return 0
+        return np.zeros(np.delete(x.shape, axis), dtype=np.int64)
+
+    if x.dtype.kind in "fc":
+        is_nan = np.isnan
+    elif x.dtype.kind in "mM":
+        is_nan = np.isnat
+    else:
+        # Objects, e.g., strings mixed with None
+        is_nan = pd.isna
+
+    if x.ndim == 0:
+        return int(is_nan(x))
+
+    if chunk_size is None:
+        row_size = max(x.size // max(len(x), 1), 1)
+        chunk_size = max(_CHUNK_ELEMENTS // row_size, 1)
+
+    counts = [
+        np.count_nonzero(is_nan(x[start : start + chunk_size]), axis=axis)
+        for start in range(0, max(len(x), 1), chunk_size)
+    ]
+
+    if axis is None:
+        return int(np.sum(counts))
+    if axis == 0:
+        return np.sum(counts, axis=0, dtype=np.int64)
+    # The first axis is kept, so chunks are concatenated
+    return np.concatenate(counts).astype(np.int64, copy=False)
+
+
+# Number of elements to check at a time in `nan_stats()`
+_CHUNK_ELEMENTS = 2**20
@@ -19,7 +19,9 @@ def window(
     rolling: bool = True,
     reverse_direction: bool = False,
     discard_shorts: bool = True,
-) -> Tuple[List[np.ndarray], int]:
+    as_view: bool = False,
+    axis: int = 0,
+) -> Tuple[Union[List[np.ndarray], np.ndarray], int]:
     """
 
     Splits array, e.g., time series, into rolling (optional) windows and returns as list of arrays and the number of windows.
@@ -28,6 +30,7 @@ def window(
     ----------
     x : list, np.ndarray, pd.Series
         The time series array to window.
+        N-D arrays are windowed along `axis`.
     size : int
         Window size
     gap : int
@@ -46,37 +49,51 @@ def window(
     discard_shorts: bool
         If the given array is shorter than size*sample_rate,
         return ([],0) if (True) or ([x],0) if (False).
+    as_view : bool
+        Return the windows as a single read-only `np.ndarray`
+        of shape `(n_windows, size*sample_rate)` instead of a list.
+        For N-D arrays, the shape is `(n_windows, *window_shape)`, where
+        `window_shape` is the shape of `x` with `size*sample_rate` on `axis`.
+        The array is a strided view into `x`, so no data is copied.
+        Write to a copy (`.copy()`) if you need to modify the windows
+        or want a dense array.
+        When `x` is too short, the array has 0 rows (`discard_shorts=True`)
+        or a single row with `x` (`discard_shorts=False`).
+    axis : int
+        The axis to window along. E.g., `0` for
+        a `(n_samples, n_channels)` array.
+        Windows keep all other axes.
 
     Returns
     -------
-    List of np.ndarrays, number of windows
+    List of np.ndarrays (np.ndarray when `as_view` is True), number of windows
 
     """
 
     _ = check_instance(x)
     x = cast(np.ndarray, convert_to_type(x, "np.ndarray"))
 
-    if not isinstance(size, int):
-        raise ValueError("size must be an integer")
-    if not isinstance(gap, int):
-        raise ValueError("gap must be an integer")
-    if not isinstance(sample_rate, int):
-        raise ValueError("sample_rate must be an integer")
-    if not isinstance(rolling, bool):
-        raise ValueError("rolling must be a bool")
-    if not isinstance(reverse_direction, bool):
-        raise ValueError("reverse_direction must be a bool")
-    if not isinstance(discard_shorts, bool):
-        raise ValueError("discard_shorts must be a bool")
+    _check_window_args(
+        size=size,
+        gap=gap,
+        sample_rate=sample_rate,
+        rolling=rolling,
+        reverse_direction=reverse_direction,
+        discard_shorts=discard_shorts,
+    )
+    if not isinstance(as_view, bool):
+        raise ValueError("as_view must be a bool")
+    if not isinstance(axis, int):
+        raise ValueError("axis must be an integer")
+    if not -max(x.ndim, 1) <= axis < max(x.ndim, 1):
+        raise ValueError(f"axis {axis} is out of bounds for array of dimension {x.ndim}")
+    axis = axis % max(x.ndim, 1)
 
-    if size < 1:
-        raise ValueError("size must be at least 1")
-    if sample_rate < 1:
-        raise ValueError("sample_rate must be at least 1")
-    if gap < 0:
-        raise ValueError(f"gap was negative: {gap}")
-    if rolling and gap < 1:
-        raise ValueError("gap must be at least 1 when creating rolling windows")
+    # Window along the first axis
+    # and move the axis back in each window
+    x_orig = x
+    if axis != 0:
+        x = np.moveaxis(x, axis, 0)
 
     # How many samples per file?
     n_samples = sample_rate * size
@@ -84,10 +101,28 @@ def window(
 
     # If the array is too short
     if len(x) < n_samples:
+        if as_view:
+            if discard_shorts:
+                window_shape = list(x_orig.shape)
+                window_shape[axis] = n_samples
+                return _read_only(x_orig[:0].reshape(0, *window_shape)), 0
+            return _read_only(x_orig[np.newaxis]), 0
         if discard_shorts:
             return [], 0
         else:
-            return [x], 0
+            return [x_orig], 0
+
+    if as_view:
+        windows, n_windows = _window_view(
+            x,
+            n_samples=n_samples,
+            gap_samples=gap_samples,
+            rolling=rolling,
+            reverse_direction=reverse_direction,
+        )
+        if axis != 0:
+            windows = np.moveaxis(windows, 1, axis + 1)
+        return windows, n_windows
 
     if rolling:
         n_windows = np.int32((len(x) - n_samples) / gap_samples) + 1
@@ -132,4 +167,110 @@ def window(
                 for stimuli in range(n_windows)
             ]
 
+    if axis != 0:
+        stims = [np.moveaxis(stim, 0, axis) for stim in stims]
+
     return stims, n_windows
+
+
+def _window_view(
+    x: np.ndarray,
+    n_samples: int,
+    gap_samples: int,
+    rolling: bool,
+    reverse_direction: bool,
+) -> Tuple[np.ndarray, int]:
+    """
+    Create the windows of `window()` as a read-only strided view.
+    Windows are made along the first axis of `x` and have the
+    shape `(n_windows, n_samples, *x.shape[1:])`.
+
+    The windows start at the positions from `_window_starts()`.
+    These are evenly spaced, so the windows are every `step`-th row
+    (backwards when reversed) of the full sliding window view.
+    """
+    starts = _window_starts(
+        len(x),
+        n_samples=n_samples,
+        gap_samples=gap_samples,
+        rolling=rolling,
+        reverse_direction=reverse_direction,
+    )
+    n_windows = len(starts)
+
+    # Distance between window starts (negative when reversed)
+    step = int(starts[1] - starts[0]) if n_windows > 1 else 1
+
+    # All windows with a step size of 1 (read-only, no copy)
+    # Move the within-window axis next to the window axis
+    all_windows = np.moveaxis(
+        np.lib.stride_tricks.sliding_window_view(x, n_samples, axis=0), -1, 1
+    )
+    windows = all_windows[int(starts[0]) :: step][:n_windows]
+
+    return windows, int(n_windows)
+
+
+def _window_starts(
+    length: int,
+    n_samples: int,
+    gap_samples: int,
+    rolling: bool,
+    reverse_direction: bool,
+) -> np.ndarray:
+    """
+    Get the start positions of the windows of `window()`
+    for an array of the given length (at least `n_samples`).
+    Windows end at `starts + n_samples`.
+    """
+    # Distance between window starts
+    step = gap_samples if rolling else n_samples + gap_samples
+
+    # Number of windows that fit in the array
+    # The last window does not need the trailing gap
+    n_windows = (length - n_samples) // step + 1
+
+    starts = np.arange(n_windows, dtype=np.int64) * step
+    if reverse_direction:
+        # Start from the last window and step backwards
+        starts = (length - n_samples) - starts
+    return starts
+
+
+def _read_only(x: np.ndarray) -> np.ndarray:
+    """Get a read-only view of an array."""
+    x = x.view()
+    x.flags.writeable = False
+    return x
+
+
+def _check_window_args(
+    size: int,
+    gap: int,
+    sample_rate: int,
+    rolling: bool,
+    reverse_direction: bool,
+    discard_shorts: bool,
+) -> None:
+    """Check the arguments shared by the windowing functions."""
+    if not isinstance(size, int):
+        raise ValueError("size must be an integer")
+    if not isinstance(gap, int):
+        raise ValueError("gap must be an integer")
+    if not isinstance(sample_rate, int):
+        raise ValueError("sample_rate must be an integer")
+    if not isinstance(rolling, bool):
+        raise ValueError("rolling must be a bool")
+    if not isinstance(reverse_direction, bool):
+        raise ValueError("reverse_direction must be a bool")
+    if not isinstance(discard_shorts, bool):
+        raise ValueError("discard_shorts must be a bool")
+
+    if size < 1:
+        raise ValueError("size must be at least 1")
+    if sample_rate < 1:
+        raise ValueError("sample_rate must be at least 1")
+    if gap < 0:
+        raise ValueError(f"gap was negative: {gap}")
+    if rolling and gap < 1:
+        raise ValueError("gap must be at least 1 when creating rolling windows")
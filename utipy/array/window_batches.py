@@ -0,0 +1,136 @@
+"""
+@author: ludvigolsen
+"""
+
+import pathlib
+from typing import Iterator, Union
+import numpy as np
+from .window import _check_window_args, _window_view
+
+
+def window_batches(
+    x: Union[str, pathlib.Path, np.ndarray],
+    size: int = 2,
+    gap: int = 1,
+    sample_rate: int = 1,
+    rolling: bool = True,
+    reverse_direction: bool = False,
+    discard_shorts: bool = True,
+    batch_size: int = 1024,
+) -> Iterator[np.ndarray]:
+    """
+
+    Splits an array, e.g., a memory-mapped time series, into rolling (optional) windows
+    and yields them in batches.
+
+    Gives the same windows as `window()` but only reads
+    `batch_size` windows into memory at a time. When `x` is a
+    `np.memmap` or a path to a `.npy` file (opened in read-only
+    memory-mapped mode), peak memory depends on the batch size
+    and not on the size of the file.
+
+    Parameters
+    ----------
+    x : str, pathlib.Path, np.ndarray
+        The 1D time series array to window or the path to a `.npy` file with it.
+        Memory-mapped arrays (`np.memmap` or `np.load(..., mmap_mode='r')`)
+        are windowed without being loaded into memory.
+    size : int
+        Window size
+    gap : int
+        Gap size.
+    sample_rate : int
+        Size and gap will be multiplied by the given sample rate
+        allowing you to specify those in seconds instead of samples.
+    rolling : bool
+        Use rolling windows.
+        If False:
+            Will grab "size * sample_rate" elements greedily.
+            Be aware of the gap setting that defaults to 1.
+    reverse_direction : bool
+        Start from the end of the array instead of the beginning.
+        Does not change order of elements within windows.
+    discard_shorts: bool
+        If the given array is shorter than size*sample_rate,
+        yield nothing (True) or yield `x` as a single window (False).
+    batch_size : int
+        Maximum number of windows per batch.
+
+    Yields
+    ------
+    np.ndarray
+        2D array of shape `(<= batch_size, size*sample_rate)`.
+        Each batch is an in-memory copy, so it can be modified
+        and does not keep the file open.
+
+    Examples
+    --------
+
+    >>> for batch in window_batches("recording.npy", size=250, gap=125, batch_size=4096):
+    ...     features = batch.mean(axis=1)
+
+    """
+
+    if isinstance(x, (str, pathlib.Path)):
+        x = np.load(x, mmap_mode="r")
+    if not isinstance(x, np.ndarray):
+        raise TypeError(
+            f"`x` must be a path or a numpy array but had type: {type(x)}"
+        )
+    if x.ndim != 1:
+        raise ValueError("`x` must be a 1D array")
+
+    _check_window_args(
+        size=size,
+        gap=gap,
+        sample_rate=sample_rate,
+        rolling=rolling,
+        reverse_direction=reverse_direction,
+        discard_shorts=discard_shorts,
+    )
+    if not isinstance(batch_size, int):
+        raise ValueError("batch_size must be an integer")
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1")
+
+    # Validation happens on call, reading on iteration
+    return _window_batches(
+        x=x,
+        n_samples=size * sample_rate,
+        gap_samples=gap * sample_rate,
+        rolling=rolling,
+        reverse_direction=reverse_direction,
+        discard_shorts=discard_shorts,
+        batch_size=batch_size,
+    )
+
+
+def _window_batches(
+    x: np.ndarray,
+    n_samples: int,
+    gap_samples: int,
+    rolling: bool,
+    reverse_direction: bool,
+    discard_shorts: bool,
+    batch_size: int,
+) -> Iterator[np.ndarray]:
+
+    # If the array is too short
+    if len(x) < n_samples:
+        if not discard_shorts:
+            yield np.array(x[np.newaxis])
+        return
+
+    # Strided view of the windows
+    # Nothing is read from x yet
+    windows, n_windows = _window_view(
+        x,
+        n_samples=n_samples,
+        gap_samples=gap_samples,
+        rolling=rolling,
+        reverse_direction=reverse_direction,
+    )
+
+    # Read one batch of windows at a time
+    for batch_start in range(0, n_windows, batch_size):
+        yield np.array(windows[batch_start : batch_start + batch_size])
@@ -0,0 +1,105 @@
+"""
+@author: ludvigolsen
+"""
+
+from numbers import Integral
+from typing import Tuple, Union
+import numpy as np
+import pandas as pd
+from .window import _check_window_args, _window_starts
+
+
+def window_indices(
+    x: Union[int, list, np.ndarray, pd.Series, pd.DataFrame],
+    size: int = 2,
+    gap: int = 1,
+    sample_rate: int = 1,
+    rolling: bool = True,
+    reverse_direction: bool = False,
+    discard_shorts: bool = True,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+
+    Gets the start and stop positions of the windows `window()` would create.
+
+    Nothing is sliced or copied, so the positions can be used to
+    slice lazily (e.g., with `data.iloc[start:stop]`) or be passed
+    to vectorized code. Only two integer arrays are created,
+    so tens of millions of windows are cheap.
+
+    Parameters
+    ----------
+    x : int, list, np.ndarray, pd.Series, pd.DataFrame
+        The time series array to window or its length.
+        Windows are along the first axis (rows of data frames).
+    size : int
+        Window size
+    gap : int
+        Gap size.
+    sample_rate : int
+        Size and gap will be multiplied by the given sample rate
+        allowing you to specify those in seconds instead of samples.
+    rolling : bool
+        Use rolling windows.
+        If False:
+            Will grab "size * sample_rate" elements greedily.
+            Be aware of the gap setting that defaults to 1.
+    reverse_direction : bool
+        Start from the end of the array instead of the beginning.
+        Does not change order of elements within windows.
+    discard_shorts: bool
+        If the given array is shorter than size*sample_rate,
+        return no windows (True) or a single window with all of `x` (False).
+
+    Returns
+    -------
+    np.ndarray
+        Start positions (inclusive) as int64.
+    np.ndarray
+        Stop positions (exclusive) as int64.
+
+    Examples
+    --------
+
+    >>> starts, stops = window_indices(df, size=4, gap=2)
+    >>> first_window = df.iloc[starts[0]:stops[0]]
+
+    """
+
+    if isinstance(x, Integral) and not isinstance(x, bool):
+        length = int(x)
+        if length < 0:
+            raise ValueError(f"length of `x` was negative: {length}")
+    elif isinstance(x, (list, tuple, np.ndarray, pd.Series, pd.DataFrame)):
+        length = len(x)
+    else:
+        raise TypeError(
+            f"`x` must be an integer or an array-like object but had type: {type(x)}"
+        )
+
+    _check_window_args(
+        size=size,
+        gap=gap,
+        sample_rate=sample_rate,
+        rolling=rolling,
+        reverse_direction=reverse_direction,
+        discard_shorts=discard_shorts,
+    )
+
+    n_samples = size * sample_rate
+
+    # If the array is too short
+    if length < n_samples:
+        if discard_shorts:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+        return np.zeros(1, dtype=np.int64), np.full(1, length, dtype=np.int64)
+
+    starts = _window_starts(
+        length,
+        n_samples=n_samples,
+        gap_samples=gap * sample_rate,
+        rolling=rolling,
+        reverse_direction=reverse_direction,
+    )
+
+    return starts, starts + n_samples
@@ -0,0 +1,190 @@
+"""
+@author: ludvigolsen
+"""
+
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing import shared_memory
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union, cast
+import numpy as np
+import pandas as pd
+from utipy.utils.check_instance import check_instance
+from utipy.utils.convert_to_type import convert_to_type
+from .window import _check_window_args
+from .window_indices import window_indices
+
+
+def window_map(
+    x: Union[list, np.ndarray, pd.Series],
+    fn: Callable[[np.ndarray], Any],
+    size: int = 2,
+    gap: int = 1,
+    sample_rate: int = 1,
+    rolling: bool = True,
+    reverse_direction: bool = False,
+    discard_shorts: bool = True,
+    workers: int = 1,
+    backend: str = "process",
+    batch_size: Optional[int] = None,
+) -> List[Any]:
+    """
+
+    Applies a function to each window of an array, optionally in parallel.
+
+    Gives the same windows as `window()`. With the `'process'` backend,
+    `x` is copied to shared memory once and only the window
+    positions are sent to the worker processes.
+
+    Parameters
+    ----------
+    x : list, np.ndarray, pd.Series
+        The time series array to window.
+        Windows are along the first axis.
+    fn : callable
+        Function to apply to each window (`np.ndarray`).
+        E.g., a feature extractor.
+        Must be picklable (e.g., defined at the top level
+        of a module) with the `'process'` backend.
+    size : int
+        Window size
+    gap : int
+        Gap size.
+    sample_rate : int
+        Size and gap will be multiplied by the given sample rate
+        allowing you to specify those in seconds instead of samples.
+    rolling : bool
+        Use rolling windows.
+        If False:
+            Will grab "size * sample_rate" elements greedily.
+            Be aware of the gap setting that defaults to 1.
+    reverse_direction : bool
+        Start from the end of the array instead of the beginning.
+        Does not change order of elements within windows.
+    discard_shorts: bool
+        If the given array is shorter than size*sample_rate,
+        apply `fn` to no windows (True) or to `x` (False).
+    workers : int
+        Number of worker processes/threads.
+        When `1`, `fn` is applied in the current process.
+    backend : str
+        How to run the workers. One of:
+            'process': Worker processes with `x` in shared memory.
+                       Best for functions that hold the GIL.
+            'thread': Worker threads in the current process.
+                      Best for functions that release the GIL (e.g., most numpy code).
+    batch_size : int or None
+        Number of windows sent to a worker at a time.
+        When `None`, the windows are split into
+        about 4 batches per worker.
+
+    Returns
+    -------
+    list
+        The outputs of `fn` in window order.
+
+    Examples
+    --------
+
+    >>> window_map(x, fn=np.median, size=250, gap=125, workers=4)
+
+    """
+
+    _ = check_instance(x)
+    x = cast(np.ndarray, convert_to_type(x, "np.ndarray"))
+
+    _check_window_args(
+        size=size,
+        gap=gap,
+        sample_rate=sample_rate,
+        rolling=rolling,
+        reverse_direction=reverse_direction,
+        discard_shorts=discard_shorts,
+    )
+    if not callable(fn):
+        raise TypeError("`fn` must be callable")
+    if not isinstance(workers, int):
+        raise ValueError("workers must be an integer")
+    if workers < 1:
+        raise ValueError("workers must be at least 1")
+    if backend not in ["process", "thread"]:
+        raise ValueError(f"`backend` must be 'process' or 'thread' but was: {backend}")
+    if batch_size is not None:
+        if not isinstance(batch_size, int):
+            raise ValueError("batch_size must be an integer or None")
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+
+    starts, stops = window_indices(
+        x,
+        size=size,
+        gap=gap,
+        sample_rate=sample_rate,
+        rolling=rolling,
+        reverse_direction=reverse_direction,
+        discard_shorts=discard_shorts,
+    )
+
+    if workers == 1 or len(starts) < 2:
+        return [fn(x[start:stop]) for start, stop in zip(starts, stops)]
+
+    # Split the windows into batches
+    if batch_size is None:
+        batch_size = -(-len(starts) // (workers * 4))
+    batches = [
+        (starts[i : i + batch_size], stops[i : i + batch_size])
+        for i in range(0, len(starts), batch_size)
+    ]
+
+    if backend == "thread":
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            batch_outputs = executor.map(
+                lambda batch: _apply_to_batch(x, fn, *batch), batches
+            )
+            return [output for outputs in batch_outputs for output in outputs]
+
+    if x.dtype.hasobject:
+        raise ValueError(
+            "`x` cannot have object dtype with the 'process' backend. "
+            "Use the 'thread' backend instead."
+        )
+
+    # Copy x to shared memory once
+    shm = shared_memory.SharedMemory(create=True, size=max(x.nbytes, 1))
+    try:
+        np.ndarray(x.shape, dtype=x.dtype, buffer=shm.buf)[...] = x
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(shm.name, x.shape, x.dtype, fn),
+        ) as executor:
+            batch_outputs = executor.map(_apply_in_worker, batches)
+            return [output for outputs in batch_outputs for output in outputs]
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+# State of a worker process
+# Set once per process by `_init_worker()`
+_worker_state: Dict[str, Any] = {}
+
+
+def _init_worker(
+    shm_name: str, shape: Tuple[int, ...], dtype: np.dtype, fn: Callable
+) -> None:
+    """Attach a worker process to the shared memory with `x`."""
+    # Workers share the resource tracker of the creating process,
+    # which unlinks the shared memory when done
+    shm = shared_memory.SharedMemory(name=shm_name)
+    _worker_state["shm"] = shm
+    _worker_state["x"] = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+    _worker_state["fn"] = fn
+
+
+def _apply_in_worker(batch: Tuple[np.ndarray, np.ndarray]) -> List[Any]:
+    return _apply_to_batch(_worker_state["x"], _worker_state["fn"], *batch)
+
+
+def _apply_to_batch(
+    x: np.ndarray, fn: Callable, starts: np.ndarray, stops: np.ndarray
+) -> List[Any]:
+    return [fn(x[start:stop]) for start, stop in zip(starts, stops)]
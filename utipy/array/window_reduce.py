@@ -0,0 +1,289 @@
+"""
+@author: ludvigolsen
+"""
+
+from typing import Union, cast
+import numpy as np
+import pandas as pd
+from utipy.utils.check_instance import check_instance
+from utipy.utils.convert_to_type import convert_to_type
+from .window import _check_window_args, _window_starts
+
+
+# The numpy functions that give the same result as the stats
+_STAT_FNS = {
+    "sum": np.sum,
+    "mean": np.mean,
+    "var": np.var,
+    "std": np.std,
+    "min": np.min,
+    "max": np.max,
+}
+
+
+def window_reduce(
+    x: Union[list, np.ndarray, pd.Series],
+    size: int = 2,
+    gap: int = 1,
+    sample_rate: int = 1,
+    stat: str = "mean",
+    rolling: bool = True,
+    reverse_direction: bool = False,
+    discard_shorts: bool = True,
+    axis: int = 0,
+) -> np.ndarray:
+    """
+
+    Calculates a statistic (e.g., the mean) of each window of an array.
+
+    Gives the same windows as `window()` but calculates the statistic
+    for all windows at once in O(n) time without creating the windows.
+    The array is split into blocks of the window size. Sums, means and
+    variances use cumulative sums that restart in every block and minimums
+    and maximums use the block-wise van Herk/Gil-Werman algorithm, so the
+    cost does not depend on the window size. Floating point results can differ
+    from `np.mean()`, etc. of each window by rounding errors that
+    depend on the window size but not on the position in the array.
+
+    Parameters
+    ----------
+    x : list, np.ndarray, pd.Series
+        The time series array to window.
+        N-D arrays are windowed along `axis`.
+    size : int
+        Window size
+    gap : int
+        Gap size.
+    sample_rate : int
+        Size and gap will be multiplied by the given sample rate
+        allowing you to specify those in seconds instead of samples.
+    stat : str
+        The statistic to calculate per window. One of:
+            'sum', 'mean', 'var', 'std', 'min', 'max'.
+        Variances are population variances (`ddof=0`) as in `np.var()`.
+    rolling : bool
+        Use rolling windows.
+        If False:
+            Will grab "size * sample_rate" elements greedily.
+            Be aware of the gap setting that defaults to 1.
+    reverse_direction : bool
+        Start from the end of the array instead of the beginning.
+        Does not change order of elements within windows.
+    discard_shorts: bool
+        If the given array is shorter than size*sample_rate,
+        return an empty array (True) or the statistic of `x` (False).
+    axis : int
+        The axis to window along.
+
+    Returns
+    -------
+    np.ndarray
+        The statistic per window with shape `(n_windows, *other_dims)`,
+        where `other_dims` are the dimensions of `x` except `axis`.
+
+    Examples
+    --------
+
+    >>> window_reduce([1, 2, 3, 4, 5, 6], size=2, gap=2, stat="mean")
+    array([1.5, 3.5, 5.5])
+
+    """
+
+    _ = check_instance(x)
+    x = cast(np.ndarray, convert_to_type(x, "np.ndarray"))
+
+    _check_window_args(
+        size=size,
+        gap=gap,
+        sample_rate=sample_rate,
+        rolling=rolling,
+        reverse_direction=reverse_direction,
+        discard_shorts=discard_shorts,
+    )
+    if stat not in _STAT_FNS:
+        raise ValueError(
+            f"`stat` must be one of {list(_STAT_FNS.keys())} but was: {stat}"
+        )
+    if not isinstance(axis, int):
+        raise ValueError("axis must be an integer")
+    if not -max(x.ndim, 1) <= axis < max(x.ndim, 1):
+        raise ValueError(f"axis {axis} is out of bounds for array of dimension {x.ndim}")
+
+    # Reduce along the first axis
+    x = np.moveaxis(np.atleast_1d(x), axis, 0)
+
+    n_samples = size * sample_rate
+    gap_samples = gap * sample_rate
+
+    # If the array is too short
+    if len(x) < n_samples:
+        if discard_shorts:
+            return np.empty((0,) + x.shape[1:])
+        return np.asarray(_STAT_FNS[stat](x, axis=0))[np.newaxis]
+
+    starts = _window_starts(
+        len(x),
+        n_samples=n_samples,
+        gap_samples=gap_samples,
+        rolling=rolling,
+        reverse_direction=reverse_direction,
+    )
+
+    if stat in ["min", "max"]:
+        return _window_extremes(
+            x, starts=starts, n_samples=n_samples, find_max=stat == "max"
+        )
+
+    sums = _window_sums(x, starts=starts, n_samples=n_samples)
+    if stat == "sum":
+        return sums
+
+    means = sums / n_samples
+    if stat == "mean":
+        return means
+
+    variances = _window_variances(x, starts=starts, n_samples=n_samples)
+    if stat == "var":
+        return variances
+    return np.sqrt(variances)
+
+
+def _window_sums(x: np.ndarray, starts: np.ndarray, n_samples: int) -> np.ndarray:
+    """
+    Get the sum of each window (along the first axis) with block-wise cumulative sums.
+    Non-finite values are counted separately, as they would
+    otherwise spill into the other windows of their block.
+    """
+    if x.dtype.kind in "biu":
+        # Exact integer sums
+        return np.add(*_window_parts(x.astype(np.int64), starts, n_samples))
+
+    x = x.astype(np.float64, copy=False)
+    non_finite = ~np.isfinite(x)
+    if not non_finite.any():
+        return np.add(*_window_parts(x, starts, n_samples))
+
+    sums = np.add(*_window_parts(np.where(non_finite, 0.0, x), starts, n_samples))
+
+    # Add the non-finite values the way np.sum() would
+    n_nans = np.add(*_window_parts(np.isnan(x), starts, n_samples))
+    n_pos_infs = np.add(*_window_parts(x == np.inf, starts, n_samples))
+    n_neg_infs = np.add(*_window_parts(x == -np.inf, starts, n_samples))
+    sums[n_pos_infs > 0] = np.inf
+    sums[n_neg_infs > 0] = -np.inf
+    sums[(n_nans > 0) | ((n_pos_infs > 0) & (n_neg_infs > 0))] = np.nan
+    return sums
+
+
+def _window_variances(
+    x: np.ndarray, starts: np.ndarray, n_samples: int
+) -> np.ndarray:
+    """
+    Get the (population) variance of each window (along the first axis).
+
+    Each block of `n_samples` elements is centered by its own mean
+    to reduce the loss of precision from cancellation.
+    The part of a window in the next block is shifted to the center
+    of the block of its start, so the rounding errors only depend
+    on the values in the two blocks.
+    Constant windows get variances of exactly 0.
+    Windows with non-finite values get NaN variances, as in `np.var()`.
+    """
+    # Constant windows (minimum equals maximum)
+    # Rounding errors would otherwise give them tiny positive variances
+    is_constant = _window_extremes(
+        x, starts=starts, n_samples=n_samples, find_max=False
+    ) == _window_extremes(x, starts=starts, n_samples=n_samples, find_max=True)
+
+    x = x.astype(np.float64, copy=False)
+    finite = np.isfinite(x)
+    x = np.where(finite, x, 0.0)
+
+    # Mean of the finite values in each block
+    n_blocks = -(-len(x) // n_samples)
+    padding = [(0, n_blocks * n_samples - len(x))] + [(0, 0)] * (x.ndim - 1)
+    block_shape = (n_blocks, n_samples) + x.shape[1:]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        centers = np.nan_to_num(
+            np.pad(x, padding).reshape(block_shape).sum(axis=1)
+            / np.pad(finite, padding).reshape(block_shape).sum(axis=1)
+        )
+    centered = np.where(finite, x - np.repeat(centers, n_samples, axis=0)[: len(x)], 0.0)
+
+    # Sums of the deviations and squared deviations
+    # in the block of the start (left) and the next block (right)
+    left, right = _window_parts(centered, starts, n_samples)
+    left_sq, right_sq = _window_parts(centered**2, starts, n_samples)
+
+    # Shift the right parts to the center of the left block
+    n_right = (starts % n_samples).reshape((-1,) + (1,) * (x.ndim - 1))
+    block = starts // n_samples
+    shift = centers[np.minimum(block + 1, n_blocks - 1)] - centers[block]
+    shift[n_right.reshape(-1) == 0] = 0
+    deviations = left + right + n_right * shift
+    squares = left_sq + right_sq + 2 * shift * right + n_right * shift**2
+
+    variances = np.maximum(squares / n_samples - (deviations / n_samples) ** 2, 0)
+    variances[is_constant] = 0
+    n_non_finite = np.add(*_window_parts(~finite, starts, n_samples))
+    variances[n_non_finite > 0] = np.nan
+    return variances
+
+
+def _window_parts(x: np.ndarray, starts: np.ndarray, n_samples: int) -> tuple:
+    """
+    Get the sums of the two parts of each window (along the first axis).
+
+    The array is split into blocks of `n_samples` elements, as in
+    `_window_extremes()`, with cumulative sums that restart in every block.
+    The left part is the sum from the start of the window to the end of its block
+    (suffix) and the right part is the sum from the start of the next block
+    to the end of the window (prefix). The right part is 0 when
+    the window starts at the beginning of a block.
+    The rounding errors thus depend on the window size, not on
+    the position in the array.
+    """
+    if x.dtype == bool:
+        x = x.astype(np.int64)
+    n_blocks = -(-len(x) // n_samples)
+    padding = [(0, n_blocks * n_samples - len(x))] + [(0, 0)] * (x.ndim - 1)
+    blocks = np.pad(x, padding).reshape((n_blocks, n_samples) + x.shape[1:])
+
+    prefix = np.cumsum(blocks, axis=1).reshape((-1,) + x.shape[1:])
+    suffix = np.cumsum(blocks[:, ::-1], axis=1)[:, ::-1].reshape((-1,) + x.shape[1:])
+
+    left = suffix[starts]
+    right = prefix[starts + n_samples - 1]
+    right[starts % n_samples == 0] = 0
+    return left, right
+
+
+def _window_extremes(
+    x: np.ndarray, starts: np.ndarray, n_samples: int, find_max: bool
+) -> np.ndarray:
+    """
+    Get the minimum or maximum of each window (along the first axis)
+    with the van Herk/Gil-Werman algorithm.
+
+    The array is split into blocks of `n_samples` elements.
+    Any window covers the end of one block and the start of the next,
+    so its extreme is the extreme of the running extremes
+    from the right (suffix) and from the left (prefix).
+    """
+    fn = np.maximum if find_max else np.minimum
+
+    # Pad to a whole number of blocks
+    # The padding is never part of a window
+    n_blocks = -(-len(x) // n_samples)
+    padding = [(0, n_blocks * n_samples - len(x))] + [(0, 0)] * (x.ndim - 1)
+    blocks = np.pad(x, padding, mode="edge").reshape(
+        (n_blocks, n_samples) + x.shape[1:]
+    )
+
+    # Running extremes from the start and end of each block
+    prefix = fn.accumulate(blocks, axis=1).reshape((-1,) + x.shape[1:])
+    suffix = fn.accumulate(blocks[:, ::-1], axis=1)[:, ::-1].reshape(
+        (-1,) + x.shape[1:]
+    )
+
+    return fn(suffix[starts], prefix[starts + n_samples - 1])
@@ -2,7 +2,7 @@
 @author: ludvigolsen
 """
 
-from typing import Union, cast
+from typing import Optional, Union, cast
 import numpy as np
 import pandas as pd
 from utipy.utils.check_instance import check_instance
@@ -10,7 +10,10 @@ from utipy.utils.convert_to_type import convert_to_type
 
 
 def windowed_reverse(
-    x: Union[list, np.ndarray, pd.Series], wsize: int = 2
+    x: Union[list, np.ndarray, pd.Series],
+    wsize: int = 2,
+    axis: int = 0,
+    out: Optional[np.ndarray] = None,
 ) -> Union[list, np.ndarray, pd.Series]:
     """Reverse / flip windows of array
 
@@ -20,11 +23,17 @@ def windowed_reverse(
         The array to reverse
     wsize: int
         Window size
+    axis : int
+        The axis to reverse windows along.
+    out : np.ndarray or None
+        Array to write the result to. Must have the same shape as `x`.
+        Pass `x` itself to reverse a `np.ndarray` in-place.
 
     Returns
     -------
     list, np.ndarray, pd.Series
-        Window reversed array with the type of the original
+        Window reversed array with the type of the original.
+        When `out` is specified, `out` is returned.
 
     Examples
     --------
@@ -40,14 +49,74 @@ def windowed_reverse(
     if wsize < 1:
         raise ValueError(f"wsize must be at least 1 but was: {wsize}")
 
-    # Window and reverse
-    reversed_windows = [x[pos : pos + wsize][::-1] for pos in range(len(x))[::wsize]]
+    arr = cast(np.ndarray, convert_to_type(x, "np.ndarray"))
+    if not isinstance(axis, int):
+        raise TypeError(f"axis must be an int but had type: {type(axis)}")
+    if not -max(arr.ndim, 1) <= axis < max(arr.ndim, 1):
+        raise ValueError(
+            f"axis {axis} is out of bounds for array of dimension {arr.ndim}"
+        )
 
-    # Flatten windows
-    flattened_array = np.concatenate(reversed_windows)
+    in_place = False
+    return_out = out is not None
+    if out is None:
+        out = np.empty_like(arr)
+    else:
+        if not isinstance(out, np.ndarray):
+            raise TypeError(f"out must be a numpy array but had type: {type(out)}")
+        if out.shape != arr.shape:
+            raise ValueError(
+                f"out must have the same shape as x ({arr.shape}) but had: {out.shape}"
+            )
+        if np.may_share_memory(out, arr):
+            if not (out.__array_interface__ == arr.__array_interface__):
+                raise ValueError("out must be x itself or not overlap with x")
+            in_place = True
+
+    # Reverse along the first axis
+    src = np.moveaxis(arr, axis, 0)
+    dst = np.moveaxis(out, axis, 0)
+
+    # Full windows as (n_windows, wsize, ...) views
+    n_windows = len(src) // wsize
+    n_full = n_windows * wsize
+    src_windows = _as_windows(src[:n_full], n_windows, wsize)
+    dst_windows = _as_windows(dst[:n_full], n_windows, wsize)
+
+    if in_place:
+        # Swap along the shortest dimension to limit
+        # the temporary copies to that of a single slice
+        if n_windows < wsize // 2:
+            for w in range(n_windows):
+                dst_windows[w] = dst_windows[w, ::-1].copy()
+        else:
+            for i in range(wsize // 2):
+                tmp = dst_windows[:, i].copy()
+                dst_windows[:, i] = dst_windows[:, wsize - 1 - i]
+                dst_windows[:, wsize - 1 - i] = tmp
+        dst[n_full:] = dst[n_full:][::-1].copy()
+    else:
+        dst_windows[...] = src_windows[:, ::-1]
+        # Remaining elements form a shorter window
+        dst[n_full:] = src[n_full:][::-1]
+
+    if return_out:
+        return out
 
     # Convert to original type (np.ndarray, list, pd.Series)
     return cast(
         Union[list, np.ndarray, pd.Series],
-        convert_to_type(flattened_array, instance_type),
+        convert_to_type(out, instance_type),
+    )
+
+
+def _as_windows(x: np.ndarray, n_windows: int, wsize: int) -> np.ndarray:
+    """
+    View the first axis of `x` as (n_windows, wsize).
+    Unlike `reshape()`, this never copies, so the view can be written to.
+    """
+    return np.lib.stride_tricks.as_strided(
+        x,
+        shape=(n_windows, wsize) + x.shape[1:],
+        strides=(wsize * x.strides[0],) + x.strides,
     )
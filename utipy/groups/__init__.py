@@ -1,6 +1,69 @@
 # groups __init__.py
 
-from .fold import fold
-from .group_uniques import group_uniques
-from .group import group
-from .partition import partition
+import importlib
+import sys
+import types
+from typing import TYPE_CHECKING
+
+# The functions and classes are imported when they are first used,
+# so the array versions can be imported without importing pandas
+_LAZY_IMPORTS = {
+    "fold": ".fold",
+    "fold_array": ".fold_array",
+    "fold_hash": ".fold_hash",
+    "fold_repeated": ".fold_repeated",
+    "FoldSplitter": ".fold_splitter",
+    "group_uniques": ".group_uniques",
+    "group_uniques_array": ".group_uniques_array",
+    "group": ".group",
+    "group_array": ".group_array",
+    "LazyPartitions": ".lazy_partitions",
+    "partition": ".partition",
+    "partition_array": ".partition_array",
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+# Subpackages are imported when they are first used as well
+_SUBPACKAGES = ["methods"]
+
+
+def __getattr__(name: str):
+    if name in _SUBPACKAGES:
+        return importlib.import_module("." + name, __name__)
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
+
+
+class _GroupsModule(types.ModuleType):
+    def __setattr__(self, name: str, value) -> None:
+        # Importing a submodule sets it as an attribute of the package
+        # Keep the function of the same name instead (e.g., `fold` from `.fold`)
+        if isinstance(value, types.ModuleType) and _LAZY_IMPORTS.get(name) == "." + name:
+            value = getattr(value, name)
+        super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _GroupsModule
+
+
+if TYPE_CHECKING:
+    from .fold import fold
+    from .fold_array import fold_array
+    from .fold_hash import fold_hash
+    from .fold_repeated import fold_repeated
+    from .fold_splitter import FoldSplitter
+    from .group_uniques import group_uniques
+    from .group_uniques_array import group_uniques_array
+    from .group import group
+    from .group_array import group_array
+    from .lazy_partitions import LazyPartitions
+    from .partition import partition
+    from .partition_array import partition_array
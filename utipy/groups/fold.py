@@ -4,10 +4,10 @@
 
 from typing import Optional, Union
 from numbers import Number
+import numpy as np
 import pandas as pd
-from utipy.pandas import subset_by_levels
-from .group_uniques import group_uniques
-from .group import group
+from .methods.factorize import _factorize
+from .methods.strata import _fold_codes
 
 
 def fold(
@@ -17,6 +17,8 @@ def fold(
     cat_col: Optional[str] = None,
     return_factor: bool = False,
     copy: bool = True,
+    seed: Optional[Union[int, np.random.Generator]] = None,
+    num_col: Optional[str] = None,
 ) -> Union[pd.DataFrame, pd.Series]:
     """
     Create balanced folds.
@@ -25,54 +27,64 @@ def fold(
     an ID (e.g., participant id) are kept in the
     same folds.
 
-    """
-    if copy:
-        data = data.copy()
+    Balance on a numeric column with `num_col`.
+    The rows (or IDs by their mean value) are sorted
+    by the column and assigned to the folds in a
+    serpentine order (1..n, n..1, ...) within each
+    level of `cat_col`.
+
+    The folds are randomized with `seed`
+    (a seed or `numpy.random.Generator`).
+    Row order is kept.
 
-    # Create temporary index that we will
-    # use to reorder the dataframe later
-    data[".sorting_index"] = range(len(data))
+    """
+    group_ids = _fold_factor(
+        data, n=n, id_col=id_col, cat_col=cat_col, seed=seed, num_col=num_col
+    )
 
-    # If user specified id_col
-    if id_col is not None:
-        # And if user specified cat_col
-        if cat_col is not None:
-            # Subset data by levels of categorical column
-            cat_subsets = subset_by_levels(data, cat_col)
+    # If return factor is True
+    if return_factor:
+        # Only the return the grouping factor
+        return pd.Series(group_ids, index=data.index, name="group")
 
-            # Create groups for each subset based on unique values in id_col
-            # Concatenate subsets with the new grouping factor
-            data = pd.concat([group_uniques(data, n, id_col) for data in cat_subsets])
+    if copy:
+        data = data.copy()
 
-        else:
-            # Create groups based on unique values in id_col
-            data = group_uniques(data, n, id_col, copy=False)
+    # Add grouping factor to data
+    data["group"] = group_ids
 
-    else:
-        # If user specified cat_col (but not id_col)
-        if cat_col is not None:
-            # Subset data by levels of categorical column
-            cat_subsets = subset_by_levels(data, cat_col)
+    return data
 
-            # Group each subset and concatenate subsets
-            data = pd.concat([group(data, n, cat_col) for data in cat_subsets])
 
-        # If neither id_col or cat_col is specified
-        else:
-            # Group data by the first column in data
-            # group() does this automatically if not
-            # given a column.
-            data = group(data, n, copy=False)
+def _fold_factor(
+    data: pd.DataFrame,
+    n: Number,
+    id_col: Optional[str],
+    cat_col: Optional[str],
+    seed: Optional[Union[int, np.random.Generator]],
+    num_col: Optional[str] = None,
+) -> np.ndarray:
+    """
+    Create the grouping factor of `fold()` in a single pass.
 
-    # Sort data by the sorting index
-    # and remove the sorting index
-    data = data.sort_values(".sorting_index").drop(".sorting_index", axis=1)
+    The units (unique IDs within each level of `cat_col` or rows)
+    are divided into `n` folds with `_n_dist()` within each level
+    or in serpentine order of `num_col`.
+    """
+    return _fold_codes(
+        n_rows=len(data),
+        n=n,
+        id_codes=_factorize(data[id_col]) if id_col is not None else None,
+        cat_codes=_factorize(data[cat_col]) if cat_col is not None else None,
+        values=_num_col_values(data, num_col) if num_col is not None else None,
+        rng=np.random.default_rng(seed),
+    )
 
-    # If return factor is True
-    if return_factor:
-        # Only the return the grouping factor
-        return data["group"]
 
-    else:
-        # Return data
-        return data
+def _num_col_values(data: pd.DataFrame, num_col: str) -> np.ndarray:
+    """Get the values of `num_col` as floats."""
+    if not pd.api.types.is_numeric_dtype(data[num_col]):
+        raise TypeError(
+            f"`num_col` must be a numeric column but had dtype: {data[num_col].dtype}"
+        )
+    return data[num_col].to_numpy(dtype=float, na_value=np.nan)
@@ -0,0 +1,74 @@
+"""
+@author: ludvigolsen
+"""
+
+from numbers import Number
+from typing import Hashable, Optional, Union
+import numpy as np
+from .methods.arrays import ArrayData, _factorize_array, _get_column, _num_rows
+from .methods.strata import _fold_codes
+
+
+def fold_array(
+    data: ArrayData,
+    n: Number = 5,
+    id_col: Optional[Hashable] = None,
+    cat_col: Optional[Hashable] = None,
+    seed: Optional[Union[int, np.random.Generator]] = None,
+    num_col: Optional[Hashable] = None,
+) -> np.ndarray:
+    """
+    Create balanced folds for the rows of arrays.
+    Balance on a categorical and/or numeric column
+    and/or make sure that datapoints that share
+    an ID (e.g., participant id) are kept in the
+    same folds.
+
+    Array version of `fold()` that does not use pandas.
+    Gives the same folds as `fold()` for the same seed.
+
+    Parameters
+    ----------
+    data : dict of 1D arrays or `numpy.ndarray`
+        The columns of the data. A 1D array is a single column.
+    n : int
+        Number of folds.
+    id_col : str, int or None
+        Key (dict) or index (2D array) of the ID column.
+        Rows with the same ID are put in the same fold.
+    cat_col : str, int or None
+        Key (dict) or index (2D array) of the categorical column
+        to balance the folds on.
+    seed : int, `numpy.random.Generator` or None
+        Seed for randomizing the folds.
+    num_col : str, int or None
+        Key (dict) or index (2D array) of the numeric column
+        to balance the folds on. See `fold()`.
+
+    Returns
+    -------
+    np.ndarray
+        Fold (1..n) of each row.
+
+    Examples
+    --------
+
+    >>> folds = fold_array({"id": ids, "diagnosis": diagnoses}, n=5,
+    ...                    id_col="id", cat_col="diagnosis", seed=1)
+    """
+    values = None
+    if num_col is not None:
+        values = _get_column(data, num_col)
+        if values.dtype.kind not in "biuf":
+            raise TypeError(
+                f"`num_col` must be a numeric column but had dtype: {values.dtype}"
+            )
+
+    return _fold_codes(
+        n_rows=_num_rows(data),
+        n=n,
+        id_codes=_factorize_array(_get_column(data, id_col)) if id_col is not None else None,
+        cat_codes=_factorize_array(_get_column(data, cat_col)) if cat_col is not None else None,
+        values=values,
+        rng=np.random.default_rng(seed),
+    )
@@ -0,0 +1,171 @@
+"""
+@author: ludvigolsen
+"""
+
+from numbers import Number
+from typing import Optional, Union
+import numpy as np
+import pandas as pd
+
+
+def fold_hash(
+    ids: Union[list, np.ndarray, pd.Series],
+    n: Number = 5,
+    salt: Optional[str] = None,
+) -> np.ndarray:
+    """
+    Assign IDs to folds by hashing them.
+
+    The same ID always gets the same fold, independent of
+    the other IDs, so data that is read in chunks
+    (e.g., with `pd.read_csv(chunksize=...)`) can be folded
+    one chunk at a time. The hash is deterministic
+    across chunks, processes and runs.
+
+    Unlike `fold()`, the folds are only balanced in expectation.
+    With few unique IDs, the fold sizes may differ.
+
+    Parameters
+    ----------
+    ids : list, `numpy.ndarray` or `pandas.Series`
+        ID of each row (e.g., the `id_col` column of a chunk).
+        Numbers are hashed by value, independent of their dtype,
+        so `1`, `1.0` and `np.int16(1)` get the same fold. This also holds
+        for numbers in object arrays with other types (e.g., strings).
+        Missing values (e.g., NaN and None) all get the same fold.
+        Other values (e.g., strings) are hashed by their string representation.
+    n : int
+        Number of folds.
+    salt : str or None
+        Changes the assignment of IDs to folds.
+        Use a different salt to get different folds.
+
+    Returns
+    -------
+    np.ndarray
+        Fold (1..n) of each ID.
+        The dtype is `int8` for up to 127 folds.
+
+    Examples
+    --------
+
+    >>> for chunk in pd.read_csv("data.csv", chunksize=100000):
+    ...     chunk["group"] = fold_hash(chunk["participant"], n=5, salt="split-1")
+    """
+    if not isinstance(n, Number) or int(n) != n or n < 1:
+        raise ValueError(f"`n` must be a positive integer but was: {n}")
+    if salt is not None and not isinstance(salt, str):
+        raise TypeError(f"`salt` must be a str or None but had type: {type(salt)}")
+    n = int(n)
+
+    hashes = _hash_ids(ids)
+    if salt is not None:
+        hashes ^= pd.util.hash_array(np.array([salt], dtype=object))[0]
+        hashes = _mix64(hashes)
+
+    dtype = np.int8 if n <= np.iinfo(np.int8).max else np.int16
+    return (hashes % np.uint64(n)).astype(dtype) + dtype(1)
+
+
+def _hash_ids(ids: Union[list, np.ndarray, pd.Series]) -> np.ndarray:
+    """Hash each ID to an uint64 by value."""
+    if isinstance(ids, pd.Series) and isinstance(ids.dtype, pd.CategoricalDtype):
+        # Categoricals are hashed by their categories
+        codes = ids.cat.codes.to_numpy()
+        category_hashes = _hash_values(ids.cat.categories.to_numpy())
+        hashes = category_hashes[codes] if len(category_hashes) \
+            else np.empty(len(codes), dtype=np.uint64)
+        hashes[codes == -1] = _hash_values(np.array([np.nan]))[0]
+        return hashes
+
+    if isinstance(ids, pd.Series) and not isinstance(ids.dtype, np.dtype):
+        # Extension dtypes (e.g., `Int64`) are hashed by their elements
+        values = ids.to_numpy(dtype=object)
+    else:
+        values = np.asarray(ids)
+    if values.ndim != 1:
+        raise ValueError(f"`ids` must be 1D but had shape: {values.shape}")
+    return _hash_values(values)
+
+
+def _hash_values(values: np.ndarray) -> np.ndarray:
+    """
+    Hash a 1D array by value.
+    Numbers are hashed as int64 / uint64 / float64 independent of their dtype,
+    with whole floats as integers.
+    """
+    kind = values.dtype.kind
+    if kind == "b":
+        values, kind = values.astype(np.int64), "i"
+    if kind in "iu":
+        # Non-negative values have the same bytes in int64 and uint64
+        return pd.util.hash_array(
+            values.astype(np.int64 if kind == "i" else np.uint64), categorize=False
+        )
+    if kind == "f":
+        values = values.astype(np.float64)
+        hashes = pd.util.hash_array(values, categorize=False)
+        # Whole numbers get the hash of the integer,
+        # as IDs may be read as floats in chunks with NaNs
+        is_int = (
+            np.isfinite(values)
+            & (np.mod(values, 1) == 0)
+            & (np.abs(values) < 2.0**63)
+        )
+        hashes[is_int] = pd.util.hash_array(values[is_int].astype(np.int64))
+        return hashes
+    if kind in "SU":
+        values = values.astype(object)
+    if values.dtype.kind == "O":
+        return _hash_objects(values)
+    return pd.util.hash_array(values, categorize=False)
+
+
+def _hash_objects(values: np.ndarray) -> np.ndarray:
+    """
+    Hash an object array by value.
+    Numbers are hashed as in numeric arrays and missing values as NaN,
+    so they get the same hashes with and without other types (e.g., strings).
+    """
+    is_missing = pd.isna(values)
+    if pd.api.types.infer_dtype(values, skipna=True) in ["string", "empty"]:
+        is_int = is_float = np.zeros(len(values), dtype=bool)
+    else:
+        is_int = np.fromiter(
+            (isinstance(value, (int, np.integer, np.bool_)) for value in values),
+            dtype=bool,
+            count=len(values),
+        )
+        is_float = ~is_missing & np.fromiter(
+            (isinstance(value, (float, np.floating)) for value in values),
+            dtype=bool,
+            count=len(values),
+        )
+
+    hashes = np.empty(len(values), dtype=np.uint64)
+    hashes[is_missing] = _hash_values(np.array([np.nan]))[0]
+    if is_int.any():
+        ints = np.array(values[is_int].tolist())
+        if ints.dtype.kind not in "biu":
+            # Too large for 64 bits
+            ints = ints.astype(str).astype(object)
+        hashes[is_int] = _hash_values(ints)
+    if is_float.any():
+        hashes[is_float] = _hash_values(values[is_float].astype(np.float64))
+    is_other = ~(is_missing | is_int | is_float)
+    if is_other.any():
+        # Strings and other values (by their string representation)
+        hashes[is_other] = pd.util.hash_array(values[is_other], categorize=False)
+    return hashes
+
+
+def _mix64(x: np.ndarray) -> np.ndarray:
+    """The 64-bit finalizer of SplitMix64."""
+    x = x.astype(np.uint64, copy=True)
+    with np.errstate(over="ignore"):
+        x ^= x >> np.uint64(30)
+        x *= np.uint64(0xBF58476D1CE4E5B9)
+        x ^= x >> np.uint64(27)
+        x *= np.uint64(0x94D049BB133111EB)
+        x ^= x >> np.uint64(31)
+    return x
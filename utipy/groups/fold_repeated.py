@@ -0,0 +1,148 @@
+"""
+@author: ludvigolsen
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from numbers import Number
+from typing import Any, Dict, Optional, Union
+import numpy as np
+import pandas as pd
+from .methods.factorize import _factorize
+from .methods.strata import _stratify, _unit_folds, _unit_means
+from .fold import _num_col_values
+
+
+def fold_repeated(
+    data: pd.DataFrame,
+    n: Number = 5,
+    repeats: int = 10,
+    id_col: Optional[str] = None,
+    cat_col: Optional[str] = None,
+    seed: Optional[Union[int, np.random.SeedSequence, np.random.Generator]] = None,
+    workers: int = 1,
+    num_col: Optional[str] = None,
+) -> np.ndarray:
+    """
+    Create balanced folds multiple times for repeated cross-validation.
+    Balance on a categorical column
+    and/or make sure that datapoints that share
+    an ID (e.g., participant id) are kept in the
+    same folds.
+
+    Balance on a numeric column with `num_col` (see `fold()`).
+
+    Gives the same kind of folds as `fold()` for each repetition.
+    The columns are factorized once and only the random
+    orders are drawn per repetition. Each repetition gets an
+    independent random stream from `seed` via `SeedSequence.spawn()`,
+    so results do not depend on the number of workers.
+
+    Parameters
+    ----------
+    data : pd.DataFrame
+        The data to create folds for. It is not copied or modified.
+    n : int
+        Number of folds.
+    repeats : int
+        Number of times to create folds.
+    id_col : str or None
+        Name of ID column. Rows with the same ID
+        are put in the same fold.
+    cat_col : str or None
+        Name of categorical column to balance the folds on.
+    seed : int, `numpy.random.SeedSequence`, `numpy.random.Generator` or None
+        Seed for the random streams of the repetitions.
+        A generator is advanced to draw the entropy of the streams.
+    workers : int
+        Number of processes to create the repetitions in.
+        When `1`, they are created in the current process.
+    num_col : str or None
+        Name of numeric column to balance the folds on.
+        With `id_col`, the mean value per ID is balanced.
+
+    Returns
+    -------
+    np.ndarray
+        Fold IDs (1..n) with shape `(n_rows, repeats)`.
+        Column `r` contains the folds of the `r`th repetition.
+        The dtype is `int8` for up to 127 folds.
+
+    Examples
+    --------
+
+    >>> folds = fold_repeated(df, n=5, repeats=10, id_col="participant", seed=1)
+    >>> for r in range(folds.shape[1]):
+    ...     for k in range(1, 6):
+    ...         test_df = df[folds[:, r] == k]
+
+    """
+    if not isinstance(repeats, int):
+        raise TypeError(f"repeats must be an int but had type: {type(repeats)}")
+    if repeats < 1:
+        raise ValueError(f"repeats must be at least 1 but was: {repeats}")
+    if not isinstance(workers, int):
+        raise TypeError(f"workers must be an int but had type: {type(workers)}")
+    if workers < 1:
+        raise ValueError(f"workers must be at least 1 but was: {workers}")
+
+    # Factorize and find strata once
+    unit_of_row, unit_strata = _stratify(
+        n_rows=len(data),
+        id_codes=_factorize(data[id_col]) if id_col is not None else None,
+        cat_codes=_factorize(data[cat_col]) if cat_col is not None else None,
+    )
+    unit_values = (
+        _unit_means(unit_of_row, _num_col_values(data, num_col), n_units=len(unit_strata))
+        if num_col is not None
+        else None
+    )
+
+    # Independent random stream per repetition
+    if isinstance(seed, np.random.Generator):
+        seed = np.random.SeedSequence(
+            seed.integers(np.iinfo(np.int64).max, size=4).tolist()
+        )
+    elif not isinstance(seed, np.random.SeedSequence):
+        seed = np.random.SeedSequence(seed)
+    repeat_seeds = seed.spawn(repeats)
+
+    dtype = np.int8 if n <= np.iinfo(np.int8).max else np.int16
+    folds = np.empty((len(data), repeats), dtype=dtype)
+
+    if workers == 1 or repeats == 1:
+        for r, repeat_seed in enumerate(repeat_seeds):
+            folds[:, r] = _unit_folds(
+                unit_strata, unit_values, n, rng=np.random.default_rng(repeat_seed)
+            )[unit_of_row]
+        return folds
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(unit_strata, unit_values, n),
+    ) as executor:
+        for r, unit_groups in enumerate(executor.map(_fold_in_worker, repeat_seeds)):
+            folds[:, r] = unit_groups[unit_of_row]
+    return folds
+
+
+# State of a worker process
+# Set once per process by `_init_worker()`
+_worker_state: Dict[str, Any] = {}
+
+
+def _init_worker(
+    unit_strata: np.ndarray, unit_values: Optional[np.ndarray], n: Number
+) -> None:
+    _worker_state["unit_strata"] = unit_strata
+    _worker_state["unit_values"] = unit_values
+    _worker_state["n"] = n
+
+
+def _fold_in_worker(repeat_seed: np.random.SeedSequence) -> np.ndarray:
+    return _unit_folds(
+        _worker_state["unit_strata"],
+        _worker_state["unit_values"],
+        _worker_state["n"],
+        rng=np.random.default_rng(repeat_seed),
+    )
@@ -0,0 +1,127 @@
+"""
+@author: ludvigolsen
+"""
+
+from numbers import Number
+from typing import Any, Iterator, Optional, Tuple, Union
+import numpy as np
+import pandas as pd
+from .fold import _fold_factor
+
+
+class FoldSplitter:
+    def __init__(
+        self,
+        n: Number = 5,
+        id_col: Optional[str] = None,
+        cat_col: Optional[str] = None,
+        seed: Optional[Union[int, np.random.Generator]] = None,
+        num_col: Optional[str] = None,
+    ) -> None:
+        """
+        Split data into balanced folds for cross-validation
+        as positional indices of the training and test rows.
+
+        Uses the same balancing as `fold()`: balance on a categorical
+        column and/or make sure that datapoints that share an ID
+        (e.g., participant id) are kept in the same folds.
+        The data is never copied, so the indices can be used to
+        slice (e.g., with `data.iloc[test_idx]`) when needed.
+
+        Follows the `split()` / `get_n_splits()` interface of scikit-learn splitters.
+
+        Parameters
+        ----------
+        n : int
+            Number of folds.
+        id_col : str or None
+            Name of ID column. Rows with the same ID
+            are put in the same fold.
+        cat_col : str or None
+            Name of categorical column to balance the folds on.
+        seed : int, `numpy.random.Generator` or None
+            Seed for randomizing the folds.
+            With an integer seed, every call to `split()`
+            gives the same folds.
+        num_col : str or None
+            Name of numeric column to balance the folds on.
+            With `id_col`, the mean value per ID is balanced.
+
+        Examples
+        --------
+
+        >>> splitter = FoldSplitter(n=5, id_col="participant", seed=1)
+        >>> for train_idx, test_idx in splitter.split(df):
+        ...     model.fit(df.iloc[train_idx])
+        """
+        if id_col is not None and not isinstance(id_col, str):
+            raise TypeError(f"id_col must be a str or None but had type: {type(id_col)}")
+        if cat_col is not None and not isinstance(cat_col, str):
+            raise TypeError(f"cat_col must be a str or None but had type: {type(cat_col)}")
+        if num_col is not None and not isinstance(num_col, str):
+            raise TypeError(f"num_col must be a str or None but had type: {type(num_col)}")
+
+        self.n = n
+        self.id_col = id_col
+        self.cat_col = cat_col
+        self.seed = seed
+        self.num_col = num_col
+
+    def get_n_splits(self, *args: Any, **kwargs: Any) -> int:
+        """
+        Get the number of folds.
+
+        Returns
+        -------
+        int
+            Number of folds.
+        """
+        return int(self.n)
+
+    def get_folds(self, data: pd.DataFrame) -> np.ndarray:
+        """
+        Get the fold (1..n) of each row.
+
+        Parameters
+        ----------
+        data : pd.DataFrame
+            The data to split.
+
+        Returns
+        -------
+        np.ndarray
+            Fold per row.
+        """
+        return _fold_factor(
+            data,
+            n=self.n,
+            id_col=self.id_col,
+            cat_col=self.cat_col,
+            seed=self.seed,
+            num_col=self.num_col,
+        )
+
+    def split(
+        self, data: pd.DataFrame, *args: Any, **kwargs: Any
+    ) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Split data into folds.
+
+        Parameters
+        ----------
+        data : pd.DataFrame
+            The data to split.
+        args, kwargs
+            Ignored. For compatibility with scikit-learn (e.g., `y` and `groups`).
+
+        Yields
+        ------
+        np.ndarray
+            Positions (int64) of the training rows (all other folds).
+        np.ndarray
+            Positions (int64) of the test rows (the current fold).
+        """
+        folds = self.get_folds(data)
+        for fold in range(1, self.get_n_splits() + 1):
+            is_test = folds == fold
+            yield np.flatnonzero(~is_test), np.flatnonzero(is_test)
@@ -2,9 +2,10 @@
 @author: ludvigolsen
 """
 
+import numpy as np
 import pandas as pd
 from numbers import Number
-from typing import Optional
+from typing import Optional, Union
 from utipy.groups.methods.l_sizes import _l_sizes
 from utipy.groups.methods.n_dist import _n_dist
 
@@ -15,10 +16,14 @@ def group(
     col: Optional[str] = None,
     method: str = "n_dist",
     copy: bool = True,
+    seed: Optional[Union[int, np.random.Generator]] = None,
 ) -> pd.DataFrame:
     """
     Add a grouping factor to dataframe.
 
+    The group order is randomized with `seed`
+    (a seed or `numpy.random.Generator`).
+
     """
     if copy:
         data = data.copy()
@@ -31,9 +36,9 @@ def group(
 
         # Create grouping factor
         if method == "n_dist":
-            all_group_ids = _n_dist(column, n, randomize=True)
+            all_group_ids = _n_dist(column, n, randomize=True, rng=seed)
         elif method == "l_sizes":
-            all_group_ids = _l_sizes(column, n, randomize=True)
+            all_group_ids = _l_sizes(column, n, randomize=True, rng=seed)
         else:
             raise ValueError(f"unknown method: {method}")
 
@@ -41,9 +46,9 @@ def group(
     else:
         # Create grouping factor
         if method == "n_dist":
-            all_group_ids = _n_dist(data[col], n, randomize=True)
+            all_group_ids = _n_dist(data[col], n, randomize=True, rng=seed)
         elif method == "l_sizes":
-            all_group_ids = _l_sizes(data[col], n, randomize=True)
+            all_group_ids = _l_sizes(data[col], n, randomize=True, rng=seed)
         else:
             raise ValueError(f"unknown method: {method}")
 
@@ -0,0 +1,47 @@
+"""
+@author: ludvigolsen
+"""
+
+from numbers import Number
+from typing import Optional, Union
+import numpy as np
+from .methods.arrays import ArrayData, _num_rows
+from .methods.l_sizes import _l_sizes
+from .methods.n_dist import _n_dist
+
+
+def group_array(
+    data: ArrayData,
+    n: Number,
+    method: str = "n_dist",
+    seed: Optional[Union[int, np.random.Generator]] = None,
+) -> np.ndarray:
+    """
+    Create a grouping factor for the rows of arrays.
+
+    Array version of `group()` that does not use pandas.
+    Gives the same groups as `group()` for the same seed.
+
+    Parameters
+    ----------
+    data : dict of 1D arrays or `numpy.ndarray`
+        The columns of the data (only the number of rows is used).
+    n : int or float
+        Number of groups (`'n_dist'`) or group size(s)
+        as percentage 0-1 (`'l_sizes'`).
+    method : str
+        Either `'n_dist'` or `'l_sizes'`.
+    seed : int, `numpy.random.Generator` or None
+        Seed for randomizing the group order.
+
+    Returns
+    -------
+    np.ndarray
+        Group ID of each row.
+    """
+    indices = range(_num_rows(data))
+    if method == "n_dist":
+        return _n_dist(indices, n, randomize=True, rng=seed)
+    if method == "l_sizes":
+        return _l_sizes(indices, n, randomize=True, rng=seed)
+    raise ValueError(f"unknown method: {method}")
@@ -3,43 +3,49 @@
 """
 
 from numbers import Number
+from typing import Optional, Union
+import numpy as np
 import pandas as pd
+from .methods.factorize import _factorize
 from .methods.l_sizes import _l_sizes
 from .methods.n_dist import _n_dist
 
 
 def group_uniques(
-    data: pd.DataFrame, n: Number, col: str, method: str = "n_dist", copy: bool = True
+    data: pd.DataFrame,
+    n: Number,
+    col: str,
+    method: str = "n_dist",
+    copy: bool = True,
+    seed: Optional[Union[int, np.random.Generator]] = None,
 ) -> pd.DataFrame:
     """
     Add grouping factor to given
     dataframe by unique values in col.
 
+    The group order is randomized with `seed`
+    (a seed or `numpy.random.Generator`).
+    Row order is kept.
+
     """
+    if method not in ["n_dist", "l_sizes"]:
+        raise ValueError(f"unknown method: {method}")
+
     if copy:
         data = data.copy()
 
-    # Get unique IDs
-    uniques = list(set(data[col]))
+    # Get code of the unique ID for each row
+    # Codes are in order of appearance
+    codes = _factorize(data[col])
+    n_uniques = int(codes.max()) + 1 if len(codes) else 0
 
     # Create grouping factor from unique IDs
     if method == "n_dist":
-        all_group_ids = _n_dist(uniques, n, randomize=True)
+        unique_group_ids = _n_dist(range(n_uniques), n, randomize=True, rng=seed)
     elif method == "l_sizes":
-        all_group_ids = _l_sizes(uniques, n, randomize=True)
-    else:
-        raise ValueError(f"unknown method: {method}")
-
-    # Create dictionary with unique values
-    # and groups
-    groups_dict = {}
-    groups_dict[col] = uniques
-    groups_dict["group"] = all_group_ids
+        unique_group_ids = _l_sizes(range(n_uniques), n, randomize=True, rng=seed)
 
-    # Create dataframe with unique IDs and the
-    # grouping factor
-    df_grouped = pd.DataFrame(groups_dict)
+    # Add the grouping factor of each row's ID
+    data["group"] = np.take(unique_group_ids, codes)
 
-    # Merge and return the given dataframe with the
-    # new grouping factor
-    return data.merge(df_grouped, on=col, how="outer")
+    return data
@@ -0,0 +1,58 @@
+"""
+@author: ludvigolsen
+"""
+
+from numbers import Number
+from typing import Hashable, Optional, Union
+import numpy as np
+from .methods.arrays import ArrayData, _factorize_array, _get_column
+from .methods.l_sizes import _l_sizes
+from .methods.n_dist import _n_dist
+
+
+def group_uniques_array(
+    data: ArrayData,
+    n: Number,
+    col: Optional[Hashable] = None,
+    method: str = "n_dist",
+    seed: Optional[Union[int, np.random.Generator]] = None,
+) -> np.ndarray:
+    """
+    Create a grouping factor for the rows of arrays
+    by the unique values in a column.
+
+    Array version of `group_uniques()` that does not use pandas.
+    Gives the same groups as `group_uniques()` for the same seed.
+
+    Parameters
+    ----------
+    data : dict of 1D arrays or `numpy.ndarray`
+        The columns of the data. A 1D array is a single column.
+    n : int or float
+        Number of groups (`'n_dist'`) or group size(s)
+        as percentage 0-1 (`'l_sizes'`).
+    col : str, int or None
+        Key (dict) or index (2D array) of the column with the values to group.
+        Must be `None` or `0` for 1D arrays.
+    method : str
+        Either `'n_dist'` or `'l_sizes'`.
+    seed : int, `numpy.random.Generator` or None
+        Seed for randomizing the group order.
+
+    Returns
+    -------
+    np.ndarray
+        Group ID of each row.
+    """
+    if method not in ["n_dist", "l_sizes"]:
+        raise ValueError(f"unknown method: {method}")
+
+    codes = _factorize_array(_get_column(data, col))
+    n_uniques = int(codes.max()) + 1 if len(codes) else 0
+
+    if method == "n_dist":
+        unique_group_ids = _n_dist(range(n_uniques), n, randomize=True, rng=seed)
+    elif method == "l_sizes":
+        unique_group_ids = _l_sizes(range(n_uniques), n, randomize=True, rng=seed)
+
+    return np.take(unique_group_ids, codes)
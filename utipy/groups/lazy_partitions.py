@@ -0,0 +1,109 @@
+"""
+@author: ludvigolsen
+"""
+
+from typing import Iterator, List
+import numpy as np
+import pandas as pd
+
+
+class LazyPartitions:
+    def __init__(self, data: pd.DataFrame, codes: np.ndarray) -> None:
+        """
+        Partitions of a data frame that are created on demand.
+
+        Only the partition of each row is stored. The data is
+        not copied until a partition is requested, at which point
+        only the rows of that partition are taken.
+
+        Usually created with `partition(..., lazy=True)`.
+
+        Parameters
+        ----------
+        data : pd.DataFrame
+            The partitioned data. It is not copied or modified.
+        codes : np.ndarray
+            Partition (0..k-1) of each row.
+
+        Examples
+        --------
+
+        >>> parts = partition(df, p=0.8, lazy=True, seed=1)
+        >>> parts.sizes
+        array([800, 200])
+        >>> train = parts[0]
+        >>> test_idx = parts.indices(1)
+        """
+        codes = np.asarray(codes)
+        if codes.ndim != 1 or len(codes) != len(data):
+            raise ValueError(
+                "`codes` must be 1D with one partition per row of `data`."
+            )
+        self.data = data
+        self.codes = codes
+        self._order = None
+
+    @property
+    def n_partitions(self) -> int:
+        """Number of partitions, including empty ones."""
+        return int(self.codes.max()) + 1 if len(self.codes) else 0
+
+    @property
+    def sizes(self) -> np.ndarray:
+        """Number of rows in each partition."""
+        return np.bincount(self.codes, minlength=self.n_partitions)
+
+    def indices(self, i: int) -> np.ndarray:
+        """
+        Get the positions of the rows in a partition.
+
+        Parameters
+        ----------
+        i : int
+            Index of the partition.
+
+        Returns
+        -------
+        np.ndarray
+            Positions (int64) of the rows in partition `i`.
+            In the row order of `data`.
+        """
+        i = self._check_partition_index(i)
+        if self._order is None:
+            # Sort once, so all partitions are found in a single pass
+            self._order = np.argsort(self.codes, kind="stable")
+            self._starts = np.concatenate([[0], np.cumsum(self.sizes)])
+        return self._order[self._starts[i] : self._starts[i + 1]].astype(
+            np.int64, copy=False
+        )
+
+    def to_list(self) -> List[pd.DataFrame]:
+        """
+        Get all the non-empty partitions.
+
+        Returns
+        -------
+        list of pd.DataFrames
+            The same partitions as `partition(..., lazy=False)`.
+        """
+        return [part for part, size in zip(self, self.sizes) if size > 0]
+
+    def __len__(self) -> int:
+        return self.n_partitions
+
+    def __getitem__(self, i: int) -> pd.DataFrame:
+        return self.data.take(self.indices(i))
+
+    def __iter__(self) -> Iterator[pd.DataFrame]:
+        for i in range(len(self)):
+            yield self[i]
+
+    def __repr__(self) -> str:
+        return f"LazyPartitions(sizes={self.sizes.tolist()})"
+
+    def _check_partition_index(self, i: int) -> int:
+        if not isinstance(i, (int, np.integer)):
+            raise TypeError(f"Partition index must be an int but had type: {type(i)}")
+        if not -len(self) <= i < len(self):
+            raise IndexError(f"Partition index {i} is out of range for {len(self)} partitions.")
+        return int(i) % len(self)
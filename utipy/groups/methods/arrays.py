@@ -0,0 +1,101 @@
+"""
+@author: ludvigolsen
+"""
+
+from typing import Any, Dict, Hashable, Optional, Union
+import numpy as np
+
+# Data for the array versions of the grouping functions
+# A dict of 1D arrays (columns) or a 1D/2D array
+ArrayData = Union[np.ndarray, Dict[Hashable, Any]]
+
+
+def _factorize_array(values) -> np.ndarray:
+    """
+    Get integer codes (0..k-1) for the values in order of appearance
+    without pandas. Gives the same codes as `_factorize()`.
+
+    Missing values (NaN, NaT and None) become their own
+    level after all other values.
+    """
+    values = np.asarray(values)
+    if values.ndim != 1:
+        raise ValueError(f"Columns must be 1D but had shape: {values.shape}")
+
+    is_missing = _is_missing(values)
+    present = values[~is_missing] if is_missing.any() else values
+
+    try:
+        uniques, first_index, inverse = np.unique(
+            present, return_index=True, return_inverse=True
+        )
+    except TypeError:
+        # Unorderable objects (e.g., mixed types)
+        code_of = {}
+        present_codes = np.fromiter(
+            (code_of.setdefault(value, len(code_of)) for value in present),
+            dtype=np.int64,
+            count=len(present),
+        )
+    else:
+        # Recode the sorted uniques in order of appearance
+        recode = np.empty(len(uniques), dtype=np.int64)
+        recode[np.argsort(first_index, kind="stable")] = np.arange(len(uniques))
+        present_codes = recode[inverse.reshape(-1)]
+
+    if not is_missing.any():
+        return present_codes
+    n_uniques = int(present_codes.max()) + 1 if len(present_codes) else 0
+    codes = np.full(len(values), n_uniques, dtype=np.int64)
+    codes[~is_missing] = present_codes
+    return codes
+
+
+def _is_missing(values: np.ndarray) -> np.ndarray:
+    """Find NaN, NaT and None values."""
+    if values.dtype.kind in "fc":
+        return np.isnan(values)
+    if values.dtype.kind in "mM":
+        return np.isnat(values)
+    if values.dtype.kind == "O":
+        # NaN is the only value that is not equal to itself
+        return np.fromiter(
+            (value is None or value != value for value in values),
+            dtype=bool,
+            count=len(values),
+        )
+    return np.zeros(len(values), dtype=bool)
+
+
+def _num_rows(data: ArrayData) -> int:
+    """Get the number of rows in a dict of columns or an array."""
+    if isinstance(data, dict):
+        if not data:
+            raise ValueError("`data` must have at least one column.")
+        lengths = {len(column) for column in data.values()}
+        if len(lengths) > 1:
+            raise ValueError("All columns in `data` must have the same length.")
+        return lengths.pop()
+    data = np.asarray(data)
+    if data.ndim not in [1, 2]:
+        raise ValueError(f"`data` must be 1D or 2D but had shape: {data.shape}")
+    return len(data)
+
+
+def _get_column(data: ArrayData, col: Optional[Hashable]) -> np.ndarray:
+    """
+    Get a column by key (dict) or index (2D array).
+    A 1D array is the only column.
+    """
+    if isinstance(data, dict):
+        if col not in data:
+            raise KeyError(f"`data` has no column: {col}")
+        return np.asarray(data[col])
+    data = np.asarray(data)
+    if data.ndim == 1:
+        if col not in [0, None]:
+            raise KeyError(f"A 1D `data` array only has column 0 but got: {col}")
+        return data
+    if not isinstance(col, (int, np.integer)):
+        raise TypeError(f"Columns of 2D arrays must be int indices but got: {col}")
+    return data[:, col]
@@ -0,0 +1,21 @@
+"""
+@author: ludvigolsen
+"""
+
+import numpy as np
+import pandas as pd
+
+
+def _factorize(values) -> np.ndarray:
+    """
+    Get integer codes (0..k-1) for the values in order of appearance.
+
+    Missing values (e.g., NaN) become their own level
+    instead of being dropped.
+    """
+    codes, uniques = pd.factorize(values)
+    codes = codes.astype(np.int64, copy=False)
+    is_missing = codes == -1
+    if is_missing.any():
+        codes[is_missing] = len(uniques)
+    return codes
@@ -2,11 +2,17 @@
 @author: ludvigolsen
 """
 
+from typing import Optional, Union
 import numpy as np
-from random import shuffle
 
 
-def _l_sizes(v, p, randomize=False, rounding='floor'):
+def _l_sizes(
+    v,
+    p,
+    randomize: bool = False,
+    rounding: str = 'floor',
+    rng: Optional[Union[int, np.random.Generator]] = None,
+):
     """
     Creates grouping factor from group size(s)
 
@@ -15,6 +21,10 @@ def _l_sizes(v, p, randomize=False, rounding='floor'):
     rounding: Floors percentages by default
     Alternative setting: 'round' or 'ceil'
 
+    rng: Random number generator or seed
+    used when randomizing. When `None`,
+    a fresh, unseeded generator is used.
+
     If sum of p is less than 1 an extra group
     with excess elements are appended to the end.
 
@@ -22,68 +32,71 @@ def _l_sizes(v, p, randomize=False, rounding='floor'):
     rounding is added to the last group. I.e.
     given 9 elements and p = [0.5,0.5] l_sizes
     will return 0,0,0,0,1,1,1,1,1.
+
+    The grouping factor is returned as the smallest
+    signed integer dtype (e.g., int8) that fits the groups.
     """
     # If p is passed as scalar
     # Convert to array
     if not hasattr(p, "__iter__"):
-        # if not isinstance(p, list):
         p = [p]
+    p = np.asarray(p, dtype=float)
 
     # Check if the sum of p is 0, 1 or in-between
-    if False in [0 <= size <= 1 for size in p]:
+    if not ((p >= 0) & (p <= 1)).all():
         raise ValueError(
             'l_sizes: element of p is not equal to or within 0 and 1')
 
+    # Sum in the same order as before (p is short)
+    sum_p = sum(p.tolist())
+
     # Check if p sums to more than 1
-    if not 0 <= sum(p) <= 1:
+    if not 0 <= sum_p <= 1:
         raise ValueError('l_sizes: sum of p is not equal to or within 0 and 1')
 
     # Is sum of p 1? Then we only want the number
     # of groups passed.
-    if sum(p) == 1:
-        fixed_n_groups = True
-    else:
-        fixed_n_groups = False
+    fixed_n_groups = sum_p == 1
 
-    if not rounding in ['floor', 'round', 'ceil']:
+    if rounding not in ['floor', 'round', 'ceil']:
         raise ValueError(
             'l_sizes: rounding must be either floor, round, or ceil')
 
     # Find the sizes based on percentages given
     # Use rounding as specified by user
+    len_v = len(v)
     if rounding == 'floor':
-        sizes = np.floor([len(v) * size for size in p])
+        sizes = np.floor(len_v * p)
     elif rounding == 'round':
-        sizes = np.round([len(v) * size for size in p])
+        sizes = np.round(len_v * p)
     elif rounding == 'ceil':
-        sizes = np.ceil([len(v) * size for size in p])
+        sizes = np.ceil(len_v * p)
+    sizes = sizes.astype(np.int64)
 
     # Find the remaining elements
-    excess = len(v) - sum(sizes)
+    excess = len_v - sizes.sum()
 
     # If any remaining elements
     if excess >= 0:
         if fixed_n_groups:
-            sizes = np.append(sizes[:-1], sizes[-1:] + excess)
+            sizes[-1] += excess
         else:
             # Add as size of last groups
             sizes = np.append(sizes, excess)
 
     # Check that we do not create more values than is in v
-    if sum(sizes) != len(v):
+    if sizes.sum() != len_v:
         raise ValueError('l_sizes: Wrong number of elements in sizes')
 
     # Create grouping factor
-    grouping_factor = [
-        [group] * int(size)
-        for size, group in zip(sizes, range(len(sizes)))
-    ]
-
-    # Flatten grouping factor
-    grouping_factor = [item for sublist in grouping_factor for item in sublist]
+    dtype = next(
+        t for t in [np.int8, np.int16, np.int32, np.int64]
+        if len(sizes) - 1 <= np.iinfo(t).max
+    )
+    grouping_factor = np.repeat(np.arange(len(sizes), dtype=dtype), sizes)
 
     # If randomize is True, shuffle grouping factor
     if randomize:
-        shuffle(grouping_factor)
+        grouping_factor = np.random.default_rng(rng).permutation(grouping_factor)
 
     return grouping_factor
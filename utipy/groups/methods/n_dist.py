@@ -2,23 +2,31 @@
 @author: ludvigolsen
 """
 
+from typing import Optional, Union
 import numpy as np
-from random import shuffle
 
 
-def _n_dist(v, n, randomize=False):
+def _n_dist(
+    v,
+    n,
+    randomize: bool = False,
+    rng: Optional[Union[int, np.random.Generator]] = None,
+):
     """
     Creates grouping factor with
     distributed excess elements
 
+    rng: Random number generator or seed
+    used when randomizing. When `None`,
+    a fresh, unseeded generator is used.
+
     """
-    len_v = float(len(v))
+    len_v = len(v)
 
-    divisor = len_v / n
+    divisor = float(len_v) / n
 
-    # Create range the length of v (+1 because it starts at 0)
-    # Divide each element and get everything but the first element (0)
-    v_divided = [vi / divisor for vi in range(int(len_v) + 1)][1:]
+    # Divide 1..len(v) by the divisor
+    v_divided = np.arange(1, len_v + 1) / divisor
 
     # First round to a smaller decimal number to avoid ceil of
     # e.g., 7.00000000...03 becoming 8
@@ -26,6 +34,6 @@ def _n_dist(v, n, randomize=False):
     v_ceiled = np.ceil(np.around(v_divided, 5)).astype(int)
 
     if randomize:
-        shuffle(v_ceiled)
+        v_ceiled = np.random.default_rng(rng).permutation(v_ceiled)
 
     return v_ceiled
@@ -0,0 +1,221 @@
+"""
+@author: ludvigolsen
+"""
+
+from typing import Optional, Tuple
+import numpy as np
+from .l_sizes import _l_sizes
+
+
+def _stratify(
+    n_rows: int,
+    id_codes: Optional[np.ndarray] = None,
+    cat_codes: Optional[np.ndarray] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Find the units to group and the stratum of each unit.
+
+    Units are the unique IDs (per level of the categorical column),
+    or the rows when no IDs are given.
+
+    id_codes, cat_codes: Integer codes (0..k-1) per row, e.g., from factorizing.
+
+    Returns the unit of each row and the stratum (0..k-1) of each unit.
+    """
+    if id_codes is None:
+        unit_of_row = np.arange(n_rows, dtype=np.int64)
+        if cat_codes is None:
+            return unit_of_row, np.zeros(n_rows, dtype=np.int64)
+        return unit_of_row, np.asarray(cat_codes, dtype=np.int64)
+
+    id_codes = np.asarray(id_codes, dtype=np.int64)
+    if cat_codes is None:
+        n_units = int(id_codes.max()) + 1 if len(id_codes) else 0
+        return id_codes, np.zeros(n_units, dtype=np.int64)
+
+    # The same ID in different strata are different units
+    cat_codes = np.asarray(cat_codes, dtype=np.int64)
+    n_ids = int(id_codes.max()) + 1 if len(id_codes) else 0
+    unit_keys = cat_codes * n_ids + id_codes
+    unique_keys, unit_of_row = np.unique(unit_keys, return_inverse=True)
+    return unit_of_row.astype(np.int64, copy=False), unique_keys // max(n_ids, 1)
+
+
+def _shuffled_ranks(
+    strata: np.ndarray, rng: np.random.Generator
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Order units randomly within their stratum.
+
+    Returns the unit order (sorted by stratum, random within strata),
+    the 1-based rank of each ordered unit within its stratum and
+    the size of the stratum of each ordered unit.
+    """
+    # Random order, then stable sort by stratum
+    order = rng.permutation(len(strata))
+    order = order[np.argsort(strata[order], kind="stable")]
+
+    sorted_strata = strata[order]
+    counts = np.bincount(sorted_strata) if len(strata) else np.zeros(0, dtype=np.int64)
+    stratum_starts = np.cumsum(counts) - counts
+    ranks = np.arange(1, len(strata) + 1) - stratum_starts[sorted_strata]
+    return order, ranks, counts[sorted_strata]
+
+
+def _n_dist_strata(
+    strata: np.ndarray, n, rng: np.random.Generator
+) -> np.ndarray:
+    """
+    Creates grouping factor (1..n) per unit with `_n_dist()`
+    within each stratum in a single vectorized pass.
+
+    strata: Stratum (0..k-1) of each unit.
+    """
+    order, ranks, stratum_sizes = _shuffled_ranks(strata, rng)
+
+    # Same calculation as `_n_dist()` but per stratum
+    divisors = stratum_sizes.astype(float) / n
+    ordered_groups = np.ceil(np.around(ranks / divisors, 5)).astype(int)
+
+    groups = np.empty(len(strata), dtype=ordered_groups.dtype)
+    groups[order] = ordered_groups
+    return groups
+
+
+def _unit_means(unit_of_row: np.ndarray, values: np.ndarray, n_units: int) -> np.ndarray:
+    """
+    Get the mean value of each unit (e.g., ID).
+    NaNs are ignored. Units with only NaNs get NaN.
+    """
+    values = np.asarray(values, dtype=float)
+    is_nan = np.isnan(values)
+    sums = np.bincount(unit_of_row, weights=np.where(is_nan, 0, values), minlength=n_units)
+    counts = np.bincount(unit_of_row[~is_nan], minlength=n_units)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return sums / counts
+
+
+def _serpentine_strata(
+    strata: np.ndarray, values: np.ndarray, n: int, rng: np.random.Generator
+) -> np.ndarray:
+    """
+    Creates grouping factor (1..n) per unit balanced on a numeric value
+    within each stratum in a single vectorized pass.
+
+    Units are sorted by value (ties in random order) and assigned
+    to the groups in a serpentine order (1..n, n..1, 1..n, ...), so every
+    group gets similar values. The group labels are shuffled per stratum.
+
+    strata: Stratum (0..k-1) of each unit.
+    values: Numeric value of each unit. NaNs are sorted last.
+    """
+    n = int(n)
+
+    # Sort by stratum, then value, then random tie-breaker
+    order = np.lexsort((rng.random(len(strata)), values, strata))
+
+    sorted_strata = strata[order]
+    counts = np.bincount(sorted_strata) if len(strata) else np.zeros(0, dtype=np.int64)
+    stratum_starts = np.cumsum(counts) - counts
+    ranks = np.arange(len(strata)) - stratum_starts[sorted_strata]
+
+    # Serpentine: reverse every other block of n units
+    positions = ranks % n
+    reverse = (ranks // n) % 2 == 1
+    positions[reverse] = n - 1 - positions[reverse]
+
+    # Random group labels per stratum
+    labels = rng.permuted(np.tile(np.arange(1, n + 1), (len(counts), 1)), axis=1)
+
+    groups = np.empty(len(strata), dtype=np.int64)
+    groups[order] = labels[sorted_strata, positions]
+    return groups
+
+
+def _l_sizes_strata(
+    strata: np.ndarray, p, rng: np.random.Generator
+) -> np.ndarray:
+    """
+    Creates grouping factor (0..k) per unit with `_l_sizes()`
+    within each stratum in a single vectorized pass.
+
+    strata: Stratum (0..k-1) of each unit.
+    p: Group size(s) as percentage (0-1) of each stratum.
+    """
+    # Check p with `_l_sizes()` (raises for invalid p)
+    _l_sizes([], p)
+    p = np.atleast_1d(np.asarray(p, dtype=float))
+    fixed_n_groups = sum(p.tolist()) == 1
+    n_groups = len(p) if fixed_n_groups else len(p) + 1
+
+    order, ranks, stratum_sizes = _shuffled_ranks(strata, rng)
+
+    # Same sizes as `_l_sizes()` but per stratum
+    # A unit's group is the number of group ends at or before its rank
+    group_ends = np.cumsum(np.floor(np.outer(stratum_sizes, p)), axis=1)
+    ordered_groups = np.count_nonzero(ranks[:, None] > group_ends, axis=1)
+    if fixed_n_groups:
+        # Excess elements are added to the last group
+        ordered_groups = np.minimum(ordered_groups, len(p) - 1)
+
+    dtype = next(
+        t for t in [np.int8, np.int16, np.int32, np.int64]
+        if n_groups - 1 <= np.iinfo(t).max
+    )
+    groups = np.empty(len(strata), dtype=dtype)
+    groups[order] = ordered_groups
+    return groups
+
+
+def _unit_folds(
+    unit_strata: np.ndarray,
+    unit_values: Optional[np.ndarray],
+    n,
+    rng: np.random.Generator,
+) -> np.ndarray:
+    """Create grouping factor per unit, balanced on `unit_values` when given."""
+    if unit_values is not None:
+        return _serpentine_strata(unit_strata, unit_values, n, rng=rng)
+    return _n_dist_strata(unit_strata, n, rng=rng)
+
+
+def _fold_codes(
+    n_rows: int,
+    n,
+    id_codes: Optional[np.ndarray],
+    cat_codes: Optional[np.ndarray],
+    values: Optional[np.ndarray],
+    rng: np.random.Generator,
+) -> np.ndarray:
+    """
+    Create the grouping factor (1..n) of `fold()` per row
+    from factorized ID and category codes.
+
+    values: Numeric value per row to balance on (by unit mean).
+    """
+    unit_of_row, unit_strata = _stratify(
+        n_rows=n_rows, id_codes=id_codes, cat_codes=cat_codes
+    )
+    unit_values = (
+        _unit_means(unit_of_row, values, n_units=len(unit_strata))
+        if values is not None
+        else None
+    )
+    return _unit_folds(unit_strata, unit_values, n, rng=rng)[unit_of_row]
+
+
+def _partition_codes(
+    n_rows: int,
+    p,
+    id_codes: Optional[np.ndarray],
+    cat_codes: Optional[np.ndarray],
+    rng: np.random.Generator,
+) -> np.ndarray:
+    """
+    Create the partition (0..k) of `partition()` per row
+    from factorized ID and category codes.
+    """
+    unit_of_row, unit_strata = _stratify(
+        n_rows=n_rows, id_codes=id_codes, cat_codes=cat_codes
+    )
+    return _l_sizes_strata(unit_strata, p, rng=rng)[unit_of_row]
@@ -2,13 +2,14 @@
 @author: ludvigolsen
 """
 
+import numpy as np
 import pandas as pd
 from numbers import Number
-from typing import Optional, List
+from typing import Optional, List, Union
 
-from utipy.pandas import subset_by_levels
-from .group_uniques import group_uniques
-from .group import group
+from .lazy_partitions import LazyPartitions
+from .methods.factorize import _factorize
+from .methods.strata import _partition_codes
 
 
 def partition(
@@ -17,7 +18,9 @@ def partition(
     id_col: Optional[str] = None,
     cat_col: Optional[str] = None,
     copy: bool = True,
-) -> List[pd.DataFrame]:
+    seed: Optional[Union[int, np.random.Generator]] = None,
+    lazy: bool = False,
+) -> Union[List[pd.DataFrame], LazyPartitions]:
     """
     Create balanced partitions.
     Balance on a categorical column
@@ -25,57 +28,29 @@ def partition(
     an ID (e.g., participant id) are kept in the
     same partitions.
 
-    """
-    if copy:
-        data = data.copy()
-
-    # Create temporary index that we will
-    # use to reorder the dataframe later
-    data[".sorting_index"] = range(len(data))
-
-    # If user specified id_col
-    if id_col is not None:
-        # And if user specified cat_col
-        if cat_col is not None:
-            # Subset data by levels of categorical column
-            cat_subsets = subset_by_levels(data, cat_col)
-
-            # Create groups for each subset based on unique values in id_col
-            # Concatenate subsets with the new grouping factor
-            data = pd.concat(
-                [
-                    group_uniques(data, p, id_col, method="l_sizes")
-                    for data in cat_subsets
-                ]
-            )
-
-        else:
-            # Create groups based on unique values in id_col
-            data = group_uniques(data, p, id_col, method="l_sizes")
+    The partitions are randomized with `seed`
+    (a seed or `numpy.random.Generator`).
+    Row order is kept within the partitions.
 
-    else:
-        # If user specified cat_col (but not id_col)
-        if cat_col is not None:
-            # Subset data by levels of categorical column
-            cat_subsets = subset_by_levels(data, cat_col)
+    With `lazy=True`, a `LazyPartitions` object is returned.
+    It only stores the partition of each row and takes
+    the rows of a partition when it is requested.
+    `data` is never copied, so `copy` is ignored.
 
-            # Group each subset and concatenate subsets
-            data = pd.concat(
-                [group(data, p, cat_col, method="l_sizes") for data in cat_subsets]
-            )
-
-        # If neither id_col or cat_col is specified
-        else:
-            # Group data by the first column in data
-            # group() does this automatically if not
-            # given a column.
-            data = group(data, p, method="l_sizes")
-
-    # Sort data by the sorting index
-    # and remove the sorting index
-    data = data.sort_values(".sorting_index").drop(".sorting_index", axis=1)
-
-    # Subset data by grouping factor
-    partitions = subset_by_levels(data, "group", drop_cat_col=True)
-
-    return partitions
+    """
+    # Find the partition of each row
+    codes = _partition_codes(
+        n_rows=len(data),
+        p=p,
+        id_codes=_factorize(data[id_col]) if id_col is not None else None,
+        cat_codes=_factorize(data[cat_col]) if cat_col is not None else None,
+        rng=np.random.default_rng(seed),
+    )
+    partitions = LazyPartitions(data, codes=codes)
+
+    if lazy:
+        return partitions
+
+    # Take the rows of each partition
+    # (`take` always returns new data frames)
+    return partitions.to_list()
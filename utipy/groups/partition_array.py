@@ -0,0 +1,64 @@
+"""
+@author: ludvigolsen
+"""
+
+from numbers import Number
+from typing import Hashable, Optional, Union
+import numpy as np
+from .methods.arrays import ArrayData, _factorize_array, _get_column, _num_rows
+from .methods.strata import _partition_codes
+
+
+def partition_array(
+    data: ArrayData,
+    p: Number = 0.2,
+    id_col: Optional[Hashable] = None,
+    cat_col: Optional[Hashable] = None,
+    seed: Optional[Union[int, np.random.Generator]] = None,
+) -> np.ndarray:
+    """
+    Create balanced partitions for the rows of arrays.
+    Balance on a categorical column
+    and/or make sure that datapoints that share
+    an ID (e.g., participant id) are kept in the
+    same partitions.
+
+    Array version of `partition()` that does not use pandas.
+    Gives the same partitions as `partition(..., lazy=True).codes`
+    for the same seed.
+
+    Parameters
+    ----------
+    data : dict of 1D arrays or `numpy.ndarray`
+        The columns of the data. A 1D array is a single column.
+    p : float or list of floats
+        Partition size(s) as percentage (0-1).
+        When the sizes sum to less than 1,
+        the remaining rows form the last partition.
+    id_col : str, int or None
+        Key (dict) or index (2D array) of the ID column.
+        Rows with the same ID are put in the same partition.
+    cat_col : str, int or None
+        Key (dict) or index (2D array) of the categorical column
+        to balance the partitions on.
+    seed : int, `numpy.random.Generator` or None
+        Seed for randomizing the partitions.
+
+    Returns
+    -------
+    np.ndarray
+        Partition (0..k) of each row.
+
+    Examples
+    --------
+
+    >>> parts = partition_array({"id": ids}, p=0.8, id_col="id", seed=1)
+    >>> x_train, x_test = x[parts == 0], x[parts == 1]
+    """
+    return _partition_codes(
+        n_rows=_num_rows(data),
+        p=p,
+        id_codes=_factorize_array(_get_column(data, id_col)) if id_col is not None else None,
+        cat_codes=_factorize_array(_get_column(data, cat_col)) if cat_col is not None else None,
+        rng=np.random.default_rng(seed),
+    )
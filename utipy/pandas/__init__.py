@@ -1,7 +1,9 @@
 # pandas __init__.py
 
 from .drop import drop
+from .chunked_dropper import ChunkedDropper
 from .makes_up import makes_up
+from .makes_up_frame import makes_up_frame
 from .resemble import resemble
 from .distort import distort
 from .subset_by_levels import subset_by_levels
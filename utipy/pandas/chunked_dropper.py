@@ -0,0 +1,313 @@
+"""
+@author: ludvigolsen
+"""
+
+from typing import Dict, Iterable, Iterator, List, Optional, Union
+from numbers import Number
+import numpy as np
+import pandas as pd
+
+from .drop import _check_rule, _index_of, _unique_values
+from .makes_up import _count_value_frame, _get_operator
+
+
+class ChunkedDropper:
+    def __init__(
+        self,
+        value: Union[str, Number] = 'NaN',
+        thresh: float = 0,
+        direction: str = '>',
+        include: Optional[List[str]] = None,
+        exclude: Optional[List[str]] = None,
+        rules: Optional[List[Union[tuple, dict]]] = None
+    ) -> None:
+        """
+        Drop columns by values in data that is read in chunks
+        (e.g., with `pd.read_csv(chunksize=...)`).
+
+        Streaming version of `drop()` for columns. The counts needed by the rules
+        are accumulated per column in a first pass over the chunks (`fit()`),
+        after which the columns to drop can be removed from
+        a second pass over the chunks (`transform()`).
+
+        Only the counts are stored: a count per column and value,
+        and a frequency table per column for `'any'`.
+        Memory is thus O(columns x distinct values) instead of O(rows).
+        Counters of different parts of the data (e.g., from different processes)
+        can be combined with `merge()`.
+
+        Counts follow the dtype of each chunk, as in `drop()`.
+        E.g., object columns are checked as strings. Specify the dtypes when
+        reading the chunks (e.g., `dtype=` in `pd.read_csv()`) to make sure
+        a column has the same dtype in all chunks.
+
+        Parameters
+        ----------
+        value : str / int / float
+            The value to match.
+                Regular value,
+                'any',
+                'NaN',
+                'inf'
+        thresh : float
+            Threshold.
+            Percentage between 0-1.
+        direction : str
+            Operator sign for comparison.
+                '>', '<', '>=', '<=', '=='.
+        include : list of strings
+            Names of columns to search within.
+            None means ALL are included unless otherwise specified, see *exclude*.
+        exclude : list of strings
+            Names of columns NOT to search within.
+            None means no columns are excluded unless otherwise specified, see *include*.
+        rules : list of tuples / dicts or None
+            Multiple rules to drop by. Each rule is a tuple of
+            `(value, thresh, direction)` or a dict with those keys.
+            When specified, `value`, `thresh` and `direction` are ignored.
+            See `drop()`.
+
+        Examples
+        --------
+
+        >>> dropper = ChunkedDropper(rules=[('NaN', 0.5, '>'), ('any', 1, '==')])
+        >>> dropper.fit(pd.read_csv("data.csv", chunksize=100000))
+        >>> dropper.columns_to_drop
+        ['empty_col', 'constant_col']
+        >>> for chunk in dropper.transform(pd.read_csv("data.csv", chunksize=100000)):
+        ...     ...
+        """
+        if exclude is not None and include is not None:
+            raise ValueError("Either include or exclude must be None.")
+        if rules is None:
+            rules = [(value, thresh, direction)]
+        self.rules = [_check_rule(_with_column_axis(rule)) for rule in rules]
+        self.include = include
+        self.exclude = exclude
+
+        # Counted values ('any' is counted with frequency tables)
+        self._values = _unique_values(
+            [rule['value'] for rule in self.rules if not _is_any(rule['value'])])
+        self._count_any = any(_is_any(rule['value']) for rule in self.rules)
+
+        # Accumulated state
+        self.columns: Optional[pd.Index] = None
+        self.n_rows = 0
+        self._counts: Optional[np.ndarray] = None
+        self._tables: Dict[str, List[pd.Series]] = {}
+
+    def update(self, chunk: pd.DataFrame) -> "ChunkedDropper":
+        """
+        Add the counts of a chunk.
+
+        Parameters
+        ----------
+        chunk : pd.DataFrame
+            A chunk of the data. Must have the same columns as the previous chunks.
+
+        Returns
+        -------
+        ChunkedDropper
+            The dropper itself.
+        """
+        if self.columns is None:
+            self._init_columns(chunk.columns)
+        elif not chunk.columns.equals(self.columns):
+            raise ValueError("All chunks must have the same columns.")
+
+        chunk = chunk.loc[:, self._searched]
+        self.n_rows += len(chunk)
+        if self._values and len(chunk):
+            self._counts += _count_value_frame(chunk, values=self._values, axis=0)
+        if self._count_any:
+            for name, col in chunk.items():
+                _add_table(self._tables[name], _frequency_table(col))
+        return self
+
+    def fit(self, chunks: Iterable[pd.DataFrame]) -> "ChunkedDropper":
+        """
+        Add the counts of all chunks.
+
+        Parameters
+        ----------
+        chunks : iterable of pd.DataFrames
+            The chunks of the data, e.g., from `pd.read_csv(chunksize=...)`.
+
+        Returns
+        -------
+        ChunkedDropper
+            The dropper itself.
+        """
+        for chunk in chunks:
+            self.update(chunk)
+        return self
+
+    def merge(self, other: "ChunkedDropper") -> "ChunkedDropper":
+        """
+        Add the counts of another dropper with the same rules
+        (e.g., fitted to another part of the data).
+
+        Parameters
+        ----------
+        other : ChunkedDropper
+            The dropper to add the counts of.
+
+        Returns
+        -------
+        ChunkedDropper
+            The dropper itself.
+        """
+        if other.rules != self.rules or other.include != self.include \
+                or other.exclude != self.exclude:
+            raise ValueError("Can only merge droppers with the same rules.")
+        if other.columns is None:
+            return self
+        if self.columns is None:
+            self._init_columns(other.columns)
+        elif not other.columns.equals(self.columns):
+            raise ValueError("Can only merge droppers of data with the same columns.")
+
+        self.n_rows += other.n_rows
+        self._counts += other._counts
+        for name, tables in other._tables.items():
+            _add_table(self._tables[name], _reduce_tables(tables))
+        return self
+
+    def proportions(self) -> pd.DataFrame:
+        """
+        Get the proportion of each value of the rules in each searched column.
+
+        Returns
+        -------
+        pd.DataFrame
+            Proportion (between 0-1) per column (rows) and value (columns).
+        """
+        self._check_fitted()
+        counts = self._counts.astype(float)
+        values = list(self._values)
+        if self._count_any:
+            counts = np.column_stack([
+                counts,
+                [_reduce_tables(tables).max() if tables else 0
+                 for tables in self._tables.values()]
+            ])
+            values.append('any')
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return pd.DataFrame(counts / float(self.n_rows),
+                                index=self._searched, columns=values)
+
+    def report(self) -> pd.DataFrame:
+        """
+        Get the columns dropped by each rule.
+
+        Returns
+        -------
+        pd.DataFrame
+            A report with one row per rule and the columns `value`, `thresh`,
+            `direction`, `axis`, `n_dropped` and `dropped`. See `drop()`.
+        """
+        props = self.proportions()
+        values = list(props.columns)
+        report = []
+        for rule in self.rules:
+            op = _get_operator(rule['direction'], rule['thresh'])
+            position = len(values) - 1 if _is_any(rule['value']) \
+                else _index_of(values[:len(self._values)], rule['value'])
+            exceeders = op(props.iloc[:, position].to_numpy(), rule['thresh'])
+            dropped = props.index[exceeders].tolist()
+            report.append({**rule, 'n_dropped': len(dropped), 'dropped': dropped})
+        return pd.DataFrame(
+            report, columns=['value', 'thresh', 'direction', 'axis', 'n_dropped', 'dropped'])
+
+    @property
+    def columns_to_drop(self) -> list:
+        """The columns dropped by any of the rules in the original column order."""
+        dropped = {col for cols in self.report()['dropped'] for col in cols}
+        return [col for col in self.columns if col in dropped]
+
+    def transform(self, chunks: Iterable[pd.DataFrame]) -> Iterator[pd.DataFrame]:
+        """
+        Drop the columns from chunks of the data (e.g., a second pass over the data).
+
+        Parameters
+        ----------
+        chunks : iterable of pd.DataFrames
+            The chunks of the data.
+
+        Yields
+        ------
+        pd.DataFrame
+            The chunks without the dropped columns.
+        """
+        to_drop = self.columns_to_drop
+        for chunk in chunks:
+            yield chunk.drop(columns=to_drop)
+
+    def _init_columns(self, columns: pd.Index) -> None:
+        self.columns = columns
+        if self.include is not None:
+            self._searched = columns[columns.isin(self.include)]
+        elif self.exclude is not None:
+            self._searched = columns[~columns.isin(self.exclude)]
+        else:
+            self._searched = columns
+        self._counts = np.zeros((len(self._searched), len(self._values)), dtype=np.int64)
+        if self._count_any:
+            self._tables = {name: [] for name in self._searched}
+
+    def _check_fitted(self) -> None:
+        if self.columns is None:
+            raise RuntimeError("No chunks have been added. Call `fit()` or `update()` first.")
+
+
+def _with_column_axis(rule: Union[tuple, dict]) -> Union[tuple, dict]:
+    """Add `axis=0` to a column rule."""
+    if isinstance(rule, dict):
+        rule = {'axis': 0, **rule}
+    elif isinstance(rule, (tuple, list)) and len(rule) == 3:
+        rule = (*rule, 0)
+    if (rule['axis'] if isinstance(rule, dict) else rule[-1]) != 0:
+        raise ValueError("ChunkedDropper can only drop columns (axis 0).")
+    return rule
+
+
+def _is_any(value) -> bool:
+    return isinstance(value, str) and value == 'any'
+
+
+def _frequency_table(x: pd.Series) -> pd.Series:
+    """Count each value (including NaN) in a Series. Follows `_count_value()`."""
+    if x.dtype == np.dtype('object'):
+        # Object elements are considered strings
+        x = x.astype(str)
+    return x.value_counts(dropna=False).astype(np.int64)
+
+
+def _add_table(tables: List[pd.Series], table: pd.Series) -> None:
+    """
+    Add a frequency table to a list of frequency tables (in-place).
+
+    The first table holds the summed counts. The other tables are only
+    summed into it once they have as many entries as it has,
+    so each count is only summed a few times on average
+    (instead of aligning the whole summed table for every chunk).
+    """
+    if not len(table):
+        return
+    tables.append(table)
+    if sum(len(t) for t in tables[1:]) >= len(tables[0]):
+        _reduce_tables(tables)
+
+
+def _reduce_tables(tables: List[pd.Series]) -> pd.Series:
+    """
+    Sum frequency tables to a single table with int64 counts.
+    The list is replaced by the sum, so it is only summed once.
+    """
+    if not tables:
+        return pd.Series(dtype=np.int64)
+    if len(tables) == 1:
+        return tables[0]
+    table = pd.concat(tables).groupby(level=0, dropna=False, sort=False).sum()
+    tables[:] = [table.astype(np.int64)]
+    return tables[0]
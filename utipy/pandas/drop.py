@@ -2,12 +2,14 @@
 @author: ludvigolsen
 """
 
-from typing import Callable, Optional, Union, List
+from typing import Callable, Optional, Tuple, Union, List
+import numpy as np
 import pandas as pd
 from numbers import Number
 
 from utipy.utils.messenger import Messenger, check_messenger
-from .makes_up import makes_up
+from .makes_up import makes_up, _get_operator
+from .makes_up_frame import makes_up_frame
 
 
 def drop(
@@ -20,8 +22,9 @@ def drop(
     exclude: Optional[List[str]] = None,
     copy: bool = True,
     messenger: Optional[Callable] = Messenger(
-        verbose=True, indent=0, msg_fn=print)
-) -> pd.DataFrame:
+        verbose=True, indent=0, msg_fn=print),
+    rules: Optional[List[Union[tuple, dict]]] = None
+) -> Union[pd.DataFrame, Tuple[pd.DataFrame, pd.DataFrame]]:
     """
     Drop rows or columns from pandas DataFrame based on values.
 
@@ -63,11 +66,25 @@ def drop(
         When `None`, no printing/logging is performed.
         The messenger determines the messaging function (e.g., `print`)
         and potential indentation.
+    rules : list of tuples / dicts or None
+        Multiple rules to drop by. Each rule is a tuple of
+        `(value, thresh, direction, axis)` or a dict with those keys.
+        When specified, `value`, `thresh`, `direction` and `axis` are ignored.
+        All rules are evaluated on `data` from one shared
+        pass per axis, so a rule does not see the rows / columns dropped
+        by the other rules. `include` and `exclude` apply to all rules.
+        Rows are given by their index labels.
 
 
     Returns
     -------
     pd.DataFrame
+        The data without the dropped rows / columns.
+    pd.DataFrame
+        When `rules` is specified, a report with one row per rule
+        and the columns `value`, `thresh`, `direction`, `axis`,
+        `n_dropped` and `dropped` (the labels of the rows / columns
+        that the rule dropped).
 
 
     Examples
@@ -86,11 +103,23 @@ def drop(
     >>> drop(data, value = 'NaN', axis = 0, thresh = 0.3, 
     ...      direction = '<')
 
+    Remove columns by multiple rules in one pass
+    >>> data, report = drop(data, rules = [
+    ...     ('NaN', 0.5, '>', 0),
+    ...     ('inf', 0, '>', 0),
+    ...     ('any', 1, '==', 0),
+    ...     (0, 0.95, '>', 0)
+    ... ])
+
     """
 
     # Check messenger (always returns Messenger instance)
     messenger = check_messenger(messenger)
 
+    if rules is not None:
+        return _drop_by_rules(data, rules=rules, include=include,
+                              exclude=exclude, messenger=messenger)
+
     if value is None:
         raise ValueError('value cannot be None.')
 
@@ -150,22 +179,33 @@ def drop(
 
 # Wrapper for calling makes_up - for finding columns / rows to drop
 def _find_exceeders(data, value, thresh, direction, axis):
-    """Internal wrapper function for calling makes_up()"""
+    """
+    Internal function for finding the columns / rows where
+    `makes_up()` is `True`.
 
-    # Notice:
-    # pd apply() passes the Series as objects, even
-    # when it's the columns it's working with!
+    The values are counted for all columns / rows at once
+    and compared to the threshold in bulk.
+    """
 
     if axis not in [0, 1]:
         raise ValueError("`axis` must be 0 or 1")
 
-    exceeders = data.apply(
-        makes_up,
-        axis=axis,
-        value=value,
-        thresh=thresh,
-        direction=direction
-    )
+    if data.size == 0:
+        # Nothing to vectorize
+        # Notice:
+        # pd apply() passes the Series as objects, even
+        # when it's the columns it's working with!
+        exceeders = data.apply(
+            makes_up,
+            axis=axis,
+            value=value,
+            thresh=thresh,
+            direction=direction
+        )
+    else:
+        op = _get_operator(direction, thresh)
+        proportions = makes_up_frame(data, value=value, axis=axis)
+        exceeders = op(proportions.to_numpy(), thresh)
 
     if axis == 0:
         # Find columns to drop
@@ -184,3 +224,94 @@ def _find_exceeders(data, value, thresh, direction, axis):
         ]
 
     return to_drop
+
+
+def _drop_by_rules(data, rules, include, exclude, messenger):
+    """Drop rows / columns by multiple rules from one pass per axis."""
+
+    if exclude is not None and include is not None:
+        raise ValueError("Either include or exclude must be None.")
+
+    rules = [_check_rule(rule) for rule in rules]
+
+    # Positions of the columns / rows that may be dropped
+    candidates = {}
+    for axis, labels in [(0, data.columns), (1, data.index)]:
+        if include is not None:
+            candidates[axis] = np.flatnonzero(labels.isin(include))
+        elif exclude is not None:
+            candidates[axis] = np.flatnonzero(~labels.isin(exclude))
+        else:
+            candidates[axis] = np.arange(len(labels))
+
+    # Find the proportions of all values per axis in one pass
+    proportions = {}
+    for axis in [0, 1]:
+        values = _unique_values([rule['value'] for rule in rules if rule['axis'] == axis])
+        if not values:
+            continue
+        if axis == 0:
+            # Only the candidate columns are counted
+            props = makes_up_frame(data.iloc[:, candidates[0]], value=values, axis=0)
+        else:
+            props = makes_up_frame(data, value=values, axis=1).iloc[candidates[1]]
+        proportions[axis] = (values, props.to_numpy())
+
+    # Apply the thresholds
+    to_drop = {0: np.zeros(data.shape[1], dtype=bool),
+               1: np.zeros(data.shape[0], dtype=bool)}
+    report = []
+    for rule in rules:
+        axis = rule['axis']
+        values, props = proportions[axis]
+        op = _get_operator(rule['direction'], rule['thresh'])
+        exceeders = op(props[:, _index_of(values, rule['value'])], rule['thresh'])
+        positions = candidates[axis][exceeders]
+        to_drop[axis][positions] = True
+        labels = data.columns if axis == 0 else data.index
+        report.append({**rule, 'n_dropped': len(positions),
+                       'dropped': labels[positions].tolist()})
+
+    messenger(f'Dropped {to_drop[0].sum()} columns and {to_drop[1].sum()} rows.')
+
+    report = pd.DataFrame(
+        report, columns=['value', 'thresh', 'direction', 'axis', 'n_dropped', 'dropped'])
+    return data.iloc[~to_drop[1], ~to_drop[0]], report
+
+
+def _check_rule(rule):
+    """Check a rule and convert it to a dict."""
+    keys = ['value', 'thresh', 'direction', 'axis']
+    if isinstance(rule, dict):
+        if set(rule) != set(keys):
+            raise ValueError(f"A rule dict must have the keys: {keys}. Got: {list(rule)}")
+    elif isinstance(rule, (tuple, list)) and len(rule) == 4:
+        rule = dict(zip(keys, rule))
+    else:
+        raise ValueError(
+            "Each rule must be a tuple of (value, thresh, direction, axis) "
+            f"or a dict with those keys. Got: {rule}")
+
+    if rule['value'] is None:
+        raise ValueError('value cannot be None.')
+    if rule['axis'] not in [0, 1]:
+        raise ValueError("`axis` must be 0 or 1")
+    _get_operator(rule['direction'], rule['thresh'])
+    return {key: rule[key] for key in keys}
+
+
+def _unique_values(values):
+    """Remove duplicate values (by type and value) while keeping the order."""
+    unique = []
+    for value in values:
+        if _index_of(unique, value) is None:
+            unique.append(value)
+    return unique
+
+
+def _index_of(values, value):
+    """Find a value by type and value (e.g., `1` and `True` are different)."""
+    for i, v in enumerate(values):
+        if type(v) is type(value) and (v is value or v == value):
+            return i
+    return None
@@ -5,7 +5,7 @@
 """
 
 # Import operator module for dynamically passing operators
-from typing import Union, cast
+from typing import Callable, List, Optional, Union, cast
 from numbers import Number
 import pandas as pd
 import operator
@@ -86,57 +86,73 @@ def makes_up(
 
     """
 
+    # Check direction and thresh and get the comparison operator
+    op = _get_operator(direction, thresh)
+
+    # Check if x is a pd.Series
+    # and convert if necessary
+    x = cast(pd.Series, convert_to_type(x, 'pd.Series'))
+
+    # Count the appearances of value
+    n_value = _count_value(x, value=value, missing_error=missing_error)
+
+    # Get total number of values in col
+    total_values = len(x)
+
+    # Check with the given direction (operator) if n_value
+    # exceeds the threshold
+    return op((n_value / float(total_values)), thresh)
+
+
+def _get_operator(direction: str, thresh: float) -> Callable:
+    """Check `direction` and `thresh` and get the comparison operator."""
+
     # Make sure directioon is given as '>', '<', '<=', '>=', or '=='
     if not direction in ['>', '<', '<=', '>=', '==']:
         raise ValueError(
             '`direction` can only be given as \'>\',\'<\',\'>=\',\'<=\', or \'==\'.')
 
-    # Create dictionary for calling operator
-    # Uses module: operator
-    ops = {'>': operator.gt,
-           '<': operator.lt,
-           '>=': operator.ge,
-           '<=': operator.le,
-           '==': operator.eq}
-
     # Make sure thresh is given as a number between 0 and 1
     if not (thresh >= 0 and thresh <= 1):
         raise ValueError(
             '`thresh` had an incorrect format. '
             'Pass as a percentage (between 0-1).')
 
-    # Check if x is a pd.Series
-    # and convert if necessary
-    x = cast(pd.Series, convert_to_type(x, 'pd.Series'))
+    return _OPERATORS[direction]
 
-    # If it is an object, we can only recognize NaN and inf as strings
-    # and fall back to checking it as a string
-    if x.dtype in [np.dtype('object')] and value in ['NaN', 'inf', 'any']:
-        # When converted to string,
-        # np.nan becomes 'nan'
-        if value == 'NaN':
-            value = 'nan'
 
-        # Make sure that object elements are considered strings
-        x = x.apply(str)
+def _count_value(
+    x: pd.Series,
+    value: Union[str, Number],
+    missing_error: bool = False
+):
+    """Count the appearances of `value` (or the most common value) in a Series."""
+
+    # Categories are counted from their codes
+    if isinstance(x.dtype, pd.CategoricalDtype) and value != 'inf':
+        n_value = _count_value_categorical(x, value)
+
+        # If asked to raise error if value is not found
+        if n_value == 0 and value not in ['NaN', 'any'] and missing_error \
+                and value not in set(x):
+            raise ValueError('value not found in `x`')
 
+    # If it is an object, we can only recognize NaN and inf as strings
+    # and fall back to checking it as a string
+    elif x.dtype in [np.dtype('object')] and value in ['NaN', 'inf', 'any']:
         # First check if value is 'any'
         if value == 'any':
-            n_value = x.value_counts(dropna=False).max()
-
-        # First we check if value is in x at all
-        elif not (value in set(x)):
-            # If asked to raise error if value is not found
-            # raise error
-            if missing_error:
-                raise ValueError('`value` not found in `x`')
-            # Else, it was found 0 times in series
-            else:
-                n_value = 0
+            # Make sure that object elements are considered strings
+            n_value = x.astype(str).value_counts(dropna=False).max()
         else:
-            # If it IS in `x``,
-            # count how many times
-            n_value = x.value_counts(dropna=False)[value]
+            # When converted to string,
+            # np.nan becomes 'nan'
+            n_value = np.count_nonzero(_matches_as_string(
+                x.to_numpy(), 'nan' if value == 'NaN' else value))
+
+        # If asked to raise error if value is not found
+        if n_value == 0 and value != 'any' and missing_error:
+            raise ValueError('`value` not found in `x`')
 
     elif value == 'NaN':
         n_value = x.isnull().sum()
@@ -157,22 +173,224 @@ def makes_up(
         if np.isnan(n_value):
             n_value = x.isnull().sum()
 
-    # Check if value is not in `x`
-    elif value not in set(x):
+    else:
+        # Get how many times value is in col
+        # (by equality, as `value_counts()[value]` could
+        # use numbers as positions)
+        n_value = (x == value).sum()
+
         # If asked to raise error if value is not found
-        if missing_error:
+        if n_value == 0 and missing_error and value not in set(x):
             raise ValueError('value not found in `x`')
-        # Else, it was found 0 times in series
-        else:
-            n_value = 0
-    # If value in `x``
+
+    return n_value
+
+
+
+def _count_value_categorical(x: pd.Series, value: Union[str, Number]):
+    """Count `value` (or the most common value) in a categorical Series from its codes."""
+    codes = x.cat.codes.to_numpy()
+    n_missing = np.count_nonzero(codes == -1)
+    if value == 'NaN':
+        return n_missing
+    category_counts = np.bincount(codes[codes >= 0], minlength=len(x.cat.categories))
+    if value == 'any':
+        return max(category_counts.max(initial=0), n_missing)
+    # Same matching of categories as `x == value`
+    if value not in x.cat.categories:
+        return 0
+    return category_counts[x.cat.categories.get_loc(value)]
+
+
+def _matches_as_string(x: np.ndarray, value: str) -> np.ndarray:
+    """
+    Find the elements of an object array that are `value` ('nan' or 'inf')
+    when converted to strings, without converting all elements.
+
+    Only strings equal to `value` and the missing values (for `'nan'`)
+    or the values equal to infinity (for `'inf'`) can be `value` as strings,
+    so only those are checked. Floats are matched by type and
+    other candidates are converted to strings.
+    """
+    is_missing = pd.isna(x)
+    present = ~is_missing
+    matches = np.zeros(x.shape, dtype=bool)
+    matches[present] = x[present] == value
+
+    # Candidates that may be `value` as strings (e.g., float NaNs and infs)
+    if value == 'nan':
+        candidates = is_missing
     else:
-        # Get how many times value is in col
-        n_value = x.value_counts()[value]
+        candidates = np.zeros(x.shape, dtype=bool)
+        candidates[present] = x[present] == np.inf
+    candidate_values = x[candidates]
+    type_codes, types = pd.factorize(_get_type(candidate_values))
+    candidate_matches = np.zeros(candidate_values.shape, dtype=bool)
+    for code, type_ in enumerate(types):
+        is_type = type_codes == code
+        if issubclass(type_, (float, np.floating)):
+            # Float NaN is 'nan' and infinity is 'inf'
+            candidate_matches[is_type] = True
+        elif type_ not in _NEVER_NAN_OR_INF_STRINGS:
+            candidate_matches[is_type] = candidate_values[is_type].astype(str) == value
+    matches[candidates] |= candidate_matches
+    return matches
 
-    # Get total number of values in col
-    total_values = len(x)
 
-    # Check with the given direction (operator) if n_value
-    # exceeds the threshold
-    return ops[direction]((n_value / float(total_values)), thresh)
+def _count_value_frame(
+    data: pd.DataFrame,
+    values: List[Union[str, Number]],
+    axis: int
+) -> np.ndarray:
+    """
+    Count the appearances of each value (or the most common value)
+    in all columns (`axis=0`) or rows (`axis=1`) of a data frame.
+
+    Gives the same counts as calling `_count_value()` on each column / row
+    (e.g., with `data.apply()`) but counts blocks of columns with the same
+    dtype in vectorized passes. Columns / rows with dtypes that are not
+    supported by the vectorized counting are counted with `_count_value()`.
+
+    Returns the counts with shape `(n columns / rows, len(values))`.
+    """
+    if axis == 0:
+        counts = np.zeros((data.shape[1], len(values)), dtype=np.int64)
+        positions_by_dtype = {}
+        for pos, dtype in enumerate(data.dtypes):
+            positions_by_dtype.setdefault(dtype, []).append(pos)
+        for dtype, positions in positions_by_dtype.items():
+            if _is_vectorizable(dtype):
+                # Columns are the rows of the transposed block
+                block = data.iloc[:, positions].to_numpy(dtype=dtype)
+                counts[positions] = _count_value_rows(block.T, values=values)
+            else:
+                counts[positions] = [
+                    _count_value_series(data.iloc[:, pos], values=values)
+                    for pos in positions
+                ]
+        return counts
+
+    # Rows get the common dtype of the columns as with `data.apply()`
+    # Extension dtypes can give other row dtypes, so they are not vectorized
+    if all(isinstance(dtype, np.dtype) for dtype in data.dtypes):
+        row_values = data.to_numpy()
+        if _is_vectorizable(row_values.dtype):
+            return _count_value_rows(row_values, values=values)
+    row_counts = data.apply(
+        _count_value_series, axis=1, values=values, result_type='reduce')
+    return np.array(row_counts.tolist(), dtype=np.int64).reshape(len(data), len(values))
+
+
+def _count_value_series(x: pd.Series, values: List[Union[str, Number]]) -> List[int]:
+    """Count each value in a Series with `_count_value()`."""
+    return [_count_value(x, value=value) for value in values]
+
+
+def _is_vectorizable(dtype) -> bool:
+    """Check whether a dtype is supported by `_count_value_rows()`."""
+    return isinstance(dtype, np.dtype) and dtype.kind in "biufO"
+
+
+def _count_value_rows(
+    x: np.ndarray,
+    values: List[Union[str, Number]],
+    chunk_size: Optional[int] = None
+) -> np.ndarray:
+    """
+    Count the appearances of each value (or the most common value)
+    in each row of a 2D array. Follows `_count_value()`.
+
+    Rows are counted in chunks of about a million elements.
+    """
+    if chunk_size is None:
+        chunk_size = max(_CHUNK_ELEMENTS // max(x.shape[1], 1), 1)
+    return np.concatenate(
+        [_count_value_chunk(x[start:start + chunk_size], values=values)
+         for start in range(0, len(x), chunk_size)]
+        + [np.zeros((0, len(values)), dtype=np.int64)]
+    )
+
+
+def _count_value_chunk(
+    x: np.ndarray,
+    values: List[Union[str, Number]]
+) -> np.ndarray:
+    """
+    Count the appearances of each value in each row of a 2D array.
+
+    The string version of object arrays (see `_count_value()`)
+    is only created once for all the values and only for `'any'`.
+    """
+    counts = np.zeros((len(x), len(values)), dtype=np.int64)
+    strings = None
+    for i, value in enumerate(values):
+        # Objects are checked as strings
+        if x.dtype.kind == 'O' and value in ['NaN', 'inf', 'any']:
+            if value == 'any':
+                if strings is None:
+                    strings = x.astype(str)
+                counts[:, i] = _mode_counts(strings)
+            else:
+                counts[:, i] = np.count_nonzero(_matches_as_string(
+                    x, 'nan' if value == 'NaN' else value), axis=1)
+
+        elif value == 'NaN':
+            counts[:, i] = np.count_nonzero(pd.isna(x), axis=1)
+
+        elif value == 'inf':
+            try:
+                counts[:, i] = np.count_nonzero(np.isinf(x), axis=1)
+            except TypeError:
+                raise ValueError(
+                    "`value` ('inf') could not be searched for in `x`.")
+
+        elif value == 'any':
+            counts[:, i] = _mode_counts(x)
+
+        # Only numbers can be in numeric arrays
+        elif x.dtype.kind == 'O' or isinstance(value, (Number, np.number, np.bool_)):
+            counts[:, i] = np.count_nonzero(x == value, axis=1)
+
+    return counts
+
+
+def _mode_counts(x: np.ndarray) -> np.ndarray:
+    """
+    Count the most common value in each row of a 2D array
+    by sorting the rows and finding the longest run of equal values.
+    NaNs are counted as one value.
+    """
+    if x.shape[1] == 0:
+        return np.zeros(len(x), dtype=np.int64)
+
+    x = np.sort(x, axis=1)
+    same = x[:, 1:] == x[:, :-1]
+    if x.dtype.kind == 'f':
+        is_nan = np.isnan(x)
+        same |= is_nan[:, 1:] & is_nan[:, :-1]
+
+    # Position of the start of the run each element is in
+    positions = np.arange(x.shape[1])
+    is_start = np.ones(x.shape, dtype=bool)
+    is_start[:, 1:] = ~same
+    run_starts = np.maximum.accumulate(np.where(is_start, positions, 0), axis=1)
+    return (positions - run_starts + 1).max(axis=1).astype(np.int64, copy=False)
+
+
+# Comparison operators by direction
+# Uses module: operator
+_OPERATORS = {'>': operator.gt,
+              '<': operator.lt,
+              '>=': operator.ge,
+              '<=': operator.le,
+              '==': operator.eq}
+
+# Number of elements to count at a time in `_count_value_rows()`
+_CHUNK_ELEMENTS = 2**20
+
+# Get the type of each element in an object array
+_get_type = np.frompyfunc(type, 1, 1)
+
+# Types of missing values that are never 'nan' or 'inf' as strings
+_NEVER_NAN_OR_INF_STRINGS = {
+    type(None), type(pd.NaT), type(pd.NA), np.datetime64, np.timedelta64}
@@ -0,0 +1,83 @@
+"""
+@author: ludvigolsen
+"""
+
+from typing import List, Union
+from numbers import Number
+import pandas as pd
+import numpy as np
+from .makes_up import _count_value_frame
+
+
+def makes_up_frame(
+    data: pd.DataFrame,
+    value: Union[str, Number, List[Union[str, Number]]] = 'NaN',
+    axis: int = 0
+) -> Union[pd.Series, pd.DataFrame]:
+    """
+    Get the percent-wise appearance of a specific value (or any value)
+    in every column or row of a data frame.
+
+    Gives the proportions that `makes_up()` compares to its threshold,
+    for all columns / rows at once. Columns with the same dtype
+    are counted together in vectorized passes.
+
+    Asks:
+        'How much of each [axis] does [value] make up?'
+    E.g.:
+        'How much of each column is 0?'
+
+
+    Parameters
+    ----------
+    data : pd.DataFrame
+        The data to check.
+    value : str / int / float or list of these
+        The value(s) to match.
+            Regular value,
+            'any',
+            'NaN',
+            'inf'
+        When a list is passed, the proportions of all values
+        are found while preparing each block of columns only once
+        (e.g., object columns are only converted to strings once).
+    axis : int
+        0 for columns, 1 for rows.
+
+
+    Returns
+    -------
+    pd.Series or pd.DataFrame
+        Proportion (between 0-1) of each column / row that is `value`.
+        Indexed by the column names (`axis=0`) or the index (`axis=1`).
+        When `value` is a list, a data frame with a column per value.
+
+
+    Examples
+    --------
+
+    Proportion of NaNs in each column
+    >>> makes_up_frame(data, value = 'NaN')
+
+    Threshold without recounting
+    >>> props = makes_up_frame(data, value = ['NaN', 0], axis = 0)
+    >>> props[props['NaN'] > 0.3].index
+
+    """
+    if axis not in [0, 1]:
+        raise ValueError("`axis` must be 0 or 1")
+
+    values = value if isinstance(value, list) else [value]
+    if any(v is None for v in values):
+        raise ValueError('value cannot be None.')
+
+    counts = _count_value_frame(data, values=values, axis=axis)
+
+    # Total number of values per column / row
+    with np.errstate(invalid='ignore', divide='ignore'):
+        proportions = counts / float(data.shape[axis])
+
+    labels = data.columns if axis == 0 else data.index
+    if isinstance(value, list):
+        return pd.DataFrame(proportions, index=labels, columns=values)
+    return pd.Series(proportions[:, 0], index=labels, name=value)